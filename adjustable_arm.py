@@ -30,405 +30,761 @@ photography equipment in place, smaller units can be found sold as indicator
 holder for machinists.
 """
 
+
+import ast
+import functools
+import inspect
 import math
+import textwrap
 import cadquery as cq
-
-# The ball for the ball-and-socket joint at the effector end
-
-ball_diameter = 20
-fastener_diameter = 6.5
-fastener_diameter_tight = 6
-fastener_thread_pitch = 1.2
-fastener_hex_thickness = 5.7
-fastener_hex_width = 11.25
-nozzle_diameter = 0.4
-minimum_gap = 0.2
-cutoff_z = -ball_diameter*math.sin(math.radians(45))/2
-wedge_range_horizontal = 2
+import dependency_graph
+import display
+import fidelity
+import part_cache
+
+# Every dimension the arm is built from. Call build_arm() with a dictionary
+# overriding any of these to generate a variant, everything else is derived.
+default_parameters = {
+    # The ball for the ball-and-socket joint at the effector end
+    "ball_diameter": 20,
+    "fastener_diameter": 6.5,
+    "fastener_diameter_tight": 6,
+    "fastener_thread_pitch": 1.2,
+    "fastener_hex_thickness": 5.7,
+    "fastener_hex_width": 11.25,
+    "nozzle_diameter": 0.4,
+    "minimum_gap": 0.2,
+    "wedge_range_horizontal": 2,
+
+    # Socket surrounding the ball
+    "ball_surround_thickness": 5,
+
+    # Arm connecting the ball joint to the mid joint
+    "arm_length": 200,
+    "arm_side_outer": 17,
+
+    # Pressure wedge mechanism in the mid joint
+    "wedge_fastener_diameter": 6.5,
+    "wedge_angle": 25,
+
+    # Ties reinforcing the section between end ball and mid joint
+    "tie_width": 6,
+    "tie_height": 1.8,
+    "tie_gap": 0.4, # Must be at least 1 layer height
+
+    # Knob
+    "knob_wing_radius": 35,
+    "knob_wing_thickness": 30,
+    "knob_bottom": 1.8,
+    }
 
 reposition_for_printing = False
 
-end_ball = (
-    cq.Workplane("XY")
-    .sphere(ball_diameter/2)
-    )
-
-# This is the visible opening, diameter for a loose fastener fit so it can
-# be installed easily.
-end_ball_fastener_shaft = (
-    cq.Workplane("XY")
-    .circle(fastener_diameter/2)
-    .extrude(-ball_diameter)
-    )
-
-# In the middle of the ball is space for a hex nut that can be dropped in
-# during printing.
-end_ball_fastener_nut = (
-    cq.Workplane("XY")
-    .polygon(6, fastener_hex_width, circumscribed = True)
-    .extrude(fastener_hex_thickness/2, both=True)
-    )
-
-# Beyond the nut is a somewhat cone/pagoda shaped cavity that will neck down
-# to a very tight fit around the fastener. The fastener will likely cut some
-# thread into this plastic but the tread isn't the point, the point is friction
-# so the fastener doesn't back out too easily. This is similar in concept to
-# nuts with a plastic insert, except here our metal nut is to be added during
-# printing and this is the "plastic insert"
-end_ball_cone = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, 0, fastener_hex_thickness / 2))
-    .polygon(6, fastener_hex_width, circumscribed = True)
-    .workplane(offset = (fastener_hex_width - fastener_diameter_tight) / 4)
-    .circle(fastener_diameter_tight/2)
-    .loft()
-    .faces(">Z").workplane()
-    .circle(fastener_diameter_tight/2)
-    .extrude(fastener_thread_pitch*2)
-    .faces(">Z").workplane()
-    .circle(fastener_diameter_tight/2)
-    .workplane(offset=fastener_diameter_tight/4)
-    .circle(minimum_gap)
-    .loft()
-    )
-
-end_ball_assembly = (
-    end_ball
-    - end_ball_fastener_shaft
-    - end_ball_fastener_nut
-    - end_ball_cone
-    )
+# Values derived from the parameters. Each function's arguments name the
+# values it is computed from, which makes the dependencies explicit for
+# arm_graph().
+derived_values = {}
+
+def derived(function):
+    derived_values[function.__name__] = function
+    return function
+
+@derived
+def cutoff_z(ball_diameter):
+    return -ball_diameter*math.sin(math.radians(45))/2
+
+@derived
+def ball_surround_outer_radius(ball_surround_thickness, ball_diameter):
+    return ball_surround_thickness + ball_diameter/2
+
+@derived
+def rod_side(arm_side_outer, ball_surround_thickness):
+    return arm_side_outer - ball_surround_thickness
+
+@derived
+def arm_side_inner(rod_side, minimum_gap):
+    return rod_side + minimum_gap * 4
+
+@derived
+def mid_joint_radius(ball_surround_outer_radius, nozzle_diameter):
+    return ball_surround_outer_radius + nozzle_diameter * 2
+
+@derived
+def wedge_range_vertical(wedge_range_horizontal, wedge_angle):
+    return wedge_range_horizontal * math.tan(math.radians(wedge_angle))
+
+@derived
+def wedge_diameter(ball_surround_outer_radius, wedge_range_horizontal, nozzle_diameter):
+    return (ball_surround_outer_radius - wedge_range_horizontal - nozzle_diameter * 4 )*2
+
+@derived
+def mid_joint_clearance_size(wedge_diameter, minimum_gap):
+    return wedge_diameter + (minimum_gap * 4 / math.sin(math.radians(45)))
+
+@derived
+def tie_length(rod_side):
+    return rod_side * math.sin(math.radians(45))
+
+@derived
+def tie_start(ball_surround_outer_radius, tie_width):
+    return ball_surround_outer_radius - tie_width/2
+
+@derived
+def tie_span(arm_length, ball_surround_outer_radius, mid_joint_radius, tie_width):
+    return arm_length - ball_surround_outer_radius - mid_joint_radius - tie_width/2
+
+@derived
+def tie_positions(tie_start, tie_span):
+    # Calculate how many ties will be added. There should always be at least two,
+    # one at each end. If the beam is long enough, additional ties are added in
+    # between.
+    extra_ties_count = math.floor(tie_span/40)
+    tie_spacing = tie_span
+    if extra_ties_count > 0:
+        tie_spacing = tie_span / (extra_ties_count+1)
+    return tuple(tie_start + tie_spacing*t for t in range(2 + extra_ties_count))
+
+@derived
+def wedge_hex_z(fastener_hex_width, wedge_angle):
+    return (
+        # Minimum Z
+        fastener_hex_width * math.tan(math.radians(wedge_angle)) / 2
+        # Plus a nonzero big of plastic to support the hex bolt at minimum point
+        + 1.2
+        )
+
+@derived
+def mid_joint_trim_radius(mid_joint_radius, nozzle_diameter):
+    return mid_joint_radius - nozzle_diameter*2
+
+@derived
+def wedge_block_z(wedge_range_vertical, wedge_diameter, wedge_angle):
+    return wedge_range_vertical + wedge_diameter * math.tan(math.radians(wedge_angle)) / 2
+
+@derived
+def knob_base_taper_height(wedge_block_z, ball_surround_outer_radius, wedge_diameter):
+    return wedge_block_z + ball_surround_outer_radius - wedge_diameter/2
+
+@derived
+def knob_base_vertical_height(ball_surround_outer_radius, wedge_range_vertical):
+    return ball_surround_outer_radius + wedge_range_vertical*3
+
+@derived
+def knob_base_radius(mid_joint_trim_radius, minimum_gap):
+    return mid_joint_trim_radius - minimum_gap
+
+@derived
+def knob_wing_height(ball_surround_outer_radius, knob_wing_radius):
+    return ball_surround_outer_radius + (knob_wing_radius - ball_surround_outer_radius)
+
+# Parameters with overrides applied. preview follows the global fidelity
+# switch unless given, it is a value like any other so parts skipping
+# cosmetic steps are cached separately.
+def checked_parameters(params = None):
+    unknown = set(params or {}) - set(default_parameters) - {"preview"}
+    if unknown:
+        raise ValueError("Unknown arm parameters: {}".format(", ".join(sorted(unknown))))
+    return dict(default_parameters, preview = fidelity.preview, **(params or {}))
+
+# Every parameter and derived value for the given overrides
+def arm_values(params = None):
+    graph = arm_graph(params)
+    return {name: graph[name] for name in list(graph.inputs) + list(derived_values)}
+
+# Copies of a part at each position gathered into one compound, so all of them
+# are applied with a single boolean operation instead of one per copy.
+def _instances(part, positions):
+    shape = part.val()
+    return cq.Compound.makeCompound([
+        shape.moved(cq.Location(cq.Vector(*position))) for position in positions])
+
+# Split a part along the plane through origin with the given normal, returning
+# the (below, above) halves from a single splitter operation. Cheaper than
+# cutting with an oversized box, and the plane needs no size of its own.
+def split_halves(part, origin, normal):
+    shape = part.val()
+    origin = cq.Vector(*origin)
+    normal = cq.Vector(*normal).normalized()
+    bounds = shape.BoundingBox()
+    size = 2 * (bounds.DiagonalLength + (bounds.center - origin).Length)
+    halves = ([], [])
+    for solid in shape.split(cq.Face.makePlane(size, size, origin, normal)).Solids():
+        halves[(solid.Center() - origin).dot(normal) > 0].append(solid.clean())
+    return tuple(
+        cq.Workplane("XY").newObject(
+            [solids[0] if len(solids) == 1 else cq.Compound.makeCompound(solids)])
+        for solids in halves)
+
+# Call a part function with the subset of values it is declared to depend on.
+# Each part function is memoized on exactly those arguments, so changing a
+# value only rebuilds the parts that name it.
+def part_arguments(part, values):
+    return {name: values[name] for name in inspect.signature(part).parameters}
+
+def call_part(part, values):
+    return part(**part_arguments(part, values))
+
+memoized = []
+
+def memoize(function):
+    memoized.append(functools.lru_cache(maxsize=None)(function))
+    return memoized[-1]
+
+# Forget every memoized part, so the next build starts from scratch
+def clear_memo():
+    for function in memoized:
+        function.cache_clear()
+
+@memoize
+@part_cache.persistent
+def end_ball_assembly(
+        ball_diameter,
+        fastener_diameter,
+        fastener_diameter_tight,
+        fastener_thread_pitch,
+        fastener_hex_thickness,
+        fastener_hex_width,
+        minimum_gap):
+    end_ball = (
+        cq.Workplane("XY")
+        .sphere(ball_diameter/2)
+        )
+
+    # This is the visible opening, diameter for a loose fastener fit so it can
+    # be installed easily.
+    end_ball_fastener_shaft = (
+        cq.Workplane("XY")
+        .circle(fastener_diameter/2)
+        .extrude(-ball_diameter)
+        )
+
+    # In the middle of the ball is space for a hex nut that can be dropped in
+    # during printing.
+    end_ball_fastener_nut = (
+        cq.Workplane("XY")
+        .polygon(6, fastener_hex_width, circumscribed = True)
+        .extrude(fastener_hex_thickness/2, both=True)
+        )
+
+    # Beyond the nut is a somewhat cone/pagoda shaped cavity that will neck down
+    # to a very tight fit around the fastener. The fastener will likely cut some
+    # thread into this plastic but the tread isn't the point, the point is friction
+    # so the fastener doesn't back out too easily. This is similar in concept to
+    # nuts with a plastic insert, except here our metal nut is to be added during
+    # printing and this is the "plastic insert"
+    end_ball_cone = (
+        cq.Workplane("XY")
+        .transformed(offset=cq.Vector(0, 0, fastener_hex_thickness / 2))
+        .polygon(6, fastener_hex_width, circumscribed = True)
+        .workplane(offset = (fastener_hex_width - fastener_diameter_tight) / 4)
+        .circle(fastener_diameter_tight/2)
+        .loft()
+        .faces(">Z").workplane()
+        .circle(fastener_diameter_tight/2)
+        .extrude(fastener_thread_pitch*2)
+        .faces(">Z").workplane()
+        .circle(fastener_diameter_tight/2)
+        .workplane(offset=fastener_diameter_tight/4)
+        .circle(minimum_gap)
+        .loft()
+        )
+
+    return (
+        end_ball
+        - end_ball_fastener_shaft
+        - end_ball_fastener_nut
+        - end_ball_cone
+        )
 
 # Create the socket surrounind the ball
-ball_surround_thickness = 5
-ball_surround_inner_radius = minimum_gap + ball_diameter/2
-ball_surround_outer_radius = ball_surround_thickness + ball_diameter/2
-ball_surround_inner_45 = ball_surround_inner_radius/math.sqrt(2)
-ball_surround_outer_45 = ball_surround_outer_radius/math.sqrt(2)
-
-ball_surround_outer = (
-    cq.Workplane("YZ")
-    .sphere(ball_surround_thickness + ball_diameter/2)
-    )
-
-# Cut a cone so the end lug can swivel around freely in a 90 degree cone
-lug_clearance = (
-    cq.Workplane("YZ")
-    .lineTo(fastener_diameter/2, 0)
-    .lineTo(-ball_diameter, ball_diameter + fastener_diameter/2)
-    .lineTo(-ball_diameter, 0)
-    .close()
-    .revolve(360, (0,0,0), (1,0,0))
-    )
-ball_surround_outer = ball_surround_outer - lug_clearance
-
-# Build the arm connecting to the ball joint
-arm_length = 200
-arm_side_outer = 17
-rod_side = arm_side_outer - ball_surround_thickness
-arm_side_inner = rod_side + minimum_gap * 4
+@memoize
+def ball_surround_outer(ball_surround_outer_radius, ball_diameter, fastener_diameter):
+    surround = (
+        cq.Workplane("YZ")
+        .sphere(ball_surround_outer_radius)
+        )
+
+    # Cut a cone so the end lug can swivel around freely in a 90 degree cone
+    lug_clearance = (
+        cq.Workplane("YZ")
+        .lineTo(fastener_diameter/2, 0)
+        .lineTo(-ball_diameter, ball_diameter + fastener_diameter/2)
+        .lineTo(-ball_diameter, 0)
+        .close()
+        .revolve(360, (0,0,0), (1,0,0))
+        )
+    return surround - lug_clearance
 
 # Outer shell will link the ball-and-socket to center (mid) joint
-arm_outer_shell = (
-    cq.Workplane("XZ")
-    .transformed(rotate=cq.Vector(0,0,45))
-    .rect(arm_side_outer, arm_side_outer)
-    .extrude(-arm_length)
-    .edges("|Y")
-    .fillet(ball_surround_thickness/2)
-    )
+@memoize
+def arm_outer_shell(arm_length, arm_side_outer, ball_surround_thickness):
+    return (
+        cq.Workplane("XZ")
+        .transformed(rotate=cq.Vector(0,0,45))
+        .rect(arm_side_outer, arm_side_outer)
+        .extrude(-arm_length)
+        .edges("|Y")
+        .fillet(ball_surround_thickness/2)
+        )
 
 # Channel inside for rod that transmits pushing force from mid joint to
 # ball in socket
-actuating_rod_channel = (
-    cq.Workplane("XZ")
-    .transformed(rotate=cq.Vector(0,0,45))
-    .rect(arm_side_inner, arm_side_inner)
-    .extrude(-arm_length-minimum_gap*2)
-    )
-
-# Rod that transmits pushing force from mid joint to ball in socket
-actuating_rod = (
-    cq.Workplane("XZ")
-    .transformed(rotate=cq.Vector(0,0,45))
-    .transformed(offset=cq.Vector(0, 0, -wedge_range_horizontal))
-    .rect(rod_side, rod_side)
-    .extrude(wedge_range_horizontal - arm_length)
-    .edges("|Y")
-    )
+@memoize
+def actuating_rod_channel(arm_length, arm_side_inner, minimum_gap):
+    return (
+        cq.Workplane("XZ")
+        .transformed(rotate=cq.Vector(0,0,45))
+        .rect(arm_side_inner, arm_side_inner)
+        .extrude(-arm_length-minimum_gap*2)
+        )
 
 # The actual "socket" part of ball and socket
-arm_end_ball_cavity = (
-    cq.Workplane("YZ")
-    .sphere(minimum_gap + ball_diameter/2)
-    )
+@memoize
+def arm_end_ball_cavity(ball_diameter, minimum_gap):
+    return (
+        cq.Workplane("YZ")
+        .sphere(minimum_gap + ball_diameter/2)
+        )
+
+# Everything around the mid joint is built centered on the origin and moved
+# out to arm_length afterwards, so it is shared between arms of any length.
 
 # Mid joint structure
-mid_joint_radius = ball_surround_outer_radius + nozzle_diameter * 2
-mid_joint = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, 0))
-    .circle(mid_joint_radius)
-    .extrude(ball_surround_outer_radius, both = True)
-    )
-
-wedge_fastener_diameter = 6.5
-wedge_angle = 25
-wedge_range_vertical = wedge_range_horizontal * math.tan(math.radians(wedge_angle))
-
-# This block is used to split the upper from lower parts of the pressure wedge
-# mechanism. I think its purpose can be replaced with a workplane split()
-# command but I don't understand split() yet and I can't predict its behavior.
-wedge_block_upper_slice = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, 0))
-    .transformed(rotate=cq.Vector(-wedge_angle,0,0))
-    .rect(ball_surround_outer_radius * 4,
-          ball_surround_outer_radius * 4)
-    .extrude(ball_surround_outer_radius * 4)
-    )
+@memoize
+def mid_joint(mid_joint_radius, ball_surround_outer_radius):
+    return (
+        cq.Workplane("XY")
+        .circle(mid_joint_radius)
+        .extrude(ball_surround_outer_radius, both = True)
+        )
 
 # The wedge block is the starting point for tailoring the pressure wedge
-wedge_diameter = (ball_surround_outer_radius - wedge_range_horizontal - nozzle_diameter * 4 )*2
-wedge_block_mid = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, 0))
-    .circle(wedge_diameter/2)
-    .extrude(ball_surround_outer_radius, both=True)
-    )
-
-# TODO: Combine shapes into a single 2D wire that is extruded, instead of
-# combining via three extrusions.
-wedge_block_lower_fastener_slot = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, 0))
-    .circle(wedge_fastener_diameter/2)
-    .extrude(ball_surround_outer_radius, both = True)
-    ) + (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length + wedge_range_horizontal, 0))
-    .circle(wedge_fastener_diameter/2)
-    .extrude(ball_surround_outer_radius, both = True)
-    ) + (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length + wedge_range_horizontal/2, 0))
-    .rect(wedge_fastener_diameter, wedge_range_horizontal)
-    .extrude(ball_surround_outer_radius, both = True)
-    )
-
-mid_joint_clearance_size = wedge_diameter + (minimum_gap * 4 / math.sin(math.radians(45)))
-mid_joint_clearance = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, 0))
-    .circle(mid_joint_clearance_size/2)
-    .extrude(ball_surround_outer_radius, both = True)
-    ) + (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length - wedge_range_horizontal/2, 0))
-    .rect(mid_joint_clearance_size, wedge_range_horizontal)
-    .extrude(ball_surround_outer_radius, both = True)
-    ) + (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length - wedge_range_horizontal, 0))
-    .circle(mid_joint_clearance_size/2)
-    .extrude(ball_surround_outer_radius, both = True)
-    )
+@memoize
+def wedge_block_mid(wedge_diameter, ball_surround_outer_radius):
+    return (
+        cq.Workplane("XY")
+        .circle(wedge_diameter/2)
+        .extrude(ball_surround_outer_radius, both=True)
+        )
+
+# The wedge block split along the wedge angle into its lower half, which stays
+# on the actuating rod, and its upper half, which becomes the pressure wedge.
+@memoize
+def wedge_block_halves(wedge_diameter, wedge_angle, ball_surround_outer_radius):
+    values = locals()
+    angle = math.radians(wedge_angle)
+    return split_halves(
+        call_part(wedge_block_mid, values),
+        (0, 0, 0),
+        (0, math.sin(angle), math.cos(angle)))
+
+# Each slot is a single 2D outline extruded once, instead of two cylinders and
+# a box combined with unions.
+@memoize
+def wedge_block_lower_fastener_slot(wedge_fastener_diameter, wedge_range_horizontal, ball_surround_outer_radius):
+    return (
+        cq.Workplane("XY")
+        .center(0, wedge_range_horizontal/2)
+        .slot2D(wedge_range_horizontal + wedge_fastener_diameter, wedge_fastener_diameter, 90)
+        .extrude(ball_surround_outer_radius, both = True)
+        )
+
+@memoize
+def mid_joint_clearance(mid_joint_clearance_size, wedge_range_horizontal, ball_surround_outer_radius):
+    return (
+        cq.Workplane("XY")
+        .center(0, -wedge_range_horizontal/2)
+        .slot2D(wedge_range_horizontal + mid_joint_clearance_size, mid_joint_clearance_size, 90)
+        .extrude(ball_surround_outer_radius, both = True)
+        )
+
+# Volume used for trimming objects in order to fit in mid joint
+@memoize
+def mid_joint_trim(mid_joint_trim_radius, ball_surround_outer_radius):
+    return (
+        cq.Workplane("XY")
+        .circle(mid_joint_trim_radius)
+        .extrude(ball_surround_outer_radius * 2)
+        )
 
 # Reinforce the section between end ball and mid joint
-tie_length = rod_side * math.sin(math.radians(45))
-tie_width = 6
-tie_height = 1.8
-tie_gap = 0.4 # Must be at least 1 layer height
-
-tie = (
-    cq.Workplane("YZ")
-    .lineTo(tie_width,            0)
-    .lineTo(tie_width-tie_height, tie_height)
-    .lineTo(          tie_height, tie_height)
-    .close()
-    .extrude(tie_length/2, both=True)
-    )
-
-tie_clearance = (
-    cq.Workplane("YZ")
-    .lineTo(                                                            -minimum_gap, 0)
-    .lineTo(                                      tie_height + tie_gap - minimum_gap, tie_height+tie_gap)
-    .lineTo( wedge_range_horizontal + tie_width - tie_height - tie_gap + minimum_gap, tie_height+tie_gap)
-    .lineTo( wedge_range_horizontal + tie_width                        + minimum_gap, 0)
-    .close()
-    .extrude(tie_length/2, both=True)
-    )
-
-tie_start = ball_surround_outer_radius - tie_width/2
-tie_span = arm_length - ball_surround_outer_radius - mid_joint_radius - tie_width/2
-
-# Calculate how many ties will be added. There should always be at least two,
-# one at each end. If the beam is long enough, additional ties are added in
-# between.
-extra_ties_count = math.floor(tie_span/40)
-tie_spacing = tie_span
-if extra_ties_count > 0:
-    tie_spacing = tie_span / (extra_ties_count+1)
-
-for t in range(2 + extra_ties_count):
-    actuating_rod = actuating_rod - tie_clearance.translate((0, tie_start + tie_spacing*t, cutoff_z))
-
-# Assembly of center actuation rod
-actuating_rod = (
-    actuating_rod
-    + wedge_block_mid
-    - wedge_block_upper_slice
-    - wedge_block_lower_fastener_slot
-    )
+@memoize
+def tie(tie_width, tie_height, tie_length):
+    return (
+        cq.Workplane("YZ")
+        .lineTo(tie_width,            0)
+        .lineTo(tie_width-tie_height, tie_height)
+        .lineTo(          tie_height, tie_height)
+        .close()
+        .extrude(tie_length/2, both=True)
+        )
+
+@memoize
+def tie_clearance(tie_width, tie_height, tie_length, tie_gap, minimum_gap, wedge_range_horizontal):
+    return (
+        cq.Workplane("YZ")
+        .lineTo(                                                            -minimum_gap, 0)
+        .lineTo(                                      tie_height + tie_gap - minimum_gap, tie_height+tie_gap)
+        .lineTo( wedge_range_horizontal + tie_width - tie_height - tie_gap + minimum_gap, tie_height+tie_gap)
+        .lineTo( wedge_range_horizontal + tie_width                        + minimum_gap, 0)
+        .close()
+        .extrude(tie_length/2, both=True)
+        )
+
+# Rod that transmits pushing force from mid joint to ball in socket
+@memoize
+def actuating_rod(
+        arm_length,
+        rod_side,
+        wedge_range_horizontal,
+        wedge_fastener_diameter,
+        wedge_diameter,
+        wedge_angle,
+        ball_surround_outer_radius,
+        cutoff_z,
+        tie_positions,
+        tie_width,
+        tie_height,
+        tie_length,
+        tie_gap,
+        minimum_gap):
+    values = locals()
+    rod = (
+        cq.Workplane("XZ")
+        .transformed(rotate=cq.Vector(0,0,45))
+        .transformed(offset=cq.Vector(0, 0, -wedge_range_horizontal))
+        .rect(rod_side, rod_side)
+        .extrude(wedge_range_horizontal - arm_length)
+        .edges("|Y")
+        )
+
+    rod = rod - _instances(
+        call_part(tie_clearance, values),
+        [(0, y, cutoff_z) for y in tie_positions])
+
+    # Assembly of center actuation rod
+    mid = (0, arm_length, 0)
+    angle = math.radians(wedge_angle)
+    lower, upper = split_halves(
+        rod + call_part(wedge_block_mid, values).translate(mid),
+        mid,
+        (0, math.sin(angle), math.cos(angle)))
+    return lower - call_part(wedge_block_lower_fastener_slot, values).translate(mid)
 
 # Wedge that will push on the actuating rod in its full size. Expected to be
 # trimmed for different application: one on near side of knob to carry its
 # pressure, and one on far side of knob hosting a hex bolt head.
-wedge_block_upper_full_height = (
-    wedge_block_mid
-    .intersect(wedge_block_upper_slice)
-    .edges("<Z")
-    .chamfer(wedge_range_vertical/2)
-    ) - (
-    # Hole through the middle for fastener
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, 0))
-    .circle(wedge_fastener_diameter/2)
-    .extrude(wedge_diameter, both=True)
-    )
-
-wedge_hex_z = (
-    # Minimum Z
-    fastener_hex_width * math.tan(math.radians(wedge_angle)) / 2
-    # Plus a nonzero big of plastic to support the hex bolt at minimum point
-    + 1.2
-    )
-
-wedge_block_hex_bolt_head = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, wedge_hex_z))
-    .transformed(rotate=cq.Vector(0, 0, 30))
-    .polygon(6, fastener_hex_width, circumscribed = True)
-    .extrude(fastener_hex_thickness)
-    )
-
-mid_joint_trim_radius = mid_joint_radius - nozzle_diameter*2
-mid_joint_trim = (
-    # Volume used for trimming objects in order to fit in mid joint
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, 0))
-    .circle(mid_joint_trim_radius)
-    .extrude(ball_surround_outer_radius * 2)
-    )
+@memoize
+def wedge_block_upper_full_height(
+        wedge_diameter,
+        wedge_angle,
+        wedge_range_vertical,
+        wedge_fastener_diameter,
+        ball_surround_outer_radius):
+    values = locals()
+    lower, upper = call_part(wedge_block_halves, values)
+    return (
+        upper
+        .edges("<Z")
+        .chamfer(wedge_range_vertical/2)
+        ) - (
+        # Hole through the middle for fastener
+        cq.Workplane("XY")
+        .circle(wedge_fastener_diameter/2)
+        .extrude(wedge_diameter, both=True)
+        )
 
 # Variation of upper block that hosts a hex head bolt.
-wedge_block_hex_bolt = (
-    wedge_block_upper_full_height
-    - mid_joint_trim.translate((0, 0, wedge_hex_z + fastener_hex_thickness))
-    - wedge_block_hex_bolt_head
-    ).edges(">Z").chamfer(wedge_range_vertical/2)
+@memoize
+@part_cache.persistent
+def wedge_block_hex_bolt(
+        wedge_diameter,
+        wedge_angle,
+        wedge_range_vertical,
+        wedge_fastener_diameter,
+        wedge_hex_z,
+        fastener_hex_width,
+        fastener_hex_thickness,
+        mid_joint_trim_radius,
+        ball_surround_outer_radius):
+    values = locals()
+    wedge_block_hex_bolt_head = (
+        cq.Workplane("XY")
+        .transformed(offset=cq.Vector(0, 0, wedge_hex_z))
+        .transformed(rotate=cq.Vector(0, 0, 30))
+        .polygon(6, fastener_hex_width, circumscribed = True)
+        .extrude(fastener_hex_thickness)
+        )
+
+    return (
+        call_part(wedge_block_upper_full_height, values)
+        - call_part(mid_joint_trim, values).translate((0, 0, wedge_hex_z + fastener_hex_thickness))
+        - wedge_block_hex_bolt_head
+        ).edges(">Z").chamfer(wedge_range_vertical/2)
 
 # Variation of upper block that does not host a hex head, to be paired with a
 # knob which will host a hex nut.
-wedge_block_z = wedge_range_vertical + wedge_diameter * math.tan(math.radians(wedge_angle)) / 2
-wedge_block_no_hex = (
-    wedge_block_upper_full_height
-    - mid_joint_trim.translate((0, 0, wedge_block_z))
-    ).edges(">Z").chamfer(wedge_range_vertical/2)
-
-# Show one or the other upper block variations during in-place visualization.
-# When preparing for printing, display both in their print orientations.
-if reposition_for_printing:
-    show_object(
-        wedge_block_hex_bolt
-        .translate((ball_surround_outer_radius*2,-arm_length,0))
-        .rotate((0, 0, 0), (1, 0, 0), wedge_angle),
-        options={"color":"red", "alpha":0.5})
-    show_object(
-        wedge_block_no_hex
-        .translate((-ball_surround_outer_radius*2,-arm_length,0))
-        .rotate((0, 0, 0), (1, 0, 0), wedge_angle),
-        options={"color":"red", "alpha":0.5})
-else:
-    #show_object(wedge_block_hex_bolt, options={"color":"red", "alpha":0.5})
-    show_object(wedge_block_no_hex, options={"color":"red", "alpha":0.5})
+@memoize
+@part_cache.persistent
+def wedge_block_no_hex(
+        wedge_diameter,
+        wedge_angle,
+        wedge_range_vertical,
+        wedge_fastener_diameter,
+        wedge_block_z,
+        mid_joint_trim_radius,
+        ball_surround_outer_radius):
+    values = locals()
+    return (
+        call_part(wedge_block_upper_full_height, values)
+        - call_part(mid_joint_trim, values).translate((0, 0, wedge_block_z))
+        ).edges(">Z").chamfer(wedge_range_vertical/2)
 
 # Assemble half of the arm. Print this twice for the three-jointed mechanism.
-arm = (
-    ball_surround_outer
-    + arm_outer_shell
-    + mid_joint
-    - actuating_rod_channel
-    - mid_joint_clearance
-    - mid_joint_trim.translate((0, 0, wedge_block_z - wedge_range_vertical * 2))
-    + actuating_rod
-    - arm_end_ball_cavity
-    )
-
-for t in range(2 + extra_ties_count):
-    arm = arm + tie.translate((0, tie_start + tie_spacing*t, cutoff_z))
-
-# Knob parameters
-knob_base_taper_height = wedge_block_z + ball_surround_outer_radius - wedge_diameter/2
-knob_base_vertical_height = ball_surround_outer_radius + wedge_range_vertical*3
-knob_base_radius = mid_joint_trim_radius - minimum_gap
-knob_wing_radius = 35
-knob_wing_thickness = 30
-knob_wing_height = ball_surround_outer_radius + (knob_wing_radius - ball_surround_outer_radius)
-knob_bottom = 1.8
-
-# Clearance for the hex nut to be hosted inside nut
-knob_hex_head = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, arm_length, wedge_block_z + knob_bottom))
-    .polygon(6, fastener_hex_width, circumscribed = True)
-    .extrude(knob_wing_height)
-    )
+@memoize
+@part_cache.persistent
+def arm(
+        arm_length,
+        arm_side_outer,
+        arm_side_inner,
+        rod_side,
+        ball_diameter,
+        ball_surround_thickness,
+        ball_surround_outer_radius,
+        fastener_diameter,
+        minimum_gap,
+        mid_joint_radius,
+        mid_joint_clearance_size,
+        mid_joint_trim_radius,
+        wedge_range_horizontal,
+        wedge_range_vertical,
+        wedge_fastener_diameter,
+        wedge_diameter,
+        wedge_angle,
+        wedge_block_z,
+        cutoff_z,
+        tie_positions,
+        tie_width,
+        tie_height,
+        tie_length,
+        tie_gap):
+    values = locals()
+    mid = (0, arm_length, 0)
+    result = (
+        call_part(ball_surround_outer, values)
+        + call_part(arm_outer_shell, values)
+        + call_part(mid_joint, values).translate(mid)
+        - call_part(actuating_rod_channel, values)
+        - call_part(mid_joint_clearance, values).translate(mid)
+        - call_part(mid_joint_trim, values).translate((0, arm_length, wedge_block_z - wedge_range_vertical * 2))
+        + call_part(actuating_rod, values)
+        - call_part(arm_end_ball_cavity, values)
+        )
+
+    return result + _instances(
+        call_part(tie, values),
+        [(0, y, cutoff_z) for y in tie_positions])
 
 # Revolve operation to create external volume of knob
-knob = (
-    cq.Workplane("XZ")
-    .transformed(offset=cq.Vector(0, 0, -arm_length))
-    # Base will stay intact
-    .lineTo(0,                wedge_block_z, forConstruction = True)
-    .lineTo(wedge_diameter/2, wedge_block_z)
-    .lineTo(knob_base_radius, knob_base_taper_height)
-    .lineTo(knob_base_radius, knob_base_vertical_height)
-    # Top will be trimmed to form wings
-    .lineTo(knob_wing_radius, knob_wing_height)
-    .lineTo(0,                knob_wing_height)
-    .close()
-    .revolve(360, (0, 0, 0), (0, 1, 0))
-    .edges(">Z").fillet(5)
-    .faces("<Z").workplane()
-    .circle(fastener_diameter/2)
-    .cutThruAll()
-    ) - knob_hex_head
-
-# Block to cut symmetric chunks out of the knob to create a wingnut shape
-knob_removal = (
-    cq.Workplane("XZ")
-    .lineTo(knob_wing_thickness/2, ball_surround_outer_radius*2, forConstruction = True)
-    .rect(knob_wing_radius, knob_wing_height, centered = False)
-    .extrude(- arm_length - knob_wing_radius*2)
-    .edges("|Y")
-    .fillet(5)
-    )
-
-knob = knob - knob_removal - knob_removal.mirror("YZ")
-show_object(knob, options={"color":"green","alpha":0.5})
+@memoize
+@part_cache.persistent
+def knob(
+        wedge_block_z,
+        wedge_diameter,
+        knob_base_radius,
+        knob_base_taper_height,
+        knob_base_vertical_height,
+        knob_wing_radius,
+        knob_wing_height,
+        knob_wing_thickness,
+        knob_bottom,
+        fastener_diameter,
+        fastener_hex_width,
+        ball_surround_outer_radius,
+        preview):
+    # Clearance for the hex nut to be hosted inside nut
+    knob_hex_head = (
+        cq.Workplane("XY")
+        .transformed(offset=cq.Vector(0, 0, wedge_block_z + knob_bottom))
+        .polygon(6, fastener_hex_width, circumscribed = True)
+        .extrude(knob_wing_height)
+        )
+
+    result = (
+        cq.Workplane("XZ")
+        # Base will stay intact
+        .lineTo(0,                wedge_block_z, forConstruction = True)
+        .lineTo(wedge_diameter/2, wedge_block_z)
+        .lineTo(knob_base_radius, knob_base_taper_height)
+        .lineTo(knob_base_radius, knob_base_vertical_height)
+        # Top will be trimmed to form wings
+        .lineTo(knob_wing_radius, knob_wing_height)
+        .lineTo(0,                knob_wing_height)
+        .close()
+        .revolve(360, (0, 0, 0), (0, 1, 0))
+        )
+    if not preview:
+        result = result.edges(">Z").fillet(5)
+    result = (
+        result
+        .faces("<Z").workplane()
+        .circle(fastener_diameter/2)
+        .cutThruAll()
+        ) - knob_hex_head
+
+    # Block to cut symmetric chunks out of the knob to create a wingnut shape
+    knob_removal = (
+        cq.Workplane("XZ")
+        .lineTo(knob_wing_thickness/2, ball_surround_outer_radius*2, forConstruction = True)
+        .rect(knob_wing_radius, knob_wing_height, centered = False)
+        .extrude(knob_wing_radius*2, both = True)
+        )
+    if not preview:
+        knob_removal = knob_removal.edges("|Y").fillet(5)
+
+    return result - knob_removal - knob_removal.mirror("YZ")
 
 # Complex single print object becoming likely to trigger CadQuery bugs. Ugh.
-combined = end_ball_assembly + arm
-
-# Again, chop can likely be replaced with a split() command but I have yet to figure out how
-chop = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0,0,cutoff_z))
-    .rect(arm_length*3,arm_length*3)
-    .extrude(-ball_surround_outer_radius)
-    )
-if reposition_for_printing:
-    show_object((combined - chop).translate((0,0,-cutoff_z)), options={"color":"blue", "alpha":0.5})
-else:
-    show_object(combined - chop, options={"color":"blue", "alpha":0.5})
+@memoize
+@part_cache.persistent
+def printable_arm(
+        arm_length,
+        arm_side_outer,
+        arm_side_inner,
+        rod_side,
+        ball_diameter,
+        ball_surround_thickness,
+        ball_surround_outer_radius,
+        fastener_diameter,
+        fastener_diameter_tight,
+        fastener_thread_pitch,
+        fastener_hex_thickness,
+        fastener_hex_width,
+        minimum_gap,
+        mid_joint_radius,
+        mid_joint_clearance_size,
+        mid_joint_trim_radius,
+        wedge_range_horizontal,
+        wedge_range_vertical,
+        wedge_fastener_diameter,
+        wedge_diameter,
+        wedge_angle,
+        wedge_block_z,
+        cutoff_z,
+        tie_positions,
+        tie_width,
+        tie_height,
+        tie_length,
+        tie_gap):
+    values = locals()
+    combined = call_part(end_ball_assembly, values) + call_part(arm, values)
+
+    # Flat bottom for the print bed at cutoff_z
+    below, above = split_halves(combined, (0, 0, cutoff_z), (0, 0, 1))
+    return above
+
+# Every memoized part function by name
+part_functions = {function.__name__: function for function in memoized}
+
+# Parts a part function builds internally through call_part()
+def called_parts(function):
+    tree = ast.parse(textwrap.dedent(inspect.getsource(inspect.unwrap(function))))
+    return sorted(set(
+        node.args[0].id for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and getattr(node.func, "id", None) == "call_part"
+        and isinstance(node.args[0], ast.Name)))
+
+# Parts each part function builds, read from the source once at import rather
+# than for every graph
+part_calls = {name: called_parts(function) for name, function in part_functions.items()}
+
+# Graph of parameters, derived values and parts. Reading a part computes only
+# what it needs, and set() forgets only what is downstream of the change:
+#
+#     graph = arm_graph()
+#     graph["knob"]
+#     graph.set(minimum_gap = 0.25)
+#     graph["knob"]   # rebuilt, along with values depending on minimum_gap
+#     graph.dependents("minimum_gap")
+#
+# Parts around the mid joint are at the origin, see build_arm().
+def arm_graph(params = None):
+    graph = dependency_graph.DependencyGraph()
+    for name, value in checked_parameters(params).items():
+        graph.input(name, value)
+    for name, function in derived_values.items():
+        graph.node(name, function)
+    for name, function in part_functions.items():
+        graph.node(name, function, part_calls[name])
+    return graph
+
+# Parts centered on the mid joint, built at the origin then moved into place.
+mid_joint_parts = ["knob", "wedge_block_hex_bolt", "wedge_block_no_hex"]
+
+arm_parts = {
+    "end_ball_assembly": end_ball_assembly,
+    "arm": arm,
+    "knob": knob,
+    "wedge_block_hex_bolt": wedge_block_hex_bolt,
+    "wedge_block_no_hex": wedge_block_no_hex,
+    "printable_arm": printable_arm,
+    }
+
+# Build the named parts (all of them by default) for the given parameter
+# overrides. Parts are returned in their assembled position.
+def build_arm(params = None, parts = None):
+    values = arm_values(params)
+    built = {}
+    for name in parts or arm_parts:
+        built[name] = call_part(arm_parts[name], values)
+        if name in mid_joint_parts:
+            built[name] = built[name].translate((0, values["arm_length"], 0))
+    return built
+
+# Single part with parameters given as keyword arguments, matching the calling
+# convention of the accessory generators.
+def arm_part(name, **params):
+    return build_arm(params, [name])[name]
+
+# A part from build_arm() turned to the orientation it is printed in: wedge
+# blocks brought back to the origin and tilted to stand on their wedge face,
+# the arm lifted to sit on its cutoff plane.
+def print_orientation(name, part, values):
+    if name in ("wedge_block_hex_bolt", "wedge_block_no_hex"):
+        return (
+            part
+            .translate((0, -values["arm_length"], 0))
+            .rotate((0, 0, 0), (1, 0, 0), values["wedge_angle"]))
+    if name == "printable_arm":
+        return part.translate((0, 0, -values["cutoff_z"]))
+    return part
+
+# If this file is loaded in CQ-Editor, display the arm. Importing it builds
+# nothing until build_arm() is called.
+show_object = display.sink_for(globals())
+if show_object:
+    values = arm_values()
+    parts = build_arm()
+
+    # Show one or the other upper block variations during in-place visualization.
+    # When preparing for printing, display both in their print orientations.
+    if reposition_for_printing:
+        show_object(
+            print_orientation("wedge_block_hex_bolt", parts["wedge_block_hex_bolt"], values)
+            .translate((values["ball_surround_outer_radius"]*2,0,0)),
+            options={"color":"red", "alpha":0.5})
+        show_object(
+            print_orientation("wedge_block_no_hex", parts["wedge_block_no_hex"], values)
+            .translate((-values["ball_surround_outer_radius"]*2,0,0)),
+            options={"color":"red", "alpha":0.5})
+    else:
+        #show_object(parts["wedge_block_hex_bolt"], options={"color":"red", "alpha":0.5})
+        show_object(parts["wedge_block_no_hex"], options={"color":"red", "alpha":0.5})
+
+    show_object(parts["knob"], options={"color":"green","alpha":0.5})
+
+    if reposition_for_printing:
+        show_object(print_orientation("printable_arm", parts["printable_arm"], values), options={"color":"blue", "alpha":0.5})
+    else:
+        show_object(parts["printable_arm"], options={"color":"blue", "alpha":0.5})
@@ -0,0 +1,292 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Where the end of the arm can reach, worked out from the joint geometry
+instead of a posed CAD model:
+
+    python arm_kinematics.py -p arm_length=150 --tool 60 --target 120,80,-40
+
+The base ball sits at the origin with its stud pointing down into the mount.
+Each ball can swivel within the 90 degree cone cut by lug_clearance, which
+keeps the arm within 45 degrees of pointing straight away from the stud, and
+spin freely around the arm. Spinning the first arm sets the direction of the
+mid joint axis, the second arm turns around that axis and sits beside the
+first, offset by the two flat faces the arms are printed on. The two arms
+stay on opposite sides of those faces and cannot run into each other, what
+can collide is the second arm with the mounting surface and whatever is held
+by the end ball (a tool of the given length on its stud) with the first arm.
+
+Millions of joint configurations are sampled in batches of arrays and the
+position of the tool tip is binned into voxels. Reached voxels are the
+workspace. Enclosed voxels no pose reaches are dead zones, voxels reached
+only by colliding poses are collision regions. Voxels near the edge of the
+envelope can show up as dead zones when there are too few samples for the
+resolution.
+"""
+
+import argparse
+import math
+import time
+from collections import namedtuple
+import numpy as np
+import adjustable_arm
+import arm_sweep
+
+# Half angle of the cone each ball swivels in, see lug_clearance in
+# ball_surround_outer()
+cone_angle = math.radians(45)
+
+# Poses computed per batch of arrays
+batch = 1 << 18
+
+# Angular size of the bins the envelope radius is recorded in
+envelope_bin = math.radians(5)
+
+# Joint angles in radians, one array entry per pose: tilt and heading of the
+# first arm away from vertical, its spin around itself, the turn of the second
+# arm around the mid joint, and tilt and heading of the end stud.
+Joints = namedtuple("Joints", ["tilt", "heading", "spin", "turn", "stud_tilt", "stud_heading"])
+
+# Sizes the kinematics depend on, from the arm parameters. The mounting
+# surface is floor below the base ball center, by default just under the
+# socket.
+def arm_geometry(params = None, floor = None):
+    values = adjustable_arm.arm_values(params)
+    return {
+        "arm_length": values["arm_length"],
+        "offset": -2 * values["cutoff_z"],
+        "arm_radius": values["arm_side_outer"] / math.sqrt(2),
+        "socket_radius": values["ball_surround_outer_radius"],
+        "mid_radius": values["mid_joint_radius"],
+        "floor": values["ball_surround_outer_radius"] if floor is None else floor,
+        }
+
+def random_joints(count, rng):
+    return Joints(
+        np.arccos(rng.uniform(math.cos(cone_angle), 1, count)),
+        rng.uniform(0, 2 * math.pi, count),
+        rng.uniform(0, 2 * math.pi, count),
+        rng.uniform(0, 2 * math.pi, count),
+        np.arccos(rng.uniform(math.cos(cone_angle), 1, count)),
+        rng.uniform(0, 2 * math.pi, count))
+
+def column(values):
+    return values[:, None]
+
+# Positions of the joints and tool tip for each pose. first runs along the
+# first arm out from the base ball, second along the second arm out to the end
+# ball, normal is the mid joint axis pointing from the first arm to the second.
+# Directions are worked out in the spherical frame of the first arm, across
+# the tilt (down) and heading (across) directions at right angles to it.
+def forward(geometry, joints, tool = 0):
+    tilt_cos, tilt_sin = np.cos(joints.tilt), np.sin(joints.tilt)
+    heading_cos, heading_sin = np.cos(joints.heading), np.sin(joints.heading)
+    first = np.stack([tilt_sin * heading_cos, tilt_sin * heading_sin, tilt_cos], axis=1)
+    down = np.stack([tilt_cos * heading_cos, tilt_cos * heading_sin, -tilt_sin], axis=1)
+    across = np.stack([-heading_sin, heading_cos, np.zeros_like(tilt_cos)], axis=1)
+
+    normal = down * column(np.cos(joints.spin)) + across * column(np.sin(joints.spin))
+    beside = down * column(np.sin(joints.spin)) - across * column(np.cos(joints.spin))
+    second = -first * column(np.cos(joints.turn)) - beside * column(np.sin(joints.turn))
+    outward = beside * column(np.cos(joints.turn)) - first * column(np.sin(joints.turn))
+    stud = (second * column(np.cos(joints.stud_tilt))
+            + (normal * column(np.cos(joints.stud_heading)) + outward * column(np.sin(joints.stud_heading)))
+            * column(np.sin(joints.stud_tilt)))
+
+    length = geometry["arm_length"]
+    first_mid = first * length
+    second_mid = first_mid + normal * geometry["offset"]
+    end = second_mid + second * length
+    return {
+        "first": first, "second": second, "normal": normal, "stud": stud,
+        "first_mid": first_mid, "second_mid": second_mid,
+        "end": end, "tip": end + stud * tool,
+        }
+
+# Distance from each point to the segment from start to end
+def point_segment_distance(points, start, end):
+    along = end - start
+    position = np.clip(
+        np.einsum("ij,ij->i", points - start, along) / np.maximum(np.einsum("ij,ij->i", along, along), 1e-300),
+        0, 1)
+    return np.linalg.norm(points - start - position[:, None] * along, axis=1)
+
+# Distance between segments p0-p1 and q0-q1, closest points by clamping the
+# parameters of the infinite lines in turn
+def segment_distance(p0, p1, q0, q1):
+    d1, d2, r = p1 - p0, q1 - q0, p0 - q0
+    a = np.einsum("ij,ij->i", d1, d1)
+    e = np.einsum("ij,ij->i", d2, d2)
+    b = np.einsum("ij,ij->i", d1, d2)
+    c = np.einsum("ij,ij->i", d1, r)
+    f = np.einsum("ij,ij->i", d2, r)
+    denominator = a * e - b * b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(denominator > 1e-12, np.clip((b * f - c * e) / denominator, 0, 1), 0)
+        t = np.clip((b * s + f) / np.maximum(e, 1e-300), 0, 1)
+        s = np.clip((b * t - c) / np.maximum(a, 1e-300), 0, 1)
+    return np.linalg.norm(p0 + s[:, None] * d1 - q0 - t[:, None] * d2, axis=1)
+
+# Lowest point of a disc of the given radius centered on points, facing normal
+def disc_bottom(points, normal, radius):
+    return points[:, 2] - radius * np.sqrt(np.maximum(1 - normal[:, 2]**2, 0))
+
+# Poses where the second arm, the mid joint or the end ball dips below the
+# mounting surface, or the tool runs into the first arm or the base socket
+def collisions(geometry, pose, tool = 0):
+    floor = -geometry["floor"]
+    arm_radius, socket_radius = geometry["arm_radius"], geometry["socket_radius"]
+    hit = np.minimum(pose["second_mid"][:, 2], pose["end"][:, 2]) - arm_radius < floor
+    hit |= pose["end"][:, 2] - socket_radius < floor
+    hit |= disc_bottom(pose["first_mid"], pose["normal"], geometry["mid_radius"]) < floor
+    hit |= disc_bottom(pose["second_mid"], pose["normal"], geometry["mid_radius"]) < floor
+    hit |= pose["tip"][:, 2] < floor
+
+    if tool > socket_radius:
+        origin = np.zeros_like(pose["end"])
+        start = pose["end"] + pose["stud"] * socket_radius
+        hit |= segment_distance(start, pose["tip"], origin, pose["first_mid"]) < arm_radius
+        hit |= point_segment_distance(origin, start, pose["tip"]) < socket_radius
+    return hit
+
+# Low corner and shape of a voxel grid covering every place the tool tip
+# could get to, colliding or not
+def voxel_grid(geometry, tool, resolution):
+    reach = 2 * geometry["arm_length"] + geometry["offset"] + tool + resolution
+    low = np.full(3, -reach)
+    shape = np.full(3, int(math.ceil(2 * reach / resolution)) + 1)
+    return low, shape
+
+envelope_rows = int(math.ceil(math.pi / envelope_bin)) + 1
+envelope_columns = int(math.ceil(2 * math.pi / envelope_bin))
+
+# Envelope bin of each point by its direction from the base ball
+def direction_bins(points):
+    heading = np.arctan2(points[:, 1], points[:, 0]) + math.pi
+    elevation = np.arctan2(points[:, 2], np.hypot(points[:, 0], points[:, 1])) + math.pi / 2
+    row = np.minimum((elevation // envelope_bin).astype(np.int64), envelope_rows - 1)
+    column = np.minimum((heading // envelope_bin).astype(np.int64), envelope_columns - 1)
+    return row * envelope_columns + column
+
+voxel_states = ["outside", "dead zone", "collision", "reached"]
+
+# Sample poses and bin where the tool tip ends up. For each target, the
+# collision free pose bringing the tip closest to it is kept.
+def workspace(geometry, samples = 1000000, tool = 0, resolution = 10, targets = (), seed = 0):
+    rng = np.random.default_rng(seed)
+    low, shape = voxel_grid(geometry, tool, resolution)
+    cells = int(np.prod(shape))
+    reached = np.zeros(cells, dtype=np.int64)
+    colliding = np.zeros(cells, dtype=np.int64)
+    envelope = np.zeros(envelope_rows * envelope_columns)
+    targets = np.asarray(targets, dtype=float).reshape(-1, 3)
+    nearest = [(np.inf, None)] * len(targets)
+    reach = [np.inf, 0.0]
+
+    for start in range(0, samples, batch):
+        joints = random_joints(min(batch, samples - start), rng)
+        pose = forward(geometry, joints, tool)
+        hit = collisions(geometry, pose, tool)
+        cell = np.ravel_multi_index(((pose["tip"] - low) // resolution).astype(np.int64).T, shape)
+        reached += np.bincount(cell[~hit], minlength=cells)
+        colliding += np.bincount(cell[hit], minlength=cells)
+
+        free = pose["tip"][~hit]
+        if not len(free):
+            continue
+        radius = np.linalg.norm(free, axis=1)
+        reach = [min(reach[0], radius.min()), max(reach[1], radius.max())]
+        np.maximum.at(envelope, direction_bins(free), radius)
+        for index, target in enumerate(targets):
+            distance = np.linalg.norm(free - target, axis=1)
+            best = distance.argmin()
+            if distance[best] < nearest[index][0]:
+                nearest[index] = (distance[best], Joints(*(angle[~hit][best] for angle in joints)))
+
+    centers = low + (np.stack(np.unravel_index(np.arange(cells), shape), axis=1) + 0.5) * resolution
+    enclosed = np.linalg.norm(centers, axis=1) <= envelope[direction_bins(centers)]
+    state = np.zeros(cells, dtype=np.int8)
+    state[enclosed] = 1
+    state[(colliding > 0) & (reached == 0)] = 2
+    state[reached > 0] = 3
+
+    voxel = resolution**3
+    target_cells = np.ravel_multi_index(
+        np.clip(((targets - low) // resolution).astype(np.int64), 0, shape - 1).T, shape)
+    return {
+        "samples": samples,
+        "colliding": colliding.sum() / samples,
+        "reach": reach,
+        "workspace": (reached > 0).sum() * voxel,
+        "dead": (state == 1).sum() * voxel,
+        "collision": (state == 2).sum() * voxel,
+        "targets": [(tuple(target), voxel_states[state[cell]], distance, joints)
+                    for target, cell, (distance, joints) in zip(targets, target_cells, nearest)],
+        }
+
+# "name=value" arm parameter override
+def parse_parameter(text):
+    name, _, value = text.partition("=")
+    return name, float(value)
+
+# "x,y,z" target position
+def parse_target(text):
+    return tuple(float(v) for v in text.split(","))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("-p", "--parameter", dest="parameters", action="append", default=[],
+                        type=parse_parameter, help="arm parameter as name=value, may be repeated")
+    parser.add_argument("-a", "--axis", action="append", default=[], type=arm_sweep.parse_axis,
+                        help="compare arms over a parameter as name=start:stop:step or name=a,b,c")
+    parser.add_argument("-t", "--target", dest="targets", action="append", default=[], type=parse_target,
+                        help="position as x,y,z from the base ball center, may be repeated")
+    parser.add_argument("--tool", type=float, default=0, help="length of what the end ball holds, in mm")
+    parser.add_argument("--floor", type=float, help="depth of the mounting surface below the base ball center")
+    parser.add_argument("-n", "--samples", type=int, default=1000000, help="poses to sample")
+    parser.add_argument("-r", "--resolution", type=float, default=10, help="voxel size in mm")
+    args = parser.parse_args()
+
+    for params in arm_sweep.variants(dict(args.axis), dict(args.parameters)):
+        geometry = arm_geometry(params, args.floor)
+        start = time.perf_counter()
+        found = workspace(geometry, args.samples, args.tool, args.resolution, args.targets)
+        print("{}: {} poses in {:.0f}ms, {:.1%} colliding".format(
+            arm_sweep.variant_stem("arm", params), found["samples"],
+            (time.perf_counter() - start) * 1000, found["colliding"]))
+        print("  reach {:.1f} to {:.1f}mm from the base ball".format(*found["reach"]))
+        print("  workspace {:.0f}cm3, dead zones {:.0f}cm3, collision regions {:.0f}cm3".format(
+            found["workspace"] / 1000, found["dead"] / 1000, found["collision"] / 1000))
+        for target, state, distance, joints in found["targets"]:
+            print("  ({:g}, {:g}, {:g}): {}".format(*target, state), end="")
+            if joints is None:
+                print()
+                continue
+            print(", nearest pose {:.1f}mm away: tilt {:.0f}, heading {:.0f}, spin {:.0f}, turn {:.0f}, "
+                  "stud tilt {:.0f}, stud heading {:.0f} degrees".format(
+                      distance, *(math.degrees(angle) for angle in joints)))
+
+if __name__ == "__main__":
+    main()
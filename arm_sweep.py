@@ -0,0 +1,160 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Generate a whole family of arms in one call, for example every arm_length from
+100 to 400 in 25mm steps crossed with several ball diameters:
+
+    python arm_sweep.py --axis arm_length=100:400:25 --axis ball_diameter=16:30:2
+
+Each part depends on only some parameters. A part whose arguments are the same
+across several variants (the end ball and knob when only arm_length changes,
+the wedge blocks) is built once up front into the shared part cache, then
+every variant reads it from there instead of rebuilding it. That includes
+parts only built inside others, like the end ball assembly inside the
+printable arm, which are built before the parts using them. Variants are
+built on a pool of worker processes and reported as each one finishes.
+"""
+
+import argparse
+import concurrent.futures
+import itertools
+import os
+import time
+import adjustable_arm
+import export_parts
+import part_cache
+
+default_parts = ["printable_arm", "knob", "wedge_block_hex_bolt", "wedge_block_no_hex"]
+
+# Every combination of the axes, each a dictionary of arm parameters
+def variants(axes, fixed = None):
+    names = list(axes)
+    for combination in itertools.product(*(axes[name] for name in names)):
+        params = dict(fixed or {})
+        params.update(zip(names, combination))
+        yield params
+
+# Depth of each part in the parts it builds through call_part(): 0 for parts
+# building no others, one more than their deepest dependency otherwise.
+def dependency_depths(parts):
+    depths = {}
+    def visit(name):
+        if name not in depths:
+            called = adjustable_arm.part_calls[name]
+            depths[name] = 1 + max(map(visit, called)) if called else 0
+        return depths[name]
+    for name in parts:
+        visit(name)
+    return depths
+
+# For each persistent part, requested or built inside one, that is the same
+# in more than one variant: one (part, params) build per distinct set of
+# arguments the part depends on. Builds come in stages, each to finish before
+# the next starts, so a part's dependencies are in the cache before it is
+# built.
+def shared_builds(all_variants, parts):
+    depths = dependency_depths(parts)
+    all_values = [adjustable_arm.arm_values(params) for params in all_variants]
+    stages = [[] for depth in range(max(depths.values()) + 1)]
+    for name, depth in depths.items():
+        if not getattr(adjustable_arm.part_functions[name], "persistent", False):
+            continue
+        representatives = {}
+        for params, values in zip(all_variants, all_values):
+            arguments = adjustable_arm.part_arguments(adjustable_arm.part_functions[name], values)
+            representatives.setdefault(tuple(sorted(arguments.items())), params)
+        if len(representatives) < len(all_variants):
+            stages[depth].extend((name, params) for params in representatives.values())
+    return [stage for stage in stages if stage]
+
+def variant_stem(name, params):
+    return "-".join([name] + ["{}={:g}".format(key, value) for key, value in sorted(params.items())])
+
+def build_shared(name, params):
+    adjustable_arm.call_part(adjustable_arm.part_functions[name], adjustable_arm.arm_values(params))
+
+def build_variant(params, parts, output, export_formats):
+    start = time.perf_counter()
+    values = adjustable_arm.arm_values(params)
+    paths = {}
+    for name, part in adjustable_arm.build_arm(params, parts).items():
+        part = adjustable_arm.print_orientation(name, part, values)
+        paths[name] = export_parts.write(part, output, variant_stem(name, params), export_formats)
+    return params, paths, time.perf_counter() - start
+
+# Yield (params, {part: paths}, seconds) for each variant as soon as it is done
+def sweep(axes, output, parts = default_parts, export_formats = ("step",), fixed = None, workers = None):
+    all_variants = list(variants(axes, fixed))
+    for params in all_variants:
+        # Reject unknown parameters before starting any work
+        adjustable_arm.arm_values(params)
+
+    os.makedirs(output, exist_ok=True)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        # Sharing goes through the on-disk part cache, without it every
+        # variant builds its own copy.
+        if part_cache.enabled:
+            for stage in shared_builds(all_variants, parts):
+                shared = [pool.submit(build_shared, name, params) for name, params in stage]
+                for future in concurrent.futures.as_completed(shared):
+                    future.result()
+
+        futures = [pool.submit(build_variant, params, parts, output, export_formats)
+                   for params in all_variants]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+# "name=start:stop:step" inclusive of stop, or "name=a,b,c"
+def parse_axis(text):
+    name, _, values = text.partition("=")
+    if ":" in values:
+        start, stop, step = (float(v) for v in values.split(":"))
+        count = int(round((stop - start) / step)) + 1
+        return name, [start + step * i for i in range(count)]
+    return name, [float(v) for v in values.split(",")]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("-a", "--axis", action="append", required=True, type=parse_axis,
+                        help="swept parameter as name=start:stop:step or name=a,b,c")
+    parser.add_argument("-p", "--part", dest="parts", action="append",
+                        choices=list(adjustable_arm.arm_parts), help="part to build, may be repeated")
+    parser.add_argument("-o", "--output", default="sweep", help="output directory")
+    parser.add_argument("-f", "--format", dest="formats", action="append", choices=export_parts.formats,
+                        help="file format, may be repeated, default step")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = 0
+    for params, paths, seconds in sweep(
+            dict(args.axis), args.output, args.parts or default_parts,
+            args.formats or ["step"], workers=args.jobs):
+        count += 1
+        print("{:<40} {:7.2f}s".format(variant_stem("arm", params), seconds), flush=True)
+    print("Built {} variants in {:.2f}s".format(count, time.perf_counter() - start))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Time every construction stage of the arm and every accessory generator across
+a grid of parameters, recording wall time, peak memory and the face and edge
+count of the result.
+
+    python benchmark.py --save baseline.json
+    python benchmark.py --compare baseline.json
+
+Each case runs in a fresh worker process forked after cadquery is imported,
+with part caches disabled, so a stage is timed from cold including the stages
+it is built from. Comparing against a saved baseline flags cases that became
+slower than the threshold ratio or whose topology changed, and exits nonzero.
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import sys
+import time
+
+# Intermediate and finished solids of adjustable_arm, in build order
+arm_stages = [
+    "end_ball_assembly",
+    "ball_surround_outer",
+    "actuating_rod",
+    "wedge_block_upper_full_height",
+    "arm",
+    "knob",
+    "printable_arm",
+    ]
+
+arm_lengths = [100, 200, 300, 400]
+
+# Accessory generator -> (module, list of keyword argument sets)
+accessories = {
+    "hex_bolt_clip": ("extrusion_clip", [{}]),
+    "indicator_holder": ("indicator_holder", [{}]),
+    "indicator_base_adapter": ("indicator_base_adapter", [{}]),
+    "camera_adapter": ("m5camera_adapter", [{}]),
+    "round_platform": ("round_platform", [{"radius": r} for r in [20, 30, 45]]),
+    "ring_led_clip": ("ring_led_clip", [{"radius": r} for r in [20, 30, 45, 60]]),
+    "bridgeport_spindle_clamp": ("bridgeport_spindle_clamp", [{"radius": r} for r in [20, 47/2, 30, 40]]),
+    }
+
+def case_name(function, kwargs):
+    arguments = ",".join("{}={:g}".format(key, value) for key, value in sorted(kwargs.items()))
+    return "{}[{}]".format(function, arguments)
+
+def cases():
+    for arm_length in arm_lengths:
+        for stage in arm_stages:
+            yield case_name(stage, {"arm_length": arm_length}), ("adjustable_arm", stage, {"arm_length": arm_length})
+    for function, (module, grid) in accessories.items():
+        for kwargs in grid:
+            yield case_name(function, kwargs), (module, function, kwargs)
+
+def build(module, function, kwargs):
+    if module == "adjustable_arm":
+        import adjustable_arm
+        return adjustable_arm.call_part(
+            getattr(adjustable_arm, function),
+            adjustable_arm.arm_values(kwargs))
+    return getattr(sys.modules[module], function)(**kwargs)
+
+def run_case(module, function, kwargs):
+    import part_cache
+    part_cache.enabled = False
+
+    start = time.perf_counter()
+    part = build(module, function, kwargs)
+    wall = time.perf_counter() - start
+
+    faces = sum(len(shape.Faces()) for shape in part.vals())
+    edges = sum(len(shape.Edges()) for shape in part.vals())
+    # ru_maxrss is in kilobytes on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {"wall": wall, "peak_rss_mb": peak_rss, "faces": faces, "edges": edges}
+
+def run(selected, repeat):
+    import cadquery as cq
+    # Import every part module before forking so workers start warm
+    for module in set(module for module, _, _ in selected.values()):
+        __import__(module)
+
+    results = {}
+    context = multiprocessing.get_context("fork")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        for name, arguments in selected.items():
+            runs = [pool.apply(run_case, arguments) for _ in range(repeat)]
+            best = min(runs, key=lambda r: r["wall"])
+            best["peak_rss_mb"] = max(r["peak_rss_mb"] for r in runs)
+            results[name] = best
+            print("{:<55} {:8.3f}s {:8.1f}MB {:6d} faces {:6d} edges".format(
+                name, best["wall"], best["peak_rss_mb"], best["faces"], best["edges"]),
+                flush=True)
+
+    return {
+        "cadquery": cq.__version__,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": results,
+        }
+
+# Return a list of human readable regressions of current against baseline
+def regressions(current, baseline, threshold, slack):
+    found = []
+    for name, result in current["cases"].items():
+        reference = baseline["cases"].get(name)
+        if reference is None:
+            continue
+        if result["wall"] > reference["wall"] * threshold + slack:
+            found.append("{}: {:.3f}s was {:.3f}s ({:.1f}x)".format(
+                name, result["wall"], reference["wall"], result["wall"] / reference["wall"]))
+        if (result["faces"], result["edges"]) != (reference["faces"], reference["edges"]):
+            found.append("{}: {} faces {} edges was {} faces {} edges".format(
+                name, result["faces"], result["edges"], reference["faces"], reference["edges"]))
+    return found
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("filter", nargs="*", help="only run cases containing one of these strings")
+    parser.add_argument("-r", "--repeat", type=int, default=1, help="runs per case, fastest is kept")
+    parser.add_argument("-s", "--save", help="write results as JSON to this file")
+    parser.add_argument("-c", "--compare", help="baseline JSON to check for regressions")
+    parser.add_argument("-t", "--threshold", type=float, default=1.5, help="slowdown ratio flagged as regression")
+    parser.add_argument("--slack", type=float, default=0.05, help="seconds of noise tolerated on top of threshold")
+    args = parser.parse_args()
+
+    selected = {
+        name: arguments for name, arguments in cases()
+        if not args.filter or any(text in name for text in args.filter)}
+    current = run(selected, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as output:
+            json.dump(current, output, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        found = regressions(current, baseline, args.threshold, args.slack)
+        for line in found:
+            print("REGRESSION " + line)
+        if found:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
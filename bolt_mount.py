@@ -0,0 +1,70 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Hex bolt head mount shared by the accessories: a square block with a pocket
+holding the head of a bolt and a hole for its shaft. The mount for each
+fastener is built once and placed by transform wherever it is needed.
+"""
+
+import functools
+import cadquery as cq
+
+# Dimensions in millimeters as printed. head_diameter is across the flats of
+# the hex pocket, shaft_diameter is the clearance hole. The 1/4"-20 entry is
+# the one all accessories have been printed with, the others add the same
+# allowances on top of nominal bolt dimensions.
+fasteners = {
+    "M5": {"head_diameter": 8, "head_thickness": 3.75, "shaft_diameter": 5.2},
+    "M6": {"head_diameter": 10, "head_thickness": 4.25, "shaft_diameter": 6.2},
+    "M8": {"head_diameter": 13, "head_thickness": 5.5, "shaft_diameter": 8.2},
+    "1/4-20": {"head_diameter": 11, "head_thickness": 4.25, "shaft_diameter": 6.5},
+    "5/16-18": {"head_diameter": 12.7, "head_thickness": 5.5, "shaft_diameter": 8.1},
+    }
+
+default_fastener = "1/4-20"
+
+# Plastic behind the bolt head
+back_thickness = 2
+
+def mount_thickness(fastener = default_fastener):
+    return fasteners[fastener]["head_thickness"] + back_thickness
+
+# Block of side x side on the XZ plane, back face at Y=0 and the bolt head
+# pocket opening toward -Y. Optionally round the two top edges.
+@functools.lru_cache(maxsize=None)
+def hex_head_block(fastener = default_fastener, side = 18, top_fillet = 0):
+    spec = fasteners[fastener]
+    block = (
+        cq.Workplane("XZ")
+        .rect(side, side)
+        .circle(spec["shaft_diameter"]/2)
+        .extrude(mount_thickness(fastener))
+        .faces("<Y")
+        .polygon(6, spec["head_diameter"], circumscribed = True)
+        .extrude(-spec["head_thickness"], combine='cut')
+    )
+    if top_fillet:
+        block = block.faces(">Z").edges("|Y").fillet(top_fillet)
+    return block
@@ -25,33 +25,67 @@ SOFTWARE.
 """
 Clamp a 1/4"-20 bolt head onto the spindle of a Bridgeport knee mill so we can
 attach an indicator to tram the head.
+
+The ring is split by a slot and squeezed onto the spindle by a small bolt
+through the tab, tab_fastener. The tab, its slot and the bolt head mount only
+depend on the ring height and fasteners, so they are built once and shared by
+clamps for spindles of every diameter, see spindle_inventory.py.
 """
 
+import functools
 import math
+import bolt_mount
 import cadquery as cq
+import display
+import fidelity
+import part_cache
+
+slot_width = 4
+tab_width = slot_width + 8
+tab_length = 12.5
+
+# Clearance hole through the tab for each squeeze bolt. Only the hole
+# changes, the bolt head sits on the outside of the tab.
+tab_fasteners = {
+    "M3": 3.5,
+    "M4": 4.5,
+    }
+
+# Tab holding the squeeze bolt and the slot later cut through it and the
+# ring, both centered on the origin
+@functools.lru_cache(maxsize=None)
+def tab_and_slot(ring_height, tab_fastener):
+    tab = (
+        cq.Workplane("XY")
+        .rect(tab_width, tab_length)
+        .extrude(ring_height/2, both=True)
+        # Hole for fastener
+        .faces(">X").workplane()
+        .lineTo(-tab_length*0.25,0)
+        .circle(tab_fasteners[tab_fastener]/2)
+        .extrude(-tab_width, both=True, combine='cut')
+    )
+
+    slot = (
+        cq.Workplane("XY")
+        .rect(slot_width, tab_length*2)
+        .extrude(ring_height/2, both=True)
+    )
+    return tab, slot
 
+@part_cache.persistent
 def bridgeport_spindle_clamp(
         radius,
         ring_height = 10,
         ring_thickness = 8, # Keep this a multiple of nozzle diameter
+        fastener = bolt_mount.default_fastener,
+        tab_fastener = "M3",
         ):
-    bolt_head_diameter = 11
-    bolt_head_thickness = 4.25
-    bolt_shaft_diameter = 6.5
-
     hex_head_side = 18
 
-    hex_head_thickness = bolt_head_thickness+2
-    hex_head = (
-        cq.Workplane("XZ")
-        .rect(hex_head_side, hex_head_side)
-        .circle(bolt_shaft_diameter/2)
-        .extrude(hex_head_thickness)
-        .faces("<Y")
-        .polygon(6, bolt_head_diameter, circumscribed = True)
-        .extrude(-bolt_head_thickness, combine='cut')
-    ).faces(">Z").edges("|Y").fillet(5)
-
+    hex_head_thickness = bolt_mount.mount_thickness(fastener)
+    hex_head = bolt_mount.hex_head_block(
+        fastener, hex_head_side, top_fillet = 0 if fidelity.preview else 5)
 
     hex_head_connection_x = radius + ring_thickness/2
     hex_head_connection_length = 10 + hex_head_thickness
@@ -75,25 +109,7 @@ def bridgeport_spindle_clamp(
         .revolve(360, (0,0,0), (0,1,0))
     ).faces("|Z").chamfer(2)
 
-    slot_width = 4
-    tab_width = slot_width + 8
-    tab_length = 12.5
-    tab = (
-        cq.Workplane("XY")
-        .rect(tab_width, tab_length)
-        .extrude(ring_height/2, both=True)
-        # Hole for fastener
-        .faces(">X").workplane()
-        .lineTo(-tab_length*0.25,0)
-        .circle(3.5/2)
-        .extrude(-tab_width, both=True, combine='cut')
-    )
-
-    slot = (
-        cq.Workplane("XY")
-        .rect(slot_width, tab_length*2)
-        .extrude(ring_height/2, both=True)
-    )
+    tab, slot = tab_and_slot(ring_height, tab_fastener)
 
     tab_slot_offset = (0, -radius - tab_length/2 - ring_thickness/2, 0)
     clip = (
@@ -107,12 +123,16 @@ def bridgeport_spindle_clamp(
         + tab.translate(tab_slot_offset)
     )
 
-    clip = clip.faces(">Y").edges("|Z").fillet(2)
-    clip = clip.faces("<Y").edges("|Z").fillet(2)
+    # Cosmetic fillets
+    if not fidelity.preview:
+        clip = clip.faces(">Y").edges("|Z").fillet(2)
+        clip = clip.faces("<Y").edges("|Z").fillet(2)
 
     clip = clip - slot.translate(tab_slot_offset)
 
     return clip
 
+# If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
 if show_object:
     show_object(bridgeport_spindle_clamp(radius=47/2), options={"color":"blue", "alpha":0.5})
@@ -0,0 +1,247 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Keep worker processes with CadQuery loaded and serve part builds over HTTP,
+so a caller pays for a build instead of for starting OCCT:
+
+    python build_server.py --port 8765 --jobs 4
+    curl -o ring.stl "http://localhost:8765/ring_led_clip.stl?radius=45"
+    curl -o arm.step "http://localhost:8765/arm.step?arm_length=250"
+
+or on a unix socket, which only local users with access to the file reach:
+
+    python build_server.py --socket /tmp/adjustable_arm.sock
+    curl --unix-socket /tmp/adjustable_arm.sock -o knob.3mf http://localhost/knob.3mf
+
+A part is any name in registry.py and the query string gives keyword
+arguments to its generator, their names, types and ranges checked against
+the registry before any worker is involved. GET / lists the registry and
+the formats. Each worker keeps its memoized parts between requests and all
+of them share the part cache, so parts built before come back without
+touching the kernel. Recent results are also kept in memory by the server,
+answered with X-Cache: hit. Identical requests arriving together share a
+single build. A worker that crashes is replaced with a fresh pool, failing
+only the requests in flight.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import http.server
+import importlib
+import json
+import os
+import socketserver
+import tempfile
+import threading
+import time
+import urllib.parse
+import export_parts
+import registry
+
+# Finished builds kept in memory by the server
+memory_limit = 64
+
+# Builds a worker serves before it is replaced by a fresh one. Workers
+# memoize every part they build, without limit, so this is what bounds their
+# memory. Replacing workers needs the spawn start method.
+worker_tasks = 100
+
+content_types = {
+    "stl": "model/stl",
+    "step": "model/step",
+    "3mf": "model/3mf",
+    }
+
+# Worker process start up: load the kernel and every generator module before
+# the first request needs them
+def warm_up():
+    import cadquery
+    import tessellation
+    for module, function, kwargs in registry.generators.values():
+        importlib.import_module(module)
+    return os.getpid()
+
+# Build a part and export it in one format, returning the file's bytes
+def render(name, arguments, export_format):
+    start = time.perf_counter()
+    part = registry.build_printed(name, **arguments)
+    with tempfile.TemporaryDirectory() as directory:
+        path, = export_parts.write(part, directory, name, [export_format])
+        with open(path, "rb") as stream:
+            data = stream.read()
+    return data, time.perf_counter() - start
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    # Unix socket peers have no address to log
+    def address_string(self):
+        return self.client_address[0] if self.client_address else "unix"
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        if url.path == "/":
+            self.reply(200, json.dumps({
+                "parts": registry.catalog(),
+                "formats": export_parts.formats,
+                }).encode(), "application/json")
+            return
+
+        name, _, export_format = url.path.lstrip("/").rpartition(".")
+        if name not in registry.generators or export_format not in export_parts.formats:
+            self.reply(404, "unknown part or format: {}\n".format(url.path).encode())
+            return
+        arguments = {
+            key: registry.parse_argument(name, key, value) for key, value in urllib.parse.parse_qsl(url.query)}
+        try:
+            registry.validate(name, arguments)
+        except ValueError as error:
+            self.reply(400, "{}\n".format(error).encode())
+            return
+
+        future, hit = self.server.submit(name, arguments, export_format)
+        try:
+            data, seconds = future.result()
+        except (TypeError, ValueError) as error:
+            self.server.forget(future)
+            self.reply(400, "{}\n".format(error).encode())
+            return
+        except concurrent.futures.BrokenExecutor as error:
+            self.server.forget(future)
+            self.server.replace_pool(future.pool)
+            self.reply(500, "worker crashed, workers restarted: {}\n".format(error).encode())
+            return
+        except Exception as error:
+            self.server.forget(future)
+            self.reply(500, "{}: {}\n".format(type(error).__name__, error).encode())
+            return
+        self.reply(200, data, content_types[export_format], {
+            "X-Cache": "hit" if hit else "miss",
+            "X-Build-Seconds": "{:.3f}".format(seconds),
+            })
+
+    def reply(self, status, body, content_type = "text/plain", headers = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+# Server state shared by the request threads: the worker pool, and builds by
+# (name, arguments, format) in least recently used order, finished or not.
+class BuildServer:
+    daemon_threads = True
+
+    def start_workers(self, workers):
+        self.workers = workers
+        self.pool = self.new_pool()
+        self.builds = collections.OrderedDict()
+        self.lock = threading.Lock()
+        return [self.pool.submit(warm_up) for _ in range(workers)]
+
+    def new_pool(self):
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, initializer=warm_up, max_tasks_per_child=worker_tasks)
+
+    # A crashed worker breaks the whole pool and every later submit would
+    # fail, so start a new one. Requests failing on the same crash replace
+    # it only once.
+    def replace_pool(self, broken):
+        with self.lock:
+            if self.pool is broken:
+                self.pool = self.new_pool()
+        broken.shutdown(wait=False)
+
+    # The build for a request and whether it was already there
+    def submit(self, name, arguments, export_format):
+        key = (name, tuple(sorted(arguments.items())), export_format)
+        with self.lock:
+            if key in self.builds:
+                self.builds.move_to_end(key)
+                return self.builds[key], True
+            try:
+                future = self.pool.submit(render, name, arguments, export_format)
+            except concurrent.futures.BrokenExecutor:
+                self.pool.shutdown(wait=False)
+                self.pool = self.new_pool()
+                future = self.pool.submit(render, name, arguments, export_format)
+            future.pool = self.pool
+            self.builds[key] = future
+            while len(self.builds) > memory_limit:
+                self.builds.popitem(last=False)
+            return future, False
+
+    # Drop a failed build so the request can be retried
+    def forget(self, future):
+        with self.lock:
+            for key, known in list(self.builds.items()):
+                if known is future:
+                    del self.builds[key]
+
+    def server_close(self):
+        super().server_close()
+        # Binding the address can fail before the workers are started
+        if hasattr(self, "pool"):
+            self.pool.shutdown()
+
+class HttpBuildServer(BuildServer, http.server.ThreadingHTTPServer):
+    pass
+
+class UnixBuildServer(BuildServer, socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    pass
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--socket", help="listen on this unix socket instead of TCP")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    if args.socket:
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server = UnixBuildServer(args.socket, Handler)
+        where = args.socket
+    else:
+        server = HttpBuildServer((args.host, args.port), Handler)
+        where = "http://{}:{}/".format(args.host, args.port)
+
+    start = time.perf_counter()
+    workers = [future.result() for future in server.start_workers(args.jobs)]
+    print("{} workers ready in {:.2f}s, serving on {}".format(
+        len(set(workers)), time.perf_counter() - start, where), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.socket:
+            os.unlink(args.socket)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Estimate how hard the arm holds and how much it bends, for whole grids of
+candidate designs at once and without building any CAD geometry:
+
+    python clamp_model.py --axis wedge_angle=15:35:1 --axis arm_length=100:300:10 --axis ball_surround_thickness=4:7:0.5
+
+Turning the knob puts the wedge bolt in tension, torque over nut factor times
+diameter. Each arm's wedge block turns that tension into a push along its
+actuating rod: the wedge face is at wedge_angle, so without friction the
+push is tension times its tangent, and friction on the wedge face and against
+the mid joint wall takes away from that. The rod presses its end ball into
+the socket, and the same bolt tension clamps the flat faces of the two mid
+joints together, which gives the holding torque of each joint.
+
+Each arm half is a hollow square tube, arm_side_outer outside and
+arm_side_inner inside, loaded as a cantilever at its end. Its wall thickness
+follows from ball_surround_thickness and minimum_gap.
+
+Friction, nut factor and modulus are rough values for PLA on PLA with a steel
+bolt. Treat the results as a way to compare and rank designs, not to predict
+absolute numbers.
+"""
+
+import argparse
+import csv
+import sys
+import time
+import numpy as np
+import adjustable_arm
+import arm_sweep
+
+# PLA sliding on PLA
+friction = 0.3
+
+# Dry steel bolt in a hex nut
+nut_factor = 0.2
+
+# Young's modulus of printed PLA, N/mm^2
+modulus = 3500
+
+# Hand tight on the knob wings, N mm
+knob_torque = 1500
+
+# Load hanging off the end ball, N
+end_load = 10
+
+# Derived values the model needs. They are plain arithmetic on the parameters
+# so they evaluate on whole arrays.
+derived_names = [
+    "ball_surround_outer_radius",
+    "rod_side",
+    "arm_side_inner",
+    "mid_joint_radius",
+    "wedge_diameter",
+    "mid_joint_clearance_size",
+    ]
+
+# Every combination of the axes as flat arrays, alongside the derived values
+def design_grid(axes, fixed = None):
+    adjustable_arm.checked_parameters(dict(fixed or {}, **{name: 0 for name in axes}))
+    values = dict(adjustable_arm.default_parameters, **(fixed or {}))
+    mesh = np.meshgrid(*(np.asarray(axes[name], dtype=float) for name in axes), indexing="ij")
+    values.update((name, column.reshape(-1)) for name, column in zip(axes, mesh))
+    for name in derived_names:
+        values[name] = adjustable_arm.call_part(adjustable_arm.derived_values[name], values)
+    count = mesh[0].size if mesh else 1
+    return {name: np.broadcast_to(np.asarray(value, dtype=float), (count,)) for name, value in values.items()
+            if name in adjustable_arm.default_parameters or name in derived_names}
+
+# Mean friction radius of an annular face, uniform pressure
+def friction_radius(outer, inner):
+    return 2 / 3 * (outer**3 - inner**3) / (outer**2 - inner**2)
+
+# Forces and holding torques from the knob torque, N and N mm. A wedge with
+# friction past its self locking angle pushes nothing, rod_force is zero there.
+def clamp(values, torque = knob_torque, friction = friction, nut_factor = nut_factor):
+    angle = np.radians(values["wedge_angle"])
+    bolt_force = torque / (nut_factor * values["fastener_diameter_tight"])
+
+    # Upper wedge pressed down by the bolt, held sideways by the mid joint wall
+    # with friction on both the wedge face and the wall
+    sideways = np.sin(angle) - friction * np.cos(angle)
+    normal = bolt_force / (np.cos(angle) + friction * np.sin(angle) + friction * np.maximum(sideways, 0))
+    rod_force = np.maximum(normal * sideways, 0)
+
+    # Friction where the rod pushes on the ball and where the socket pushes back
+    ball_torque = 2 * friction * rod_force * values["ball_diameter"] / 2
+    mid_torque = friction * bolt_force * friction_radius(
+        values["mid_joint_radius"], values["mid_joint_clearance_size"] / 2)
+    return {
+        "bolt_force": bolt_force,
+        "rod_force": rod_force,
+        "ball_torque": ball_torque,
+        "mid_torque": mid_torque,
+        }
+
+# Bending of each arm half as a cantilever with the load at its end, and the
+# rod squeezed by the clamping force, mm
+def stiffness(values, rod_force, load = end_load, modulus = modulus):
+    outer, inner, length = values["arm_side_outer"], values["arm_side_inner"], values["arm_length"]
+    inertia = (outer**4 - inner**4) / 12
+    return {
+        "wall": (outer - inner) / 2,
+        "deflection": load * length**3 / (3 * modulus * inertia),
+        "rod_stress": rod_force / values["rod_side"]**2,
+        "rod_shortening": rod_force * length / (modulus * values["rod_side"]**2),
+        }
+
+# Everything the model computes for every design in the grid. slip_load is the
+# end load the weaker joint gives way under with the arm stretched out flat,
+# the base ball carrying twice the lever of the mid joint.
+def evaluate(axes, fixed = None, torque = knob_torque, load = end_load, friction = friction):
+    values = design_grid(axes, fixed)
+    results = clamp(values, torque, friction)
+    results.update(stiffness(values, results["rod_force"], load))
+    results["slip_load"] = np.minimum(
+        results["ball_torque"] / (2 * values["arm_length"]),
+        results["mid_torque"] / values["arm_length"])
+    results["travel_left"] = values["wedge_range_horizontal"] - results["rod_shortening"]
+    return {name: values[name] for name in axes}, results
+
+# "name=value" arm parameter override
+def parse_parameter(text):
+    name, _, value = text.partition("=")
+    return name, float(value)
+
+def write_csv(stream, designs, results):
+    writer = csv.writer(stream)
+    writer.writerow(list(designs) + list(results))
+    columns = list(designs.values()) + list(results.values())
+    writer.writerows(np.stack(columns, axis=1).round(4).tolist())
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("-a", "--axis", action="append", default=[], type=arm_sweep.parse_axis,
+                        help="parameter as name=start:stop:step or name=a,b,c, may be repeated")
+    parser.add_argument("-p", "--parameter", dest="parameters", action="append", default=[],
+                        type=parse_parameter, help="fixed arm parameter as name=value")
+    parser.add_argument("--torque", type=float, default=knob_torque, help="knob torque in N mm")
+    parser.add_argument("--load", type=float, default=end_load, help="end load in N")
+    parser.add_argument("--friction", type=float, default=friction, help="friction coefficient")
+    parser.add_argument("--max-deflection", type=float, help="drop designs bending more than this, mm")
+    parser.add_argument("-n", "--best", type=int, default=10, help="designs to list, by slip load")
+    parser.add_argument("-o", "--output", help="write every design as CSV to this file, - for stdout")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    designs, results = evaluate(dict(args.axis), dict(args.parameters), args.torque, args.load, args.friction)
+    elapsed = time.perf_counter() - start
+    count = len(results["slip_load"])
+    print("Evaluated {} designs in {:.1f}ms".format(count, elapsed * 1000), file=sys.stderr)
+
+    if args.output == "-":
+        write_csv(sys.stdout, designs, results)
+        return
+    if args.output:
+        with open(args.output, "w", newline="") as stream:
+            write_csv(stream, designs, results)
+
+    usable = (results["rod_force"] > 0) & (results["travel_left"] > 0)
+    if args.max_deflection is not None:
+        usable &= results["deflection"] <= args.max_deflection
+    print("{} of {} designs clamp{}".format(
+        usable.sum(), count, "" if args.max_deflection is None else " within the deflection limit"))
+    for index in sorted(np.flatnonzero(usable), key=lambda i: -results["slip_load"][i])[:args.best]:
+        print("  {}: slip at {:.1f}N, ball {:.0f}Nmm, mid {:.0f}Nmm, rod {:.0f}N, wall {:.2f}mm, bends {:.2f}mm".format(
+            ", ".join("{}={:g}".format(name, designs[name][index]) for name in designs) or "defaults",
+            results["slip_load"][index], results["ball_torque"][index], results["mid_torque"][index],
+            results["rod_force"][index], results["wall"][index], results["deflection"][index]))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Measure the gaps the arm mechanism depends on. Parts are placed in their
+assembled pose, and for every mating pair this reports the smallest distance
+between surfaces and the volume where the two overlap:
+
+    python clearance_check.py
+    python clearance_check.py --axis minimum_gap=0.1,0.15,0.2 --axis ball_diameter=20:30:5
+
+printable_arm is printed in place as three separate solids: the end ball, the
+actuating rod and the arm body around them. Their gaps come from minimum_gap
+and tie_gap. If a gap closes, the solids fuse and the pair is reported as
+fused. The wedge block and the knob are separate prints that sit in the mid
+joint, where the wedge has to touch the rod and the knob has to touch the
+wedge.
+
+Surfaces are sampled at a fixed spacing and indexed with a KD-tree. The
+nearest sampled triangles to each sample on the other part are then
+measured exactly. Points are tested for being inside a part with the
+mesh_check BVH. Accuracy is bounded by the mesh tolerance of the chosen
+level of detail, 0.05mm at print.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+import numpy as np
+from scipy.spatial import cKDTree
+import adjustable_arm
+import arm_sweep
+import mesh_check
+import tessellation
+
+# Pairs of parts as (first, second, kind). Gaps must stay open, contacts must
+# touch without overlapping.
+mating_pairs = [
+    ("end_ball", "body", "gap"),
+    ("end_ball", "rod", "gap"),
+    ("rod", "body", "gap"),
+    ("wedge_block", "body", "gap"),
+    ("knob", "body", "gap"),
+    ("knob", "rod", "gap"),
+    ("wedge_block", "rod", "contact"),
+    ("knob", "wedge_block", "contact"),
+    ]
+
+# Overlap smaller than this many cubic millimeters is meshing noise where two
+# faces touch
+overlap_tolerance = 0.5
+
+# Points less than this far inside another part are on a face it touches. It
+# matches the mesh tolerance at print level of detail.
+contact_tolerance = tessellation.levels["print"][0]
+
+# Parts in assembled pose by name. printable_arm is split into its separate
+# solids, which are told apart by how close their centers are to the end ball
+# and the actuating rod built on their own.
+def assembled_parts(params = None):
+    values = adjustable_arm.arm_values(params)
+    built = adjustable_arm.build_arm(params, ["printable_arm", "knob", "wedge_block_no_hex"])
+    parts = {"knob": built["knob"].val(), "wedge_block": built["wedge_block_no_hex"].val()}
+
+    solids = built["printable_arm"].val().Solids()
+    for name, reference in [
+            ("end_ball", adjustable_arm.end_ball_assembly),
+            ("rod", adjustable_arm.actuating_rod)]:
+        center = adjustable_arm.call_part(reference, values).val().Center()
+        if len(solids) > 1:
+            nearest = min(solids, key=lambda solid: (solid.Center() - center).Length)
+            parts[name] = nearest
+            solids = [solid for solid in solids if solid is not nearest]
+    parts["body"] = solids[0]
+    return parts
+
+# Points spread over the surface about spacing apart, with the triangle each
+# one lies on. Vertices are included so small triangles are never skipped.
+def sample_surface(mesh, spacing, seed = 0):
+    corners = mesh.vertices[mesh.triangles]
+    areas = np.linalg.norm(np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0]), axis=1) / 2
+    counts = np.ceil(areas / spacing**2).astype(np.int64)
+    owners = np.repeat(np.arange(len(corners)), counts)
+    u, v = np.random.default_rng(seed).random((2, len(owners)))
+    flip = u + v > 1
+    u[flip], v[flip] = 1 - u[flip], 1 - v[flip]
+    chosen = corners[owners]
+    points = chosen[:, 0] + u[:, None] * (chosen[:, 1] - chosen[:, 0]) + v[:, None] * (chosen[:, 2] - chosen[:, 0])
+
+    vertex_owners = np.repeat(np.arange(len(corners)), 3)
+    return (
+        np.concatenate([points, corners.reshape(-1, 3)]),
+        np.concatenate([owners, vertex_owners]))
+
+def segment_distance(points, start, end):
+    along = end - start
+    length = np.maximum(np.einsum("ij,ij->i", along, along), 1e-300)
+    position = np.clip(np.einsum("ij,ij->i", points - start, along) / length, 0, 1)
+    return np.linalg.norm(points - start - position[:, None] * along, axis=1)
+
+# Exact distance from each point to its triangle a, b, c: straight down to the
+# plane when the foot lands inside the triangle, otherwise to the nearest edge.
+def triangle_distance(points, a, b, c):
+    normal = np.cross(b - a, c - a)
+    normal /= np.maximum(np.linalg.norm(normal, axis=1, keepdims=True), 1e-300)
+    height = np.einsum("ij,ij->i", points - a, normal)
+    foot = points - height[:, None] * normal
+    inside = np.ones(len(points), dtype=bool)
+    for start, end in [(a, b), (b, c), (c, a)]:
+        inside &= np.einsum("ij,ij->i", np.cross(end - start, foot - start), normal) >= 0
+    edges = np.minimum.reduce([
+        segment_distance(points, a, b),
+        segment_distance(points, b, c),
+        segment_distance(points, c, a)])
+    return np.where(inside, np.abs(height), edges)
+
+# Distance from each point to the surface of a part, measured exactly against
+# the triangles under the part's few nearest samples
+def surface_distance(points, tree, mesh, owners, neighbours = 8):
+    _, nearest = tree.query(points, k=neighbours)
+    corners = mesh.vertices[mesh.triangles[owners[nearest.reshape(-1)]]]
+    distance = triangle_distance(np.repeat(points, neighbours, axis=0), corners[:, 0], corners[:, 1], corners[:, 2])
+    return distance.reshape(-1, neighbours).min(axis=1)
+
+# Smallest distance from the samples of one part to the surface of another,
+# and where it is. Only samples within reach of the other part's samples are
+# looked at, or every sample when none are, and only those that could be
+# nearest are measured exactly. Also returns each sample's distance to the
+# nearest sample of the other part, or inf beyond reach.
+def nearest_approach(points, tree, mesh, owners, spacing, reach):
+    rough, _ = tree.query(points, distance_upper_bound=reach)
+    if np.isinf(rough).all():
+        rough, _ = tree.query(points)
+    candidates = np.flatnonzero(rough <= rough.min() + 2 * spacing)
+    distance = surface_distance(points[candidates], tree, mesh, owners)
+    best = distance.argmin()
+    return distance[best], points[candidates[best]], rough
+
+# Samples of one part inside another by more than the contact tolerance, so
+# faces lying on each other do not count
+def buried(points, mesh, tree, owners):
+    if not len(points):
+        return points
+    points = points[mesh_check.inside(mesh, points)]
+    return points[surface_distance(points, tree, mesh, owners) > contact_tolerance]
+
+# Volume inside both meshes, counted on a grid over the given points buried in
+# the other part. When one part sits entirely inside the other, the whole of
+# it is counted instead.
+def overlap_volume(first, second, region, spacing):
+    if mesh_check.inside(second, first.vertices[:1]).any():
+        region = np.concatenate([region, first.vertices])
+    if mesh_check.inside(first, second.vertices[:1]).any():
+        region = np.concatenate([region, second.vertices])
+    if not len(region):
+        return 0.0
+
+    low, high = region.min(axis=0) - spacing, region.max(axis=0) + spacing
+    axes = [np.arange(low[i], high[i] + spacing, spacing) for i in range(3)]
+    grid = np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, 3)
+    grid = grid[mesh_check.inside(first, grid)]
+    grid = grid[mesh_check.inside(second, grid)]
+    return len(grid) * spacing**3
+
+# One row per mating pair: (first, second, kind, distance, location, overlap).
+# Surfaces can only cross where they come within a sample spacing of each
+# other, so only samples that close are looked at for overlap.
+def check_variant(params = None, level = "print", spacing = 0.5, reach = 2):
+    return params, check_parts(assembled_parts(params), level, spacing, reach)
+
+# (first, second, kind, distance, location, overlap) for each mating pair of
+# parts given by name as from assembled_parts()
+def check_parts(parts, level = "print", spacing = 0.5, reach = 2):
+    meshes, samples, trees = {}, {}, {}
+    for name, part in parts.items():
+        meshes[name] = tessellation.weld(tessellation.mesh(part, level))[0]
+        samples[name] = sample_surface(meshes[name], spacing)
+        trees[name] = cKDTree(samples[name][0])
+
+    rows = []
+    for first, second, kind in mating_pairs:
+        if first not in parts or second not in parts:
+            rows.append((first, second, kind, 0.0, None, float("nan")))
+            continue
+        (first_points, first_owners), (second_points, second_owners) = samples[first], samples[second]
+        first_distance, first_location, first_rough = nearest_approach(
+            first_points, trees[second], meshes[second], second_owners, spacing, reach)
+        second_distance, second_location, second_rough = nearest_approach(
+            second_points, trees[first], meshes[first], first_owners, spacing, reach)
+        distance, location = min((first_distance, first_location), (second_distance, second_location),
+                                 key=lambda found: found[0])
+
+        crossing = spacing if distance < spacing else -1
+        region = np.concatenate([
+            buried(first_points[first_rough <= crossing], meshes[second], trees[second], second_owners),
+            buried(second_points[second_rough <= crossing], meshes[first], trees[first], first_owners)])
+        overlap = overlap_volume(meshes[first], meshes[second], region, spacing / 2)
+        rows.append((first, second, kind, distance, location, overlap))
+    return rows
+
+# A gap has to stay open, parts in contact must touch without overlapping
+def acceptable(kind, distance, overlap):
+    if kind == "gap":
+        return distance > 0 and overlap <= overlap_tolerance
+    return distance <= contact_tolerance and overlap <= overlap_tolerance
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("-a", "--axis", action="append", default=[], type=arm_sweep.parse_axis,
+                        help="swept parameter as name=start:stop:step or name=a,b,c")
+    parser.add_argument("--level", default="print", choices=list(tessellation.levels), help="mesh level of detail")
+    parser.add_argument("--spacing", type=float, default=0.5, help="surface sample spacing in mm")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    all_variants = list(arm_sweep.variants(dict(args.axis)))
+    failures = 0
+    with concurrent.futures.ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(check_variant, params, args.level, args.spacing) for params in all_variants]
+        for future in concurrent.futures.as_completed(futures):
+            params, rows = future.result()
+            print(arm_sweep.variant_stem("arm", params))
+            for first, second, kind, distance, location, overlap in rows:
+                ok = location is not None and acceptable(kind, distance, overlap)
+                failures += not ok
+                print("  {:<24} {:<7} {:<4} {}".format(
+                    first + "/" + second, kind, "ok" if ok else "FAIL",
+                    "fused" if location is None else "{:.3f}mm at ({:.1f}, {:.1f}, {:.1f})  overlap {:.2f}mm3".format(
+                        distance, *location, overlap)), flush=True)
+    print("Checked {} variants in {:.2f}s".format(len(all_variants), time.perf_counter() - start))
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
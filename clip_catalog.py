@@ -0,0 +1,91 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Generate bolt clips for a whole set of extrusion profiles and fasteners in one
+batch, for example every profile with M5 and M6 bolts:
+
+    python clip_catalog.py --fastener M5 --fastener M6 --output clips
+
+Every combination of profile and fastener is built on a pool of worker
+processes and exported as soon as it is done. Profiles and fasteners are read
+through the registry, so choices are checked before CadQuery is loaded.
+"""
+
+import argparse
+import concurrent.futures
+import itertools
+import os
+import time
+import export_parts
+import registry
+
+profiles = list(registry.constant("extrusion_clip", "profiles"))
+fasteners = list(registry.constant("bolt_mount", "fasteners"))
+
+def variants(profile_names = None, fastener_names = None):
+    return [{"profile": profile, "fastener": fastener}
+            for profile, fastener in itertools.product(profile_names or profiles, fastener_names or fasteners)]
+
+# File name for a clip, fasteners like 1/4-20 written without the slash
+def clip_stem(params):
+    return "hex_bolt_clip-{}-{}".format(params["profile"], params["fastener"].replace("/", "_"))
+
+def build_variant(params, output, export_formats):
+    start = time.perf_counter()
+    part = registry.build("hex_bolt_clip", **params)
+    paths = export_parts.write(part, output, clip_stem(params), export_formats)
+    return params, paths, time.perf_counter() - start
+
+# Yield (params, paths, seconds) for each clip as soon as it is written
+def catalog(output, profile_names = None, fastener_names = None, export_formats = ("stl",), workers = None):
+    all_variants = variants(profile_names, fastener_names)
+    os.makedirs(output, exist_ok=True)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(build_variant, params, output, export_formats) for params in all_variants]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("-p", "--profile", dest="profiles", action="append", choices=profiles,
+                        help="extrusion profile, may be repeated, default all")
+    parser.add_argument("-b", "--fastener", dest="fasteners", action="append", choices=fasteners,
+                        help="bolt, may be repeated, default all")
+    parser.add_argument("-o", "--output", default="clips", help="output directory")
+    parser.add_argument("-f", "--format", dest="formats", action="append", choices=export_parts.formats,
+                        help="file format, may be repeated, default stl")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    count = 0
+    for params, paths, seconds in catalog(
+            args.output, args.profiles, args.fasteners, args.formats or ["stl"], args.jobs):
+        count += 1
+        print("{:<36} {:7.2f}s  {}".format(clip_stem(params), seconds, " ".join(paths)))
+    print("Built {} clips in {:.2f}s".format(count, time.perf_counter() - start))
+
+if __name__ == "__main__":
+    main()
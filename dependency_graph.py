@@ -0,0 +1,125 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Explicit graph of named values, each computed by a function whose argument
+names are the values it depends on. Values are computed on demand and kept
+until an input upstream of them changes, so changing one input recomputes
+only what is downstream of it.
+
+    python dependency_graph.py minimum_gap
+
+lists everything in the adjustable arm that depends on minimum_gap.
+"""
+
+import argparse
+import inspect
+
+class DependencyGraph:
+    def __init__(self):
+        self.inputs = {}
+        self.functions = {}
+        self.edges = {}
+        self.computed = {}
+
+    def input(self, name, value):
+        self.inputs[name] = value
+        self.edges[name] = []
+
+    # Add a value computed by function from the values named by its
+    # arguments. Extra names in also_depends_on are used internally by the
+    # function without being passed in.
+    def node(self, name, function, also_depends_on = ()):
+        self.functions[name] = function
+        self.edges[name] = list(inspect.signature(function).parameters) + list(also_depends_on)
+
+    def __contains__(self, name):
+        return name in self.edges
+
+    def __getitem__(self, name):
+        if name in self.inputs:
+            return self.inputs[name]
+        if name not in self.computed:
+            function = self.functions[name]
+            self.computed[name] = function(**{
+                argument: self[argument]
+                for argument in inspect.signature(function).parameters})
+        return self.computed[name]
+
+    # Change inputs, forgetting every computed value downstream of a change
+    def set(self, **changes):
+        for name, value in changes.items():
+            if name not in self.inputs:
+                raise KeyError("{} is not an input".format(name))
+            if self.inputs[name] == value:
+                continue
+            self.inputs[name] = value
+            for dependent in self.dependents(name):
+                self.computed.pop(dependent, None)
+
+    def dependencies(self, name):
+        found = set()
+        pending = [name]
+        while pending:
+            for dependency in self.edges[pending.pop()]:
+                if dependency not in found:
+                    found.add(dependency)
+                    pending.append(dependency)
+        return found
+
+    def dependents(self, name):
+        found = set()
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            for node, dependencies in self.edges.items():
+                if current in dependencies and node not in found:
+                    found.add(node)
+                    pending.append(node)
+        return found
+
+    # Computed values that will be recomputed on next access
+    def stale(self):
+        return set(self.functions) - set(self.computed)
+
+def main():
+    import adjustable_arm
+
+    parser = argparse.ArgumentParser(description="Query the adjustable arm dependency graph")
+    parser.add_argument("names", nargs="+", help="inputs, derived values or parts")
+    parser.add_argument("-u", "--upstream", action="store_true",
+                        help="list what the names depend on instead of what depends on them")
+    args = parser.parse_args()
+
+    graph = adjustable_arm.arm_graph()
+    for name in args.names:
+        related = graph.dependencies(name) if args.upstream else graph.dependents(name)
+        values = sorted(n for n in related if n not in adjustable_arm.part_functions)
+        parts = sorted(n for n in related if n in adjustable_arm.part_functions)
+        print("{} {}:".format(name, "depends on" if args.upstream else "is used by"))
+        print("  values: " + ", ".join(values))
+        print("  parts:  " + ", ".join(parts))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Decide where part files send their objects for display, so they can be
+imported from plain Python (worker processes, servers, tests) without side
+effects.
+
+CQ-Editor provides show_object to the script it runs, which is used as-is.
+A part file run directly with python goes to the sink set here, or named by
+the ADJUSTABLE_ARM_DISPLAY environment variable as "module.function", for
+example "ocp_vscode.show_object". An imported part file displays nothing and
+builds nothing.
+"""
+
+import importlib
+import os
+
+sink = None
+
+def set_sink(function):
+    global sink
+    sink = function
+
+def environment_sink():
+    name = os.environ.get("ADJUSTABLE_ARM_DISPLAY")
+    if not name:
+        return None
+    module, function = name.rsplit(".", 1)
+    return getattr(importlib.import_module(module), function)
+
+# Part files call this with their globals() and only build display objects
+# when something is returned.
+def sink_for(namespace):
+    if "show_object" in namespace:
+        return namespace["show_object"]
+    if namespace.get("__name__") == "__main__":
+        return sink or environment_sink()
+    return None
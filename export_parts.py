@@ -0,0 +1,144 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Build every part in the repository in parallel and export each one as STL,
+STEP and 3MF, producing a release set without going through CQ-Editor.
+
+    python export_parts.py --output release --jobs 32
+
+A catalog of variants is built the same way, one file per combination of
+the varied arguments, for example a clip for every stocked LED ring:
+
+    python export_parts.py ring_led_clip --vary radius=20,25,30,35,40,45,50,60
+
+Parts of the arm are written in their print orientation, the same as
+print_estimate.py and plate_export.py see them, so the release set is ready
+for the slicer. Each worker process hosts its own OCCT kernel. Parts are
+exported as soon as their worker finishes so the slowest part does not hold up
+the rest.
+"""
+
+import argparse
+import concurrent.futures
+import itertools
+import os
+import time
+import fidelity
+import registry
+
+formats = ["stl", "step", "3mf"]
+
+# Write part to output/stem.<format> for each format, returning the paths
+def write(part, output, stem, export_formats):
+    import cadquery as cq
+    import tessellation
+
+    paths = []
+    for export_format in export_formats:
+        path = os.path.join(output, "{}.{}".format(stem, export_format))
+        if export_format == "stl":
+            tessellation.write_stl(tessellation.mesh(part), path)
+        elif export_format == "3mf":
+            tessellation.write_3mf(path, [(stem, tessellation.mesh(part))], [(1, 0, 0)])
+        else:
+            cq.exporters.export(part, path)
+        paths.append(path)
+    return paths
+
+# File name for a part built with overrides, fasteners like 1/4-20 written
+# without the slash
+def variant_stem(name, overrides = None):
+    return "-".join([name] + [
+        "{}={}".format(key, value).replace("/", "_") for key, value in sorted((overrides or {}).items())])
+
+def export(name, output, export_formats, overrides = None):
+    start = time.perf_counter()
+    part = registry.build_printed(name, **(overrides or {}))
+    paths = write(part, output, variant_stem(name, overrides), export_formats)
+    return name, paths, time.perf_counter() - start
+
+# Export the (name, overrides) jobs on a pool of worker processes, yielding
+# (name, paths, seconds) for each part as soon as it is written. Workers get
+# this process's fidelity setting explicitly, since spawned workers do not
+# inherit module state.
+def export_all(jobs, output, export_formats = formats, workers = None):
+    os.makedirs(output, exist_ok=True)
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=fidelity.set_preview, initargs=(fidelity.preview,)) as pool:
+        futures = [
+            pool.submit(export, name, output, export_formats, overrides)
+            for name, overrides in jobs]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+# "name=a,b,c" argument and its values as text, converted for each part
+def parse_vary(text):
+    name, _, values = text.partition("=")
+    return name, values.split(",")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("parts", nargs="*", help="parts to export, default all")
+    parser.add_argument("-o", "--output", default="export", help="output directory")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("-f", "--format", dest="formats", action="append", choices=formats,
+                        help="file format, may be repeated, default all")
+    parser.add_argument("-v", "--vary", action="append", default=[], type=parse_vary,
+                        help="build every value of an argument as name=a,b,c, may be repeated")
+    parser.add_argument("-l", "--list", action="store_true", help="list part names and exit")
+    parser.add_argument("--preview", action="store_true", help="skip cosmetic details, coarse meshes")
+    args = parser.parse_args()
+
+    if args.preview:
+        fidelity.set_preview(True)
+
+    if args.list:
+        for description in registry.catalog():
+            print("{:<28} {:<13} {}".format(description["name"], description["role"], description["interface"]))
+        return
+
+    unknown = [name for name in args.parts if name not in registry.generators]
+    if unknown:
+        parser.error("unknown parts: " + ", ".join(unknown))
+
+    names = list(args.parts or registry.generators)
+    keys = [key for key, values in args.vary]
+    variants = [dict(zip(keys, combination)) for combination in itertools.product(*(values for key, values in args.vary))]
+    jobs = [
+        (name, {key: registry.parse_argument(name, key, value) for key, value in overrides.items()} or None)
+        for name in names for overrides in variants]
+    for name, overrides in jobs:
+        try:
+            registry.validate(name, overrides or {})
+        except ValueError as error:
+            parser.error(error)
+
+    start = time.perf_counter()
+    for name, paths, seconds in export_all(jobs, args.output, args.formats or formats, args.jobs):
+        print("{:<28} {:7.2f}s  {}".format(name, seconds, " ".join(paths)))
+    print("Exported {} parts in {:.2f}s".format(len(jobs), time.perf_counter() - start))
+
+if __name__ == "__main__":
+    main()
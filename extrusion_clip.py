@@ -23,20 +23,33 @@ SOFTWARE.
 """
 
 """
-Clip a 1/4"-20 bolt to an aluminum extrusion beam, target is the 30mm x 30mm
-beam used by Prusa Resarch for MK3 and MK4 line of printers.
+Clip a 1/4"-20 bolt to an aluminum extrusion beam, originally targeting the
+30mm x 30mm beam used by Prusa Resarch for MK3 and MK4 line of printers.
 
 https://github.com/prusa3d/Original-Prusa-i3/blob/MK3S/Frame/Extrusions.pdf
+
+Other common beams are in the profiles table, see clip_catalog.py to build
+clips for all of them at once.
 """
 
 import math
+import bolt_mount
 import cadquery as cq
-
-# All coordinates below are drawn relative to the center of extrusion beam
-# as (0,0) so most dimensions are divided in half for easier coordinate math.
-extrusion_size_half = 15 # 30mm x 30mm extrusion but coordinate
-extrusion_channel_entrance_half = 4
-extrusion_channel_lip = 2
+import display
+import part_cache
+
+# Beam profiles: side of the square beam, width of the channel opening and
+# thickness of the lips either side of it, in millimeters. 2020, 3030 and 4040
+# are nominal sizes for the common B-type slot 6, 8 and 10 beams, prusa_30 is
+# the 30mm x 30mm beam of the MK3 and MK4 frames the clip was designed on.
+profiles = {
+    "2020": {"size": 20, "channel_entrance": 6.2, "channel_lip": 1.8},
+    "3030": {"size": 30, "channel_entrance": 8.2, "channel_lip": 2.2},
+    "4040": {"size": 40, "channel_entrance": 10.2, "channel_lip": 3.5},
+    "prusa_30": {"size": 30, "channel_entrance": 8, "channel_lip": 2},
+    }
+
+default_profile = "prusa_30"
 
 # Perimeter thickness should be:
 # 1. Thin enough to be flexible for installation
@@ -47,91 +60,71 @@ clip_length = 30
 
 extra_gap = 0.2
 
-# Profile for the clip itself. Top side hooks into the extrusion rail. Bottom
-# has only a lip because hooks on both sides would be impossible to install.
-# Bottom also has a small protrusion that I hope helps with uninstallation
-perimeter_inner = extrusion_size_half
-perimeter_outer = perimeter_inner + perimeter_thickness
+hook_size = 1
+lever_size = 5
 
-lip_addon_x = extrusion_channel_entrance_half - perimeter_thickness/2
+def profile_dimensions(profile):
+    if profile not in profiles:
+        raise ValueError("Unknown extrusion profile: {}".format(profile))
+    return profiles[profile]
 
-def perimeter_feature(length):
+# Profile for the clip itself. Top side hooks into the extrusion rail. Bottom
+# has only a lip because hooks on both sides would be impossible to install.
+# Bottom also has a small protrusion that I hope helps with uninstallation.
+#
+# The profile is drawn around the center of the extrusion beam as (0,0), so
+# most dimensions are divided in half for easier coordinate math. It is made
+# of strokes perimeter_thickness wide with rounded ends, each given as
+# (start, direction in degrees, length).
+def clip_strokes(profile):
+    dimensions = profile_dimensions(profile)
+    size_half = dimensions["size"]/2
+    entrance_half = dimensions["channel_entrance"]/2
+    lip = dimensions["channel_lip"]
+    rail_x = entrance_half - perimeter_thickness/2
+    edge_y = size_half + extra_gap + perimeter_thickness/2
+    return [
+        # Side opposite the channel, bolt head goes here
+        ((size_half + perimeter_thickness/2 + extra_gap, -edge_y), 90, size_half*2 + perimeter_thickness + extra_gap*2),
+        # Top and bottom
+        ((rail_x, edge_y), 0, size_half - entrance_half + perimeter_thickness + extra_gap),
+        ((rail_x, -edge_y), 0, size_half - entrance_half + perimeter_thickness + extra_gap),
+        # Lips reaching into the channel
+        ((rail_x, size_half - lip), 90, lip + perimeter_thickness/2 + extra_gap),
+        ((rail_x, -edge_y), 90, lip/2 + extra_gap),
+        # Hook behind the top lip and lever to pull the bottom off by
+        ((rail_x, size_half - lip), -45, hook_size),
+        ((rail_x, -edge_y), 225, lever_size),
+        ]
+
+# The whole clip profile as one sketch, rounded strokes fused in 2D
+def clip_profile(profile = default_profile):
+    sketch = cq.Sketch()
+    for (x, y), direction, length in clip_strokes(profile):
+        angle = math.radians(direction)
+        center = (x + math.cos(angle) * length/2, y + math.sin(angle) * length/2)
+        sketch = sketch.push([center]).slot(length, perimeter_thickness, direction).reset()
+    return sketch.clean()
+
+@part_cache.persistent
+def extrusion_clip(profile = default_profile):
     return (
         cq.Workplane("XY")
-        .lineTo(perimeter_thickness/2, 0, forConstruction = True)
-        .radiusArc((-perimeter_thickness/2, 0), perimeter_thickness/2)
-        .lineTo(-perimeter_thickness/2, length)
-        .radiusArc((perimeter_thickness/2, length), perimeter_thickness/2)
-        .close()
+        .placeSketch(clip_profile(profile))
         .extrude(clip_length/2, both=True)
     )
 
-def extrusion_clip():
-    clip_side = (
-        perimeter_feature(extrusion_size_half*2 + perimeter_thickness + extra_gap*2)
-        .translate(( extrusion_size_half + perimeter_thickness/2 + extra_gap,
-                    -extrusion_size_half - perimeter_thickness/2 - extra_gap, 0))
-    )
-
-    clip_top = (
-        perimeter_feature(
-            extrusion_size_half
-            - extrusion_channel_entrance_half
-            + perimeter_thickness
-            + extra_gap)
-        .rotate((0,0,0),(0,0,1), -90)
-        .translate((extrusion_channel_entrance_half - perimeter_thickness/2,
-                    perimeter_inner + extra_gap  + perimeter_thickness/2))
-    )
-    clip_bottom = clip_top.mirror("XZ")
-
-    lip_top = (
-        perimeter_feature(
-            extrusion_channel_lip
-            + perimeter_thickness/2
-            + extra_gap)
-        .translate((extrusion_channel_entrance_half - perimeter_thickness/2,
-                    perimeter_inner - extrusion_channel_lip))
-    )
-    lip_bottom = (
-        perimeter_feature(extrusion_channel_lip/2 + extra_gap)
-        .translate((extrusion_channel_entrance_half - perimeter_thickness/2,
-                    -perimeter_inner - extra_gap - perimeter_thickness/2))
-    )
-
-    hook_size = 1
-    top_hook = (
-        perimeter_feature(hook_size)
-        .rotate((0,0,0),(0,0,1), -135)
-        .translate((lip_addon_x,  perimeter_inner - extrusion_channel_lip))
-    )
-
-    lever_size = 5
-    bottom_removal_lever = (
-        perimeter_feature(lever_size)
-        .rotate((0,0,0),(0,0,1), 135)
-        .translate((lip_addon_x, -perimeter_inner - perimeter_thickness/2 - extra_gap))
-    )
-
-    return (
-        clip_side
-        + clip_top
-        + clip_bottom
-        + lip_top
-        + lip_bottom
-        + top_hook
-        + bottom_removal_lever
-    )
-
-def hex_bolt_clip():
-    bolt_head_diameter = 11
-    bolt_head_thickness = 4.25
-    bolt_shaft_diameter = 6.5
+@part_cache.persistent
+def hex_bolt_clip(fastener=bolt_mount.default_fastener, profile = default_profile):
+    size_half = profile_dimensions(profile)["size"]/2
+    bolt_head_diameter = bolt_mount.fasteners[fastener]["head_diameter"]
+    bolt_head_thickness = bolt_mount.fasteners[fastener]["head_thickness"]
+    bolt_shaft_diameter = bolt_mount.fasteners[fastener]["shaft_diameter"]
     additional_thickness = 0
 
     hex_bolt_clip = (
-        extrusion_clip().faces(">X").workplane()
-        .rect(extrusion_size_half*2, clip_length)
+        extrusion_clip(profile).faces(">X").workplane()
+        .rect(size_half*2, clip_length)
         .workplane(offset=bolt_head_thickness+additional_thickness)
         .circle(bolt_head_diameter*0.8)
         .loft()
@@ -143,11 +136,12 @@ def hex_bolt_clip():
         cq.Workplane("YZ")
         .polygon(6, bolt_head_diameter, circumscribed = True)
         # Bolt head will protrude into extra_gap, which is intentional.
-        .extrude(extrusion_size_half + bolt_head_thickness)
+        .extrude(size_half + bolt_head_thickness)
     )
 
     return hex_bolt_clip - hex_bolt_head
 
 # If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
 if show_object:
     show_object(hex_bolt_clip(), options={"color":"blue", "alpha":0.5})
@@ -0,0 +1,45 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Preview fidelity switch respected by every part file. In preview mode cosmetic
+fillets and chamfers are skipped and meshes are tessellated coarsely, for fast
+rebuilds while iterating on fit and clearance. Full fidelity is the default and
+what exports should use.
+
+Turn it on with ADJUSTABLE_ARM_PREVIEW=1 in the environment, or
+fidelity.set_preview(True) before building.
+"""
+
+import os
+
+preview = os.environ.get("ADJUSTABLE_ARM_PREVIEW", "0") == "1"
+
+def set_preview(enabled):
+    global preview
+    preview = enabled
+
+# Mesh level of detail from tessellation.levels
+def level():
+    return "coarse" if preview else "print"
@@ -32,41 +32,54 @@ appropriate threads and remove 3D printed plastic from the process
 
 import math
 import cadquery as cq
+import display
+import fidelity
+import part_cache
 
-block_height = 12.5
+@part_cache.persistent
+def indicator_base_adapter():
+    block_height = 12.5
 
-block = (
-    cq.Workplane("XY")
-    .rect(30,40)
-    .extrude(block_height)
-    ).edges("Z").fillet(3)
+    block = (
+        cq.Workplane("XY")
+        .rect(30,40)
+        .extrude(block_height)
+        )
+    if not fidelity.preview:
+        block = block.edges("Z").fillet(3)
 
-base_fastener_clear = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0,-7.5,0))
-    .circle(4)
-    .extrude(block_height)
-)
+    base_fastener_clear = (
+        cq.Workplane("XY")
+        .transformed(offset=cq.Vector(0,-7.5,0))
+        .circle(4)
+        .extrude(block_height)
+    )
 
-arm_fastener_shaft = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, 7.5,0))
-    .circle(3.25)
-    .extrude(block_height)
-)
+    arm_fastener_shaft = (
+        cq.Workplane("XY")
+        .transformed(offset=cq.Vector(0, 7.5,0))
+        .circle(3.25)
+        .extrude(block_height)
+    )
 
-arm_fastener_hex = (
-    cq.Workplane("XY")
-    .transformed(offset=cq.Vector(0, 7.5,0))
-    .polygon(6, 12, circumscribed=True)
-    .extrude(4.2)
-)
+    arm_fastener_hex = (
+        cq.Workplane("XY")
+        .transformed(offset=cq.Vector(0, 7.5,0))
+        .polygon(6, 12, circumscribed=True)
+        .extrude(4.2)
+    )
 
-block_assembly = (
-    block
-    -base_fastener_clear
-    -arm_fastener_shaft
-    -arm_fastener_hex
-).faces(">Z or <Z").chamfer(1)
+    block_assembly = (
+        block
+        -base_fastener_clear
+        -arm_fastener_shaft
+        -arm_fastener_hex
+    )
+    if not fidelity.preview:
+        block_assembly = block_assembly.faces(">Z or <Z").chamfer(1)
+    return block_assembly
 
-show_object(block_assembly, options={"color" : "#ABCDEF", "alpha" : 0.5})
+# If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
+if show_object:
+    show_object(indicator_base_adapter(), options={"color" : "#ABCDEF", "alpha" : 0.5})
@@ -26,22 +26,26 @@ SOFTWARE.
 Clip a 3/8" indicator shaft to a 1/4"-20 hex bolt head.
 """
 
-def indicator_holder():
-    bolt_head_diameter = 11
-    bolt_head_thickness = 4.25
-    bolt_shaft_diameter = 6.5
-
-    head_block_side = 15
-    head_block_thickness = bolt_head_thickness + 2
-
+import math
+import bolt_mount
+import cadquery as cq
+import display
+import fidelity
+import part_cache
+
+@part_cache.persistent
+def indicator_holder(fastener=bolt_mount.default_fastener):
+    # 15mm holds the 1/4"-20 head, larger heads get at least 1mm of wall
+    # beyond the corners of the hex pocket
+    head_corners = bolt_mount.fasteners[fastener]["head_diameter"] / math.cos(math.radians(30))
+    head_block_side = max(15, math.ceil(head_corners + 2))
+    head_block_thickness = bolt_mount.mount_thickness(fastener)
+
+    # Shared mount turned to face +X, with the bolt head pocket opening at X=0
     head_block = (
-        cq.Workplane("YZ")
-        .rect(head_block_side, head_block_side)
-        .circle(bolt_shaft_diameter/2)
-        .extrude(head_block_thickness)
-        .faces("<X")
-        .polygon(6, bolt_head_diameter, circumscribed=True)
-        .extrude(bolt_head_thickness, combine='cut')
+        bolt_mount.hex_head_block(fastener, head_block_side)
+        .rotate((0,0,0),(0,0,1), -90)
+        .translate((head_block_thickness, 0, 0))
     )
 
     nozzle_diameter = 0.4
@@ -82,11 +86,14 @@ def indicator_holder():
          head_block_side/2 + indicator_block_width/2, 0))
 
     # Cosmetic fillets
-    combined = combined.faces("|X").faces(">X[2]").edges(">Y").fillet(1)
-    combined = combined.faces(">Y").edges(">X").fillet(head_block_thickness)
-    combined = combined.faces("<Y").edges("|Z").fillet(1)
+    if not fidelity.preview:
+        combined = combined.faces("|X").faces(">X[2]").edges(">Y").fillet(1)
+        combined = combined.faces(">Y").edges(">X").fillet(head_block_thickness)
+        combined = combined.faces("<Y").edges("|Z").fillet(1)
 
     return combined
 
+# If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
 if show_object:
     show_object(indicator_holder(), options={"color":"blue", "alpha":0.5})
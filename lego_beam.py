@@ -0,0 +1,127 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Studless LEGO Technic beams and pin holes for adapters to LEGO compatible
+camera and sensor modules. Holes sit on the 8mm Technic pitch in straight, L
+or T layouts of any length:
+
+    technic_beam(15)
+    technic_beam(5, layout = "L", arm = 3)
+
+Holes run along Z through a beam half a pin long, so a full pin joins two
+beams. The pin hole cutter, a revolved profile with the lip at both ends, is
+built once for each depth and all holes of a beam are cut in a single boolean
+against a compound of its placed copies, so longer beams cost little more than
+short ones. Adapters with their own outline use cut_pin_holes() directly.
+"""
+
+import functools
+import cadquery as cq
+import display
+
+pitch = 8
+pin_length = 15.25
+pin_hole_diameter = 4.85
+pin_lip_diameter = 6.22
+pin_lip_depth = 1
+
+beam_width = 7.2
+beam_thickness = pin_length/2
+
+layouts = ["straight", "L", "T"]
+
+# Pin hole from Z=0 to Z=depth with a lip at both ends
+@functools.lru_cache(maxsize=None)
+def pin_hole(depth = beam_thickness):
+    return (
+        cq.Workplane("XZ")
+        .polyline([
+            (0, 0),
+            (pin_lip_diameter/2, 0),
+            (pin_lip_diameter/2, pin_lip_depth),
+            (pin_hole_diameter/2, pin_lip_depth),
+            (pin_hole_diameter/2, depth - pin_lip_depth),
+            (pin_lip_diameter/2, depth - pin_lip_depth),
+            (pin_lip_diameter/2, depth),
+            (0, depth),
+            ])
+        .close()
+        .revolve(360, (0,0,0), (0,1,0))
+    ).val()
+
+# Cut pin holes at (x, y) positions into a body, down from Z=depth to Z=0.
+# Holes on the Technic pitch never touch, so a compound of them is a valid
+# boolean argument.
+def cut_pin_holes(body, positions, depth = beam_thickness):
+    hole = pin_hole(depth)
+    return body.cut(cq.Compound.makeCompound([
+        hole.moved(cq.Location(cq.Vector(x, y, 0))) for x, y in positions]))
+
+# Straight runs of holes as (start, direction, holes) in pitch units. Holes
+# run along +X from the origin, the arm of an L runs along +Y from the first
+# hole and the arm of a T along -Y from the middle one.
+def beam_runs(holes, layout = "straight", arm = 0):
+    if layout not in layouts:
+        raise ValueError("Unknown layout: {}".format(layout))
+    if holes < 1 or (layout != "straight" and arm < 2):
+        raise ValueError("A {} beam needs at least one hole and an arm of two".format(layout))
+    runs = [((0, 0), (1, 0), holes)]
+    if layout == "L":
+        runs.append(((0, 0), (0, 1), arm))
+    elif layout == "T":
+        if holes % 2 == 0:
+            raise ValueError("A T beam needs an odd number of holes")
+        runs.append(((holes // 2, 0), (0, -1), arm))
+    return runs
+
+def hole_positions(holes, layout = "straight", arm = 0):
+    positions = []
+    for (x, y), (dx, dy), count in beam_runs(holes, layout, arm):
+        for i in range(count):
+            position = ((x + dx*i) * pitch, (y + dy*i) * pitch)
+            if position not in positions:
+                positions.append(position)
+    return positions
+
+# Beam outline, a rounded slot along each run
+def beam_outline(holes, layout = "straight", arm = 0):
+    outline = cq.Sketch()
+    for (x, y), (dx, dy), count in beam_runs(holes, layout, arm):
+        length = (count - 1) * pitch
+        center = cq.Location(cq.Vector((x*pitch + dx*length/2), (y*pitch + dy*length/2), 0))
+        if length:
+            outline = outline.push([center]).slot(length, beam_width, 90 if dx == 0 else 0).reset()
+        else:
+            outline = outline.push([center]).circle(beam_width/2).reset()
+    return outline.clean()
+
+def technic_beam(holes, layout = "straight", arm = 0, thickness = beam_thickness):
+    body = cq.Workplane("XY").placeSketch(beam_outline(holes, layout, arm)).extrude(thickness)
+    return cut_pin_holes(body, hole_positions(holes, layout, arm), thickness)
+
+# If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
+if show_object:
+    show_object(technic_beam(7, layout = "L", arm = 4), options={"color":"blue", "alpha":0.5})
@@ -27,50 +27,33 @@ Clip a M5CAMERA to a 1/4"-20 hex bolt head, using the M5CAMERA's mounting
 points compatible with studless LEGO beams.
 """
 
-lego_pin_length = 15.25
-lego_pin_hole_diameter = 4.85
-lego_pin_lip_diameter = 6.22
-lego_pin_lip_depth = 1
+import bolt_mount
+import cadquery as cq
+import display
+import fidelity
+import lego_beam
+import part_cache
 
 adapter_length = 45
 lego_bar_height = 10
 
-def lego_pin():
-    center = (
-        cq.Workplane("XY")
-        .circle(lego_pin_hole_diameter/2)
-        .extrude(lego_pin_length/2)
-    )
-
-    top_lip = (
-        cq.Workplane("XY")
-        .circle(lego_pin_lip_diameter/2)
-        .extrude(lego_pin_lip_depth)
-    )
-
-    bottom_lip = top_lip.translate((0,0,lego_pin_length/2 - lego_pin_lip_depth))
-
-    return center + top_lip + bottom_lip
-
+# The M5CAMERA's two pin holes, four Technic pitches apart plus clearance
+lego_pin_positions = [(0, 32.2/2), (0, -32.2/2)]
 
 def lego_bar():
-    pin_spacing_half = 32.2 / 2
     block = (
         cq.Workplane("XY")
         .rect(lego_bar_height, adapter_length)
-        .extrude(lego_pin_length/2)
+        .extrude(lego_beam.beam_thickness)
     )
 
-    return (
-        block
-        -lego_pin().translate((0,  pin_spacing_half, 0))
-        -lego_pin().translate((0, -pin_spacing_half, 0))
-    )
+    return lego_beam.cut_pin_holes(block, lego_pin_positions)
 
-def camera_adapter():
-    bolt_head_diameter = 11
-    bolt_head_thickness = 4.25
-    bolt_shaft_diameter = 6.5
+@part_cache.persistent
+def camera_adapter(fastener=bolt_mount.default_fastener):
+    bolt_head_diameter = bolt_mount.fasteners[fastener]["head_diameter"]
+    bolt_head_thickness = bolt_mount.fasteners[fastener]["head_thickness"]
+    bolt_shaft_diameter = bolt_mount.fasteners[fastener]["shaft_diameter"]
 
     block = (
         cq.Workplane("YZ")
@@ -80,8 +63,9 @@ def camera_adapter():
         .transformed(offset=cq.Vector((0,bolt_head_diameter/2,0)))
         .circle(bolt_shaft_diameter/2)
         .cutThruAll()
-        .faces(">Z").edges("|X").fillet(bolt_head_diameter/2)
     )
+    if not fidelity.preview:
+        block = block.faces(">Z").edges("|X").fillet(bolt_head_diameter/2)
 
     hex_head = (
         cq.Workplane("YZ")
@@ -98,13 +82,16 @@ def camera_adapter():
 
     block = block - hex_head
 
-    block = block.faces("<Z[1]").edges("|Y").edges(">X").fillet(2)
+    if not fidelity.preview:
+        block = block.faces("<Z[1]").edges("|Y").edges(">X").fillet(2)
 
-    block = block.faces("<Y or >Y").edges("|Z").fillet(bolt_head_thickness/2)
+        block = block.faces("<Y or >Y").edges("|Z").fillet(bolt_head_thickness/2)
 
     return block
 
 
 
+# If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
 if show_object:
     show_object(camera_adapter(), options={"color":"blue", "alpha":0.5})
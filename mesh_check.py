@@ -0,0 +1,358 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Check tessellated parts before they reach a slicer: every edge shared by
+exactly two consistently oriented triangles (manifold and watertight), no
+triangles crossing each other, and no walls thinner than can be printed.
+
+    python mesh_check.py knob arm hex_bolt_clip
+
+Walls thinner than nozzle_diameter cannot be printed at all. Walls thinner
+than the extrusion clip's perimeter_thickness print as solid perimeters with
+no infill, which is expected for the clip but worth knowing elsewhere. Sharp
+edges also measure thin right next to the edge, so thin walls are reported
+as an area for review rather than failing the part.
+
+Everything runs on NumPy arrays. Overlap and ray queries go through a
+bounding volume hierarchy built by median splits and traversed one tree
+level at a time, so work is done on whole arrays rather than per triangle in
+Python. On one core a mesh of 200 thousand triangles is checked in about 5
+seconds and one of a million in about 35, so meshes of millions of triangles
+take minutes rather than seconds; getting there would need a compiled
+traversal.
+"""
+
+import argparse
+import collections
+import sys
+import numpy as np
+import adjustable_arm
+import extrusion_clip
+import registry
+import tessellation
+
+minimum_wall = adjustable_arm.default_parameters["nozzle_diameter"]
+solid_wall = extrusion_clip.perimeter_thickness
+
+# Rays traced per batch in the wall thickness check, and candidate pairs of
+# triangles tested per batch for crossings, bounding memory use
+ray_batch = 65536
+pair_batch = 1 << 20
+
+# Counts of edges used by one triangle (holes), by more than two (non-manifold)
+# and by two triangles running the same direction (flipped orientation).
+def edge_defects(triangles):
+    start = triangles.reshape(-1).astype(np.int64)
+    end = triangles[:, [1, 2, 0]].reshape(-1).astype(np.int64)
+    # One integer per edge, sorting those is far faster than sorting rows
+    size = int(triangles.max()) + 1 if len(triangles) else 1
+    _, counts = np.unique(np.minimum(start, end) * size + np.maximum(start, end), return_counts=True)
+    _, directed_counts = np.unique(start * size + end, return_counts=True)
+    return int((counts == 1).sum()), int((counts > 2).sum()), int((directed_counts > 1).sum())
+
+def volume(mesh):
+    corners = mesh.vertices[mesh.triangles]
+    return np.einsum("ij,ij->i", corners[:, 0], np.cross(corners[:, 1], corners[:, 2])).sum() / 6
+
+Bvh = collections.namedtuple("Bvh", ["levels", "leaves", "boxes"])
+
+# Boxes as float32 arrays of one row per coordinate, lower corner then upper,
+# so each coordinate of many boxes is gathered from contiguous memory with
+# np.take. Widened a little so the rounding can only make them overlap more,
+# never less.
+def triangle_boxes(corners, margin = 1e-4):
+    a, b, c = corners.transpose(1, 2, 0)
+    return np.vstack([np.minimum(np.minimum(a, b), c) - margin, np.maximum(np.maximum(a, b), c) + margin]).astype(np.float32)
+
+# Hierarchy over boxes. The tree is complete and implicit: node i of a level
+# has children 2i and 2i+1 in the next one, levels[0] holds the root box and
+# levels[-1] the leaf boxes. It is built top down, a whole level at a time:
+# the boxes of each node are split in half at the median of their centers
+# along the axis they spread furthest. Ordering along a Morton curve instead
+# is cheaper to build, but its jumps leave large overlapping nodes which
+# traversals then have to visit.
+def build_bvh(boxes, leaf_size = 2):
+    count = boxes.shape[1]
+    leaf_count = 1 << max(0, int(np.ceil(np.log2(max(1, -(-count // leaf_size))))))
+    # Padding repeats the last center and splits like any other box
+    centers = np.empty((3, leaf_count * leaf_size), dtype=np.float32)
+    centers[:, :count] = (boxes[:3] + boxes[3:]) / 2
+    centers[:, count:] = centers[:, count - 1:count] if count else 0
+    order = np.arange(leaf_count * leaf_size, dtype=np.int32)
+    groups = 1
+    while groups < leaf_count:
+        grouped = centers[:, order]
+        starts = np.arange(0, len(order), len(order) // groups)
+        spread = np.maximum.reduceat(grouped, starts, axis=1) - np.minimum.reduceat(grouped, starts, axis=1)
+        keys = grouped.reshape(3, groups, -1)[spread.argmax(axis=0), np.arange(groups)]
+        split = np.argpartition(keys, keys.shape[1] // 2, axis=1)
+        order = np.take_along_axis(order.reshape(groups, -1), split, axis=1).reshape(-1)
+        groups *= 2
+    leaves = np.minimum(order, count).reshape(leaf_count, leaf_size)
+
+    # Padding points at an empty box past the end, which overlaps nothing
+    empty = np.array([[np.inf]] * 3 + [[-np.inf]] * 3, dtype=np.float32)
+    boxes = np.hstack([boxes, empty])
+    levels = [merge(np.take(boxes, leaves.T, axis=1))]
+    while levels[0].shape[1] > 1:
+        levels.insert(0, merge(levels[0].reshape(6, -1, 2).transpose(0, 2, 1)))
+    return Bvh(levels, leaves, boxes)
+
+# Box around each group of boxes, given as (coordinate, member, group)
+def merge(groups):
+    return np.ascontiguousarray(np.vstack([groups[:3].min(axis=1), groups[3:].max(axis=1)]))
+
+def boxes_overlap(boxes, first, second):
+    a, b = np.take(boxes, first, axis=1), np.take(boxes, second, axis=1)
+    return ((a[:3] <= b[3:]) & (b[:3] <= a[3:])).all(axis=0)
+
+# Pairs of distinct items whose boxes overlap, each unordered pair once
+def overlapping_pairs(bvh):
+    first = second = np.zeros(1, dtype=np.int32)
+    for boxes in bvh.levels[1:]:
+        same = first == second
+        first = np.concatenate([2 * first, 2 * first, 2 * first[~same] + 1, 2 * first + 1])
+        second = np.concatenate([2 * second, 2 * second + 1, 2 * second[~same], 2 * second + 1])
+        keep = boxes_overlap(boxes, first, second)
+        first, second = first[keep], second[keep]
+
+    size = bvh.leaves.shape[1]
+    same_leaf = np.repeat(first == second, size * size)
+    first = np.repeat(bvh.leaves[first], size, axis=1).reshape(-1)
+    second = np.tile(bvh.leaves[second], (1, size)).reshape(-1)
+    padding = bvh.boxes.shape[1] - 1
+    keep = (first != padding) & (second != padding) & ((first < second) | ~same_leaf & (first != second))
+    first, second = first[keep], second[keep]
+    keep = boxes_overlap(bvh.boxes, first, second)
+    return first[keep], second[keep]
+
+# Distance along each ray to triangles a, b, c, inf where it misses. Segment
+# tests pass length 1 rays and check the distance against 1 themselves.
+def ray_triangle(origins, directions, a, b, c, epsilon = 1e-9):
+    edge1, edge2 = b - a, c - a
+    h = np.cross(directions, edge2)
+    determinant = np.einsum("ij,ij->i", edge1, h)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = 1 / determinant
+        s = origins - a
+        u = inverse * np.einsum("ij,ij->i", s, h)
+        q = np.cross(s, edge1)
+        v = inverse * np.einsum("ij,ij->i", directions, q)
+        distance = inverse * np.einsum("ij,ij->i", edge2, q)
+        hit = (np.abs(determinant) > epsilon) & (u > epsilon) & (v > epsilon) & (u + v < 1 - epsilon) & (distance > epsilon)
+    return np.where(hit, distance, np.inf)
+
+# Unit normal of each triangle
+def unit_normals(corners):
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    return normals / np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-300)
+
+# Signed distances of each triangle's corners from the plane of its partner,
+# given by a corner of the partner and its unit normal
+def plane_distances(triangles, points, normals):
+    return np.einsum("ijk,ik->ij", triangles - points[:, None], normals)
+
+# How far triangles poke through the planes of the triangles they cross: the
+# shorter excursion of the corners to either side. Corners are compared one
+# column at a time, NumPy reduces along a length 3 axis many times slower.
+def penetration(distances):
+    first, second, third = distances.T
+    return np.minimum(
+        np.maximum(np.maximum(first, second), third), -np.minimum(np.minimum(first, second), third))
+
+# Which of the candidate pairs of triangles cross each other, with how deep
+# they cross. Triangles sharing a corner touch by construction and are
+# skipped. Pairs where one lies entirely to one side of the other's plane are
+# dropped cheaply, the rest intersect when an edge of one passes through the
+# other.
+def crossing_pairs(triangles, corners, normals, first, second, epsilon = 1e-9):
+    shared = np.zeros(len(first), dtype=bool)
+    for corner in np.take(triangles, first, axis=0).T:
+        for other in np.take(triangles, second, axis=0).T:
+            shared |= corner == other
+    first, second = first[~shared], second[~shared]
+
+    a, b = np.take(corners, first, axis=0), np.take(corners, second, axis=0)
+    a_to_b, b_to_a = plane_distances(a, b[:, 0], normals[second]), plane_distances(b, a[:, 0], normals[first])
+    straddle = (penetration(a_to_b) > epsilon) & (penetration(b_to_a) > epsilon)
+    first, second = first[straddle], second[straddle]
+    a, b, a_to_b, b_to_a = a[straddle], b[straddle], a_to_b[straddle], b_to_a[straddle]
+
+    crossing = np.zeros(len(first), dtype=bool)
+    for edges, faces in [(a, b), (b, a)]:
+        for start, end in [(0, 1), (1, 2), (2, 0)]:
+            origin = edges[:, start]
+            distance = ray_triangle(origin, edges[:, end] - origin, faces[:, 0], faces[:, 1], faces[:, 2])
+            crossing |= distance < 1 - epsilon
+    return (
+        np.stack([first[crossing], second[crossing]], axis=1),
+        np.minimum(penetration(a_to_b[crossing]), penetration(b_to_a[crossing])))
+
+# Pairs of triangles crossing each other anywhere in the mesh, with how deep
+# they cross. Candidates from the hierarchy are tested a batch at a time.
+def self_intersections(mesh, epsilon = 1e-9):
+    corners = mesh.vertices[mesh.triangles]
+    normals = unit_normals(corners)
+    first, second = overlapping_pairs(build_bvh(triangle_boxes(corners)))
+    found = [crossing_pairs(mesh.triangles, corners, normals, first[start:start + pair_batch],
+                            second[start:start + pair_batch], epsilon)
+             for start in range(0, max(1, len(first)), pair_batch)]
+    return np.concatenate([pairs for pairs, depths in found]), np.concatenate([depths for pairs, depths in found])
+
+# (ray, triangle) pairs worth an exact test: the triangle's box is crossed by
+# the ray within reach. Nodes farther away are pruned while descending.
+def ray_candidates(bvh, origins, directions, reach = np.inf):
+    # Boxes are float32, so is the traversal, the exact hit test is not
+    start = np.ascontiguousarray(origins.T, dtype=np.float32)
+    with np.errstate(divide="ignore"):
+        inverse = np.ascontiguousarray(1 / directions.T, dtype=np.float32)
+    rays = np.arange(len(origins))
+    nodes = np.zeros(len(origins), dtype=np.int32)
+    for depth, boxes in enumerate(bvh.levels):
+        if depth:
+            rays = np.repeat(rays, 2)
+            nodes = np.repeat(2 * nodes, 2) + np.tile(np.array([0, 1], dtype=np.int32), len(nodes))
+        box = np.take(boxes, nodes, axis=1)
+        ray_start, ray_inverse = np.take(start, rays, axis=1), np.take(inverse, rays, axis=1)
+        # Nodes holding only padding are inverted boxes, which the slab test
+        # alone would count as hit
+        keep = box[0] <= box[3]
+        enter = np.zeros(len(rays), dtype=np.float32)
+        leave = np.full(len(rays), reach, dtype=np.float32)
+        with np.errstate(invalid="ignore"):
+            for axis in range(3):
+                near = (box[axis] - ray_start[axis]) * ray_inverse[axis]
+                far = (box[axis + 3] - ray_start[axis]) * ray_inverse[axis]
+                enter = np.fmax(enter, np.fmin(near, far))
+                leave = np.fmin(leave, np.fmax(near, far))
+        keep &= enter <= leave
+        rays, nodes = rays[keep], nodes[keep]
+
+    size = bvh.leaves.shape[1]
+    rays = np.repeat(rays, size)
+    faces = bvh.leaves[nodes].reshape(-1)
+    keep = faces != bvh.boxes.shape[1] - 1
+    return rays[keep], faces[keep]
+
+# Nearest hit along each ray within reach, skipping the triangle each ray
+# starts from.
+def cast_rays(bvh, corners, origins, directions, sources, reach):
+    rays, faces = ray_candidates(bvh, origins, directions, reach)
+    keep = faces != sources[rays]
+    rays, faces = rays[keep], faces[keep]
+    a, b, c = np.take(corners, faces, axis=0).transpose(1, 0, 2)
+    distance = ray_triangle(np.take(origins, rays, axis=0), np.take(directions, rays, axis=0), a, b, c)
+    nearest = np.full(len(origins), np.inf)
+    np.minimum.at(nearest, rays, distance)
+    return nearest
+
+# Which points are inside a closed mesh, by the parity of surface crossings
+# along a ray. The ray is tilted off the axes so it does not run exactly along
+# the edges of axis-aligned faces.
+def inside(mesh, points, bvh = None):
+    corners = mesh.vertices[mesh.triangles]
+    bvh = bvh or build_bvh(triangle_boxes(corners))
+    direction = np.array([1, 0.0123, 0.0071]) / np.linalg.norm([1, 0.0123, 0.0071])
+    crossings = np.zeros(len(points), dtype=np.int64)
+    for start in range(0, len(points), ray_batch):
+        batch = points[start:start + ray_batch]
+        directions = np.broadcast_to(direction, batch.shape)
+        rays, faces = ray_candidates(bvh, batch, directions)
+        distance = ray_triangle(batch[rays], directions[rays], corners[faces, 0], corners[faces, 1], corners[faces, 2])
+        crossings[start:start + len(batch)] = np.bincount(rays[distance < np.inf], minlength=len(batch))
+    return crossings % 2 == 1
+
+# Wall thickness at each triangle, measured from its centroid straight into
+# the part until the ray leaves through another triangle. Walls thicker than
+# reach are reported as inf.
+def wall_thickness(mesh, reach = solid_wall):
+    corners = mesh.vertices[mesh.triangles]
+    bvh = build_bvh(triangle_boxes(corners))
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    areas = np.linalg.norm(normals, axis=1) / 2
+    inward = -normals / np.maximum(2 * areas, 1e-300)[:, None]
+    centroids = corners.mean(axis=1)
+
+    thickness = np.empty(len(corners))
+    for start in range(0, len(corners), ray_batch):
+        batch = np.arange(start, min(start + ray_batch, len(corners)))
+        thickness[batch] = cast_rays(bvh, corners, centroids[batch], inward[batch], batch, reach)
+    thickness[thickness > reach] = np.inf
+    return thickness, areas
+
+def check(mesh, minimum = minimum_wall, solid = solid_wall):
+    mesh, degenerate = tessellation.weld(mesh)
+    holes, non_manifold, flipped = edge_defects(mesh.triangles)
+    crossing, depths = self_intersections(mesh)
+    thickness, areas = wall_thickness(mesh, max(minimum, solid))
+    return {
+        "triangles": len(mesh.triangles),
+        "degenerate": degenerate,
+        "boundary_edges": holes,
+        "non_manifold_edges": non_manifold,
+        "flipped_edges": flipped,
+        "watertight": holes == 0 and non_manifold == 0 and flipped == 0,
+        "volume": volume(mesh),
+        "self_intersections": len(crossing),
+        "deepest_intersection": float(depths.max()) if len(depths) else 0.0,
+        "thinnest_wall": float(thickness.min()) if len(thickness) else float("inf"),
+        "thin_area": float(areas[thickness < minimum].sum()),
+        "no_infill_area": float(areas[thickness < solid].sum()),
+        }
+
+# Chordal facets of curved faces meeting at shallow angles can cross by a
+# fraction of the tessellation tolerance. Crossings shallower than half an
+# extrusion width disappear when the slicer merges each layer's outline.
+def passed(report, minimum = minimum_wall):
+    return report["watertight"] and report["deepest_intersection"] < minimum / 2
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("parts", nargs="*", help="parts to check, default all")
+    parser.add_argument("--level", default="print", choices=list(tessellation.levels), help="mesh level of detail")
+    parser.add_argument("--minimum-wall", type=float, default=minimum_wall, help="thinnest printable wall in mm")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.parts if name not in registry.generators]
+    if unknown:
+        parser.error("unknown parts: " + ", ".join(unknown))
+
+    failures = 0
+    for name in args.parts or registry.generators:
+        report = check(tessellation.mesh(registry.build(name), args.level), args.minimum_wall)
+        ok = passed(report, args.minimum_wall)
+        failures += not ok
+        thinnest = report["thinnest_wall"]
+        print("{:<28} {:<4} {:>7} triangles  {} open {} non-manifold {} flipped  "
+              "{} crossing {:.2f}mm deep  thinnest {}  {:.1f}mm2 under {:g}mm".format(
+                  name, "ok" if ok else "FAIL", report["triangles"],
+                  report["boundary_edges"], report["non_manifold_edges"], report["flipped_edges"],
+                  report["self_intersections"], report["deepest_intersection"],
+                  "{:.2f}mm".format(thinnest) if thinnest < np.inf else "over {:g}mm".format(solid_wall),
+                  report["thin_area"], args.minimum_wall))
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Content-addressed on-disk store of finished solids, so a part built before
+with the same parameters is read back from a BREP file instead of rebuilt.
+
+The key for each entry hashes the function name, its arguments, the preview
+fidelity setting, and the source of the module defining it along with sibling
+modules it imports. Editing the generating file invalidates its entries.
+Meshes cached by tessellation.py live in the same store. Total size of the
+store is bounded, least recently used entries are evicted first.
+
+Settings can be changed through environment variables:
+ADJUSTABLE_ARM_CACHE=0 to disable, ADJUSTABLE_ARM_CACHE_DIR for location,
+ADJUSTABLE_ARM_CACHE_MB for size limit in megabytes.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import tempfile
+import cadquery as cq
+import fidelity
+
+enabled = os.environ.get("ADJUSTABLE_ARM_CACHE", "1") != "0"
+cache_dir = os.environ.get(
+    "ADJUSTABLE_ARM_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "adjustable_arm"))
+size_limit = float(os.environ.get("ADJUSTABLE_ARM_CACHE_MB", 512)) * 1024 * 1024
+
+# Hash the file defining function, plus the files of modules from the same
+# directory it imports, so editing a shared component invalidates every part
+# built from it.
+def source_digest(function):
+    filename = os.path.abspath(function.__code__.co_filename)
+    directory = os.path.dirname(filename)
+    sources = {filename}
+    for value in function.__globals__.values():
+        module_file = getattr(value, "__file__", None)
+        if module_file and os.path.dirname(os.path.abspath(module_file)) == directory:
+            sources.add(os.path.abspath(module_file))
+
+    digest = hashlib.sha256()
+    for path in sorted(sources):
+        with open(path, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+def entry_path(key, suffix = ".brep"):
+    return os.path.join(cache_dir, key[:2], key + suffix)
+
+def load(key):
+    path = entry_path(key)
+    try:
+        shape = cq.Shape.importBrep(path)
+    except (OSError, ValueError):
+        return None
+
+    # Touch the entry so eviction sees it as recently used
+    os.utime(path)
+    return cq.Workplane("XY").newObject([shape])
+
+def store(key, part):
+    shapes = part.vals()
+    shape = shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
+
+    path = entry_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write under a temporary name and rename into place, so concurrent
+    # builders never see a partially written file.
+    handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+    os.close(handle)
+    try:
+        shape.exportBrep(temporary)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+    evict()
+
+def entries():
+    found = []
+    for directory, _, files in os.walk(cache_dir):
+        for name in files:
+            if name.endswith((".brep", ".npz")):
+                path = os.path.join(directory, name)
+                try:
+                    status = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                found.append((status.st_mtime, status.st_size, path))
+    return found
+
+# Remove least recently used entries until the store fits in size_limit
+def evict():
+    found = sorted(entries())
+    total = sum(size for _, size, _ in found)
+    for _, size, path in found:
+        if total <= size_limit:
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+def clear():
+    for _, _, path in entries():
+        os.remove(path)
+
+# Decorator for functions returning a cq.Workplane holding a finished part.
+# Arguments are bound against the signature first, so positional and keyword
+# calls for the same values share one entry.
+def persistent(function):
+    signature = inspect.signature(function)
+    digest = source_digest(function)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not enabled:
+            return function(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = hashlib.sha256(repr((
+            function.__qualname__,
+            digest,
+            fidelity.preview,
+            sorted(bound.arguments.items()),
+            )).encode()).hexdigest()
+
+        part = load(key)
+        if part is None:
+            part = function(*args, **kwargs)
+            store(key, part)
+        return part
+
+    # Survives functools wrappers, which copy the wrapped __dict__
+    wrapper.persistent = True
+    return wrapper
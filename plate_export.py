@@ -0,0 +1,152 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Lay out complete arm sets on a print bed and write them as one 3MF plate.
+
+    python plate_export.py --sets 4 --accessory round_platform -o plate.3mf
+
+A set is two arm halves (each with its end ball), the knob and both wedge
+blocks, all in their print orientations. Each distinct part is tessellated
+once and its mesh XML is streamed straight into the 3MF zip entry before the
+next part is tessellated, so memory use does not grow with the size of the
+plate. Copies of a part are build items referring to the same mesh.
+"""
+
+import argparse
+import time
+import adjustable_arm
+import fidelity
+import registry
+import tessellation
+
+# Parts of one arm set and how many of each are printed
+arm_set = [
+    ("printable_arm", 2),
+    ("knob", 1),
+    ("wedge_block_hex_bolt", 1),
+    ("wedge_block_no_hex", 1),
+    ]
+
+# Prusa MK4 bed, millimeters
+bed_size = (250, 210)
+spacing = 5
+
+# Distinct parts for the plate as (name, part, copies), arm parts in print
+# orientation followed by accessories from the registry.
+def plate_parts(params = None, accessories = (), sets = 1):
+    values = adjustable_arm.arm_values(params)
+    built = adjustable_arm.build_arm(params, [name for name, count in arm_set])
+    parts = [
+        (name, adjustable_arm.print_orientation(name, built[name], values), count * sets)
+        for name, count in arm_set]
+    for name in accessories:
+        parts.append((name, registry.build(name), sets))
+    return parts
+
+# Turn a part so its longer side runs along X, then move its bounding box
+# corner to the origin so a placement is just an offset on the bed.
+def bed_ready(part):
+    bounds = part.val().BoundingBox()
+    if bounds.ylen > bounds.xlen:
+        part = part.rotate((0, 0, 0), (0, 0, 1), 90)
+        bounds = part.val().BoundingBox()
+    return part.translate((-bounds.xmin, -bounds.ymin, -bounds.zmin))
+
+# Shelf packing: place footprints left to right, starting a new row when the
+# bed width runs out. Returns an (x, y) offset per footprint and the overall
+# extent, which may be deeper than the bed if too much was asked for.
+def layout(footprints, width = bed_size[0], gap = spacing):
+    offsets = []
+    x = y = row_depth = extent_x = 0
+    for footprint_x, footprint_y in footprints:
+        if x and x + footprint_x > width:
+            x, y, row_depth = 0, y + row_depth + gap, 0
+        offsets.append((x, y))
+        extent_x = max(extent_x, x + footprint_x)
+        x += footprint_x + gap
+        row_depth = max(row_depth, footprint_y)
+    return offsets, (extent_x, y + row_depth)
+
+# Write the plate to path, returning the (width, depth) it occupies. parts is
+# a list of (name, part, copies) as from plate_parts(). A part that does not
+# fit on the bed at all is a ValueError, raised before anything is written.
+def write_plate(path, parts, width = bed_size[0], depth = bed_size[1], gap = spacing):
+    ready = [(name, bed_ready(part), copies) for name, part, copies in parts]
+    footprints, owners = [], []
+    for object_id, (name, part, copies) in enumerate(ready, 1):
+        bounds = part.val().BoundingBox()
+        if bounds.xlen > width or bounds.ylen > depth:
+            raise ValueError("{} is {:.0f} x {:.0f} mm, larger than the {:g} x {:g} mm bed".format(
+                name, bounds.xlen, bounds.ylen, width, depth))
+        footprints += [(bounds.xlen, bounds.ylen)] * copies
+        owners += [object_id] * copies
+    offsets, extent = layout(footprints, width, gap)
+
+    tessellation.write_3mf(
+        path,
+        ((name, tessellation.mesh(part)) for name, part, copies in ready),
+        [(object_id, x, y) for object_id, (x, y) in zip(owners, offsets)])
+    return extent
+
+# "name=value" arm parameter override
+def parse_parameter(text):
+    name, _, value = text.partition("=")
+    return name, float(value)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("-o", "--output", default="plate.3mf", help="3MF file to write")
+    parser.add_argument("-s", "--sets", type=int, default=1, help="number of arm sets")
+    parser.add_argument("-a", "--accessory", dest="accessories", action="append", default=[],
+                        choices=[name for name, role in registry.roles.items() if role != "arm"],
+                        help="accessory to add to each set, may be repeated")
+    parser.add_argument("-p", "--parameter", dest="parameters", action="append", default=[],
+                        type=parse_parameter, help="arm parameter as name=value, may be repeated")
+    parser.add_argument("--bed-width", type=float, default=bed_size[0], help="bed width in mm")
+    parser.add_argument("--bed-depth", type=float, default=bed_size[1], help="bed depth in mm")
+    parser.add_argument("--preview", action="store_true", help="skip cosmetic details, coarse meshes")
+    args = parser.parse_args()
+
+    if args.preview:
+        fidelity.set_preview(True)
+    try:
+        adjustable_arm.checked_parameters(dict(args.parameters))
+    except ValueError as error:
+        parser.error(error)
+
+    start = time.perf_counter()
+    parts = plate_parts(dict(args.parameters), args.accessories, args.sets)
+    try:
+        width, depth = write_plate(args.output, parts, args.bed_width, args.bed_depth)
+    except ValueError as error:
+        parser.error(error)
+    print("Wrote {} parts to {} ({:.0f} x {:.0f} mm) in {:.2f}s".format(
+        sum(copies for name, part, copies in parts), args.output, width, depth,
+        time.perf_counter() - start))
+    if depth > args.bed_depth:
+        print("Plate is deeper than the {:g} mm bed, split it into more plates".format(args.bed_depth))
+
+if __name__ == "__main__":
+    main()
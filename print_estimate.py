@@ -0,0 +1,172 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Estimate filament and print time for every part, for quoting and scheduling
+print jobs without slicing each file:
+
+    python print_estimate.py --output estimates.csv
+    python print_estimate.py arm knob --infill 0.3 --output estimates.json
+
+Volume, surface area and center of mass are exact, from the BREP of each part
+in its print orientation. Filament is estimated the way a slicer lays it
+down: solid shells perimeters deep over the whole surface, sparse infill in
+the rest of the volume. Print time is that filament at the volumetric flow of
+the printer plus a fixed cost for each layer. Line width comes from the
+nozzle_diameter the arm is designed around. Parts are built in parallel the
+same way export_parts.py does.
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import json
+import math
+import os
+import sys
+import time
+import adjustable_arm
+import registry
+
+# Slicer settings, PLA on a 0.4mm nozzle. Layer height must not exceed
+# tie_gap, which is sized to be at least one layer.
+nozzle_diameter = adjustable_arm.default_parameters["nozzle_diameter"]
+layer_height = 0.2
+perimeters = 2
+infill = 0.15
+filament_diameter = 1.75
+filament_density = 1.24 # g/cm^3
+
+# Printer speeds: volumetric flow in mm^3/s and seconds spent per layer on
+# travel, retraction and layer change
+flow_rate = 10
+layer_time = 2
+
+default_settings = {
+    "nozzle_diameter": nozzle_diameter,
+    "layer_height": layer_height,
+    "perimeters": perimeters,
+    "infill": infill,
+    "filament_diameter": filament_diameter,
+    "filament_density": filament_density,
+    "flow_rate": flow_rate,
+    "layer_time": layer_time,
+    }
+
+columns = [
+    "part", "volume", "area", "center_x", "center_y", "center_z", "height",
+    "extruded", "filament_length", "filament_mass", "layers", "print_time",
+    ]
+
+# Estimates in millimeters, grams and seconds for a shape as it sits on the
+# print bed
+def estimate_shape(shape, settings = default_settings):
+    volume, area = shape.Volume(), shape.Area()
+    center = shape.centerOfMass(shape)
+    height = shape.BoundingBox().zlen
+
+    line_width = settings["nozzle_diameter"] * 1.125
+    shell = min(volume, area * settings["perimeters"] * line_width)
+    extruded = shell + (volume - shell) * settings["infill"]
+    layers = math.ceil(height / settings["layer_height"])
+    return {
+        "volume": volume,
+        "area": area,
+        "center_x": center.x,
+        "center_y": center.y,
+        "center_z": center.z,
+        "height": height,
+        "extruded": extruded,
+        "filament_length": extruded / (math.pi * settings["filament_diameter"]**2 / 4),
+        "filament_mass": extruded * settings["filament_density"] / 1000,
+        "layers": layers,
+        "print_time": extruded / settings["flow_rate"] + layers * settings["layer_time"],
+        }
+
+# One row of estimates for a registered part
+def estimate(name, settings):
+    return {"part": name, **estimate_shape(registry.build_printed(name).val(), settings)}
+
+# Seconds as hours:minutes:seconds, hours counting on past a day
+def format_duration(seconds):
+    seconds = round(seconds)
+    return "{:02d}:{:02d}:{:02d}".format(seconds // 3600, seconds // 60 % 60, seconds % 60)
+
+# Estimate the named parts on a pool of worker processes, yielding rows as
+# each part finishes
+def estimate_all(names, settings, workers = None):
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(estimate, name, settings) for name in names]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+def write(path, rows, fieldnames = columns):
+    with open(path, "w", newline="") as stream:
+        if path.endswith(".json"):
+            json.dump(rows, stream, indent=2)
+            stream.write("\n")
+        else:
+            writer = csv.DictWriter(stream, fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("parts", nargs="*", help="parts to estimate, default all")
+    parser.add_argument("-o", "--output", help="write estimates to this .csv or .json file")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--layer-height", type=float, default=layer_height, help="layer height in mm")
+    parser.add_argument("--perimeters", type=int, default=perimeters, help="solid shell lines")
+    parser.add_argument("--infill", type=float, default=infill, help="sparse infill fraction")
+    parser.add_argument("--flow-rate", type=float, default=flow_rate, help="volumetric flow in mm^3/s")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.parts if name not in registry.generators]
+    if unknown:
+        parser.error("unknown parts: " + ", ".join(unknown))
+
+    settings = dict(default_settings,
+        layer_height = args.layer_height,
+        perimeters = args.perimeters,
+        infill = args.infill,
+        flow_rate = args.flow_rate,
+        )
+    start = time.perf_counter()
+    names = args.parts or list(registry.generators)
+    rows = []
+    for row in estimate_all(names, settings, args.jobs):
+        rows.append(row)
+        print("{:<28} {:9.0f}mm3 {:7.1f}g {:6.1f}m {:>8}".format(
+            row["part"], row["volume"], row["filament_mass"], row["filament_length"] / 1000,
+            format_duration(row["print_time"])))
+    rows.sort(key=lambda row: names.index(row["part"]))
+    print("Total {:.1f}g, {} of printing, estimated in {:.2f}s".format(
+        sum(row["filament_mass"] for row in rows),
+        format_duration(sum(row["print_time"] for row in rows)),
+        time.perf_counter() - start), file=sys.stderr)
+    if args.output:
+        write(args.output, rows)
+
+if __name__ == "__main__":
+    main()
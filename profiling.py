@@ -0,0 +1,208 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Opt-in instrumentation of the CadQuery operations these part files use. While
+enabled, each boolean, split, fillet, chamfer, loft and revolve is logged with
+its duration, face count before and after, and the line in our code that
+called it, so we can see which operation blows up in time or topology. Shape
+methods that parts call directly, bypassing Workplane, are traced as well.
+
+    python profiling.py arm knob --collapsed arm.folded
+
+Or from code:
+
+    with profiling.part("knob"):
+        adjustable_arm.arm_part("knob")
+    print(profiling.summary())
+
+Collapsed stacks ("part;caller;...;operation microseconds" per line) can be
+rendered by flamegraph.pl or speedscope.
+"""
+
+import argparse
+import collections
+import functools
+import os
+import sys
+import threading
+import time
+import cadquery as cq
+
+operations = [
+    (cq.Workplane, name)
+    for name in ["__add__", "__sub__", "union", "cut", "intersect", "fillet", "chamfer", "loft", "revolve"]
+    ] + [
+    (cq.Shape, "split"),
+    (cq.Shape, "fuse"),
+    (cq.Compound, "fuse"),
+    ]
+
+repository = os.path.dirname(os.path.abspath(__file__))
+# Frames from these files and functions are plumbing, not geometry decisions
+skipped_files = {
+    os.path.abspath(__file__),
+    os.path.join(repository, "part_cache.py"),
+    os.path.join(repository, "registry.py"),
+    }
+skipped_functions = {"call_part", "build_arm", "arm_part"}
+
+records = []
+originals = {}
+state = threading.local()
+
+def faces(obj):
+    try:
+        if isinstance(obj, cq.Workplane):
+            obj = obj.findSolid()
+        if isinstance(obj, cq.Shape):
+            return len(obj.Faces())
+    except ValueError:
+        pass
+    return 0
+
+# Our own frames calling into CadQuery, outermost first. Frozen and generated
+# code has names like "<frozen runpy>", which abspath() would place in the
+# working directory.
+def call_stack():
+    stack = []
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if (not frame.f_code.co_filename.startswith("<")
+                and filename.startswith(repository)
+                and filename not in skipped_files
+                and frame.f_code.co_name not in skipped_functions):
+            module = os.path.splitext(os.path.basename(filename))[0]
+            stack.append((module, frame.f_code.co_name, frame.f_lineno))
+        frame = frame.f_back
+    return stack[::-1]
+
+def traced(name, original):
+    @functools.wraps(original)
+    def wrapper(self, *args, **kwargs):
+        # Operations call each other (__sub__ calls cut), record only the outermost
+        if getattr(state, "depth", 0):
+            return original(self, *args, **kwargs)
+
+        faces_in = faces(self) + sum(faces(arg) for arg in args)
+        state.depth = 1
+        try:
+            start = time.perf_counter()
+            result = original(self, *args, **kwargs)
+            seconds = time.perf_counter() - start
+        finally:
+            state.depth = 0
+
+        stack = call_stack()
+        module, function, line = stack[-1] if stack else ("?", "?", 0)
+        records.append({
+            "part": getattr(state, "part", None) or "unnamed",
+            "operation": name.strip("_"),
+            "seconds": seconds,
+            "faces_in": faces_in,
+            "faces_out": faces(result),
+            "module": module,
+            "line": line,
+            "stack": ["{}.{}".format(m, f) for m, f, _ in stack],
+            })
+        return result
+    return wrapper
+
+def enable():
+    for owner, name in operations:
+        if (owner, name) not in originals:
+            originals[owner, name] = getattr(owner, name)
+            setattr(owner, name, traced(name, originals[owner, name]))
+
+def disable():
+    for (owner, name), original in originals.items():
+        setattr(owner, name, original)
+    originals.clear()
+
+# Attribute operations inside this block to the named part, enabling tracing
+# for its duration if it was not already on.
+class part:
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.was_enabled = bool(originals)
+        self.previous = getattr(state, "part", None)
+        state.part = self.name
+        enable()
+        return self
+
+    def __exit__(self, *exc):
+        state.part = self.previous
+        if not self.was_enabled:
+            disable()
+
+def collapsed():
+    totals = collections.Counter()
+    for record in records:
+        key = ";".join([record["part"]] + record["stack"] + [record["operation"]])
+        totals[key] += record["seconds"]
+    return ["{} {}".format(key, round(seconds * 1e6)) for key, seconds in sorted(totals.items())]
+
+def summary(limit = 10):
+    lines = []
+    by_part = collections.defaultdict(list)
+    for record in records:
+        by_part[record["part"]].append(record)
+
+    for name, part_records in by_part.items():
+        total = sum(r["seconds"] for r in part_records)
+        lines.append("{}: {:.3f}s in {} operations".format(name, total, len(part_records)))
+        for r in sorted(part_records, key=lambda r: -r["seconds"])[:limit]:
+            share = r["seconds"] / total if total else 0
+            lines.append("  {:8.3f}s {:<20} {:<10} faces {:4d} -> {:4d}  {}:{}".format(
+                r["seconds"], "#" * round(share * 20), r["operation"],
+                r["faces_in"], r["faces_out"], r["module"], r["line"]))
+    return "\n".join(lines)
+
+def main():
+    import adjustable_arm
+    import registry
+    import part_cache
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("parts", nargs="*", help="parts to profile, default all")
+    parser.add_argument("-n", "--limit", type=int, default=10, help="operations listed per part")
+    parser.add_argument("--collapsed", help="write collapsed stacks for flame graphs to this file")
+    args = parser.parse_args()
+
+    part_cache.enabled = False
+    for name in args.parts or registry.generators:
+        adjustable_arm.clear_memo()
+        with part(name):
+            registry.build(name)
+
+    print(summary(args.limit))
+    if args.collapsed:
+        with open(args.collapsed, "w") as output:
+            output.write("\n".join(collapsed()) + "\n")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Catalog of every part generator, read from the generating source files
+without importing them, so listing parts and checking arguments never loads
+CadQuery or builds any geometry:
+
+    python registry.py
+    python registry.py ring_led_clip
+
+Parameters and defaults come from each generator's signature, or from
+default_parameters for parts of the arm. Choices for a named parameter come
+from the table of the same name in plural, profiles for profile, and for
+fastener from the bolt_mount table. A generator's module is only imported when
+the part is built.
+"""
+
+import ast
+import copy
+import functools
+import importlib
+import math
+import os
+import sys
+import time
+
+repository = os.path.dirname(os.path.abspath(__file__))
+
+# Every part generator: name -> (module, function, keyword arguments)
+generators = {
+    "arm": ("adjustable_arm", "arm_part", {"name": "printable_arm"}),
+    "knob": ("adjustable_arm", "arm_part", {"name": "knob"}),
+    "wedge_block_hex_bolt": ("adjustable_arm", "arm_part", {"name": "wedge_block_hex_bolt"}),
+    "wedge_block_no_hex": ("adjustable_arm", "arm_part", {"name": "wedge_block_no_hex"}),
+    "hex_bolt_clip": ("extrusion_clip", "hex_bolt_clip", {}),
+    "indicator_holder": ("indicator_holder", "indicator_holder", {}),
+    "round_platform": ("round_platform", "round_platform", {}),
+    "ring_led_clip": ("ring_led_clip", "ring_led_clip", {}),
+    "bridgeport_spindle_clamp": ("bridgeport_spindle_clamp", "bridgeport_spindle_clamp", {"radius": 47/2}),
+    "camera_adapter": ("m5camera_adapter", "camera_adapter", {}),
+    "indicator_base_adapter": ("indicator_base_adapter", "indicator_base_adapter", {}),
+    }
+
+# What each part is for: part of the arm itself, held by the end ball, or
+# holding the arm's base ball to something
+roles = {
+    "arm": "arm",
+    "knob": "arm",
+    "wedge_block_hex_bolt": "arm",
+    "wedge_block_no_hex": "arm",
+    "hex_bolt_clip": "mount",
+    "indicator_holder": "end effector",
+    "round_platform": "end effector",
+    "ring_led_clip": "end effector",
+    "bridgeport_spindle_clamp": "mount",
+    "camera_adapter": "end effector",
+    "indicator_base_adapter": "mount",
+    }
+
+# Accessories that attach some other way than a bolt head in a bolt_mount pocket
+interfaces = {
+    "indicator_base_adapter": "indicator base fasteners",
+    }
+
+# Every dimension and angle has a positive default. Values may go up to this
+# many times their default, far beyond that the kernel only fails or crashes.
+scale_limit = 10
+
+# Sizes a part's geometry cannot be built at, although each value is in range
+# on its own: module -> [(parameter, test of the part's values, requirement)].
+# Requirements are formatted with the values, for the arm including those
+# derived from its parameters.
+limits = {
+    "adjustable_arm": [
+        ("arm_length", lambda v: v["arm_length"] > v["ball_surround_outer_radius"] + v["mid_joint_radius"],
+            "more than the end ball and mid joint radii, {ball_surround_outer_radius:g} + {mid_joint_radius:g}"),
+        ],
+    "ring_led_clip": [
+        ("radius", lambda v: v["radius"] >= 10, "at least 10, to hold the bolt mount"),
+        ("ring_thickness", lambda v: v["ring_thickness"] >= 4, "at least 4, for its 2mm fillets"),
+        ("clip_angular_length", lambda v: v["clip_angular_length"] < 120, "below 120, to leave room between clips"),
+        ],
+    "bridgeport_spindle_clamp": [
+        ("radius", lambda v: v["radius"] > v["ring_thickness"], "more than ring_thickness, {ring_thickness:g}"),
+        ("ring_height", lambda v: v["ring_height"] > 4, "more than 4, for its 2mm chamfers"),
+        ("ring_thickness", lambda v: v["ring_thickness"] > 4, "more than 4, for its 2mm chamfers"),
+        ("ring_thickness", lambda v: v["ring_thickness"] < 25, "below 25, for the tab to reach past the ring"),
+        ],
+    "round_platform": [
+        ("radius", lambda v: 18 <= v["radius"] <= 100, "from 18 to 100, where its fillets can be made"),
+        ],
+    }
+
+@functools.lru_cache(maxsize=None)
+def module_tree(module):
+    with open(os.path.join(repository, module + ".py")) as source:
+        return ast.parse(source.read())
+
+# Literal value assigned to a module level name
+def constant(module, name):
+    for node in module_tree(module).body:
+        if isinstance(node, ast.Assign) and any(getattr(target, "id", None) == name for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise LookupError("{} is not a constant in {}".format(name, module))
+
+# A default argument: a literal, or a constant of the same module or of a
+# module it imports
+def default_value(module, node):
+    if isinstance(node, ast.Name):
+        return constant(module, node.id)
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        return constant(node.value.id, node.attr)
+    return ast.literal_eval(node)
+
+# Parameters of a module level function with their defaults, and the names
+# of those without one
+def signature(module, function):
+    for node in module_tree(module).body:
+        if isinstance(node, ast.FunctionDef) and node.name == function:
+            names = [arg.arg for arg in node.args.args]
+            defaults = dict(zip(names[len(names) - len(node.args.defaults):], node.args.defaults))
+            return (
+                {name: default_value(module, defaults[name]) for name in names if name in defaults},
+                [name for name in names if name not in defaults])
+    raise LookupError("{} is not a function in {}".format(function, module))
+
+# First paragraph of the module docstring following the license
+def module_description(module):
+    strings = [
+        node.value.value for node in module_tree(module).body
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)]
+    return " ".join(strings[min(1, len(strings) - 1)].strip().split("\n\n")[0].split())
+
+# Everything known about a part without importing its module
+@functools.lru_cache(maxsize=None)
+def describe(name):
+    if name not in generators:
+        raise ValueError("Unknown part: {}".format(name))
+    module, function, kwargs = generators[name]
+    if roles[name] == "arm":
+        parameters, required = constant("adjustable_arm", "default_parameters"), []
+    else:
+        parameters, required = signature(module, function)
+        parameters.update(kwargs)
+        required = [parameter for parameter in required if parameter not in kwargs]
+
+    choices = {}
+    for parameter, default in parameters.items():
+        if parameter == "fastener":
+            choices[parameter] = list(constant("bolt_mount", "fasteners"))
+        elif isinstance(default, str):
+            try:
+                choices[parameter] = list(constant(module, parameter + "s"))
+            except LookupError:
+                pass
+
+    if name in interfaces:
+        interface = interfaces[name]
+    elif "fastener" in choices:
+        interface = "{} bolt head".format(parameters["fastener"])
+    else:
+        interface = "arm set"
+    return {
+        "name": name,
+        "module": module,
+        "function": function,
+        "role": roles[name],
+        "interface": interface,
+        "choices": choices,
+        "parameters": parameters,
+        "required": required,
+        "description": module_description(module),
+        }
+
+# Derived values of the arm compiled from their definitions in adjustable_arm,
+# without importing it: name -> (function, names of the values it takes)
+@functools.lru_cache(maxsize=None)
+def derived_functions():
+    namespace, functions = {"math": math}, {}
+    for node in module_tree("adjustable_arm").body:
+        if isinstance(node, ast.FunctionDef) and any(
+                getattr(decorator, "id", None) == "derived" for decorator in node.decorator_list):
+            definition = copy.copy(node)
+            definition.decorator_list = []
+            exec(compile(ast.Module(body=[definition], type_ignores=[]), "adjustable_arm.py", "exec"), namespace)
+            functions[node.name] = (namespace[node.name], [arg.arg for arg in node.args.args])
+    return functions
+
+# Parameters of the arm with every derived value added
+def derive(values):
+    values = dict(values)
+    def value(name):
+        if name not in values:
+            function, names = derived_functions()[name]
+            values[name] = function(*[value(argument) for argument in names])
+        return values[name]
+    for name in derived_functions():
+        value(name)
+    return values
+
+def catalog():
+    return [describe(name) for name in generators]
+
+# Check arguments for a part against its description, raising ValueError for
+# anything its generator would not accept
+def validate(name, arguments):
+    description = describe(name)
+    parameters = description["parameters"]
+    unknown = set(arguments) - set(parameters) - set(description["required"])
+    if unknown:
+        raise ValueError("Unknown parameters for {}: {}".format(name, ", ".join(sorted(unknown))))
+    missing = set(description["required"]) - set(arguments)
+    if missing:
+        raise ValueError("Missing parameters for {}: {}".format(name, ", ".join(sorted(missing))))
+    for parameter, value in arguments.items():
+        default = parameters.get(parameter, 0)
+        if isinstance(default, (int, float)) and not isinstance(value, (int, float)):
+            raise ValueError("{} of {} must be a number, not {!r}".format(parameter, name, value))
+        if isinstance(default, (int, float)) and default > 0 and not 0 < value <= default * scale_limit:
+            raise ValueError("{} of {} must be above 0 and at most {:g}, not {!r}".format(
+                parameter, name, default * scale_limit, value))
+    for parameter, choices in description["choices"].items():
+        if parameter in arguments and arguments[parameter] not in choices:
+            raise ValueError("Unknown {} for {}: {}".format(parameter, name, arguments[parameter]))
+    values = dict(parameters, **arguments)
+    if description["role"] == "arm":
+        values = derive(values)
+    for parameter, test, requirement in limits.get(description["module"], []):
+        if not test(values):
+            raise ValueError("{} of {} must be {}, not {!r}".format(
+                parameter, name, requirement.format(**values), values[parameter]))
+
+# Argument given as text, a number where it looks like one
+def parse_value(text):
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+# Argument given as text for a parameter of a part: kept as text where the
+# parameter takes a name, like a profile or a fastener, else parse_value()
+def parse_argument(name, parameter, text):
+    default = describe(name)["parameters"].get(parameter)
+    return text if isinstance(default, str) else parse_value(text)
+
+def build(name, **arguments):
+    validate(name, arguments)
+    module, function, kwargs = generators[name]
+    return getattr(importlib.import_module(module), function)(**dict(kwargs, **arguments))
+
+# A part as it sits on the print bed: parts of the arm turned to their print
+# orientation, accessories as they are built
+def build_printed(name, **arguments):
+    part = build(name, **arguments)
+    if roles[name] == "arm":
+        import adjustable_arm
+        module, function, kwargs = generators[name]
+        part = adjustable_arm.print_orientation(kwargs["name"], part, adjustable_arm.arm_values(arguments))
+    return part
+
+def main():
+    start = time.perf_counter()
+    names = sys.argv[1:] or list(generators)
+    for name in names:
+        description = describe(name)
+        print("{:<28} {:<13} {}".format(name, description["role"], description["interface"]))
+        if len(names) == 1:
+            print("  " + description["description"])
+            for parameter in description["required"]:
+                print("  {} (required)".format(parameter))
+            for parameter, default in description["parameters"].items():
+                print("  {} = {!r}".format(parameter, default))
+            for parameter, choices in description["choices"].items():
+                print("  {} choices: {}".format(parameter, ", ".join(choices)))
+    print("Described {} parts in {:.1f}ms".format(len(names), (time.perf_counter() - start) * 1000), file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
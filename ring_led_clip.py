@@ -26,31 +26,63 @@ SOFTWARE.
 Attach a ring LED circuit board of specified diameter to a 1/4"-20 bolt head
 """
 
+import functools
 import math
+import bolt_mount
 import cadquery as cq
+import display
+import fidelity
+import part_cache
+
+# Claws holding the edge of the LED board above and below it, revolved once
+# over their arc and mirrored. The two only touch along the board edge, so
+# they are kept as separate solids.
+@functools.lru_cache(maxsize=None)
+def claws(radius, ring_height, clip_angular_length):
+    claw = (
+        cq.Workplane("YZ")
+        .lineTo(radius, 0, forConstruction = True)
+        .lineTo(radius-ring_height/2, ring_height/2)
+        .lineTo(radius,ring_height/2)
+        .close()
+        .revolve(clip_angular_length, (0,0,0), (0,1,0))
+    )
+    return [claw.val(), claw.mirror("XY").val()]
 
+# Ring with its three pairs of claws, everything that does not depend on the
+# mount. The claws are built once and placed by rotation, then fused with the
+# ring in a single operation.
+@functools.lru_cache(maxsize=None)
+def ring_body(radius, ring_height, ring_thickness, clip_angular_length):
+    ring = (
+        cq.Workplane("YZ")
+        .lineTo(radius, -ring_height/2, forConstruction = True)
+        .lineTo(radius + ring_thickness, -ring_height/2)
+        .lineTo(radius + ring_thickness, ring_height/2)
+        .lineTo(radius, ring_height/2)
+        .close()
+        .revolve(240+clip_angular_length, (0,0,0), (0,1,0))
+        .rotate((0,0,0),(0,0,1), -120 - clip_angular_length/2)
+    )
+    placed = [
+        claw.moved(cq.Location(cq.Vector(), cq.Vector(0, 0, 1), angle - clip_angular_length/2))
+        for angle in (-120, 0, 120)
+        for claw in claws(radius, ring_height, clip_angular_length)]
+    # Separate arguments rather than one compound, the claws of a pair touch
+    return cq.Workplane("XY").newObject([ring.val().fuse(*placed).clean()])
+
+@part_cache.persistent
 def ring_led_clip(
         radius=30,
         ring_height = 4,
         ring_thickness = 8, # Keep this a multiple of nozzle diameter
-        clip_angular_length = 60 # Each clip occupies this number of degrees of arc
+        clip_angular_length = 60, # Each clip occupies this number of degrees of arc
+        fastener = bolt_mount.default_fastener,
         ):
-    bolt_head_diameter = 11
-    bolt_head_thickness = 4.25
-    bolt_shaft_diameter = 6.5
-
     hex_head_side = 18
 
-    hex_head_thickness = bolt_head_thickness+2
-    hex_head = (
-        cq.Workplane("XZ")
-        .rect(hex_head_side, hex_head_side)
-        .circle(bolt_shaft_diameter/2)
-        .extrude(hex_head_thickness)
-        .faces("<Y")
-        .polygon(6, bolt_head_diameter, circumscribed = True)
-        .extrude(-bolt_head_thickness, combine='cut')
-    )
+    hex_head_thickness = bolt_mount.mount_thickness(fastener)
+    hex_head = bolt_mount.hex_head_block(fastener, hex_head_side)
 
     hex_head_connection_x = radius + ring_thickness - math.tan(math.asin((hex_head_side/2)/radius))*(hex_head_side/4)
     hex_head_connection_length = 10 + hex_head_thickness
@@ -64,35 +96,8 @@ def ring_led_clip(
         .extrude(hex_head_side/2, both = True)
     )
 
-    ring = (
-        cq.Workplane("YZ")
-        .lineTo(radius, 0, forConstruction = True)
-        .lineTo(radius + ring_thickness, 0)
-        .lineTo(radius + ring_thickness, ring_height/2)
-        .lineTo(radius, ring_height/2)
-        .close()
-        .revolve(240+clip_angular_length, (0,0,0), (0,1,0))
-    )
-
-    claw = (
-        cq.Workplane("YZ")
-        .lineTo(radius, 0, forConstruction = True)
-        .lineTo(radius-ring_height/2, ring_height/2)
-        .lineTo(radius,ring_height/2)
-        .close()
-        .revolve(clip_angular_length, (0,0,0), (0,1,0))
-    )
-
-    clip_half = (
-        ring.rotate((0,0,0),(0,0,1),   -120 - clip_angular_length/2)
-        + claw.rotate((0,0,0),(0,0,1),      - clip_angular_length/2)
-        + claw.rotate((0,0,0),(0,0,1),  120 - clip_angular_length/2)
-        + claw.rotate((0,0,0),(0,0,1), -120 - clip_angular_length/2)
-    )
-
     clip = (
-        clip_half
-        + clip_half.mirror("XY")
+        ring_body(radius, ring_height, ring_thickness, clip_angular_length)
         + hex_head_connection
         + hex_head.translate((
             0,
@@ -101,10 +106,14 @@ def ring_led_clip(
             hex_head_side/2))
     )
 
-    clip = clip.edges(">Y").edges("|Z").fillet(2)
-    clip = clip.edges(">Z[1]").fillet(5)
-    clip = clip.edges(">Y").edges(">Z").fillet(2)
+    # Cosmetic fillets
+    if not fidelity.preview:
+        clip = clip.edges(">Y").edges("|Z").fillet(2)
+        clip = clip.edges(">Z[1]").fillet(5)
+        clip = clip.edges(">Y").edges(">Z").fillet(2)
     return clip
 
+# If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
 if show_object:
     show_object(ring_led_clip(60), options={"color":"blue", "alpha":0.5})
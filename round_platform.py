@@ -26,10 +26,15 @@ SOFTWARE.
 Attach a simple round platform to a 1/4"-20 hex bolt head
 """
 
-def round_platform(radius=30):
-    bolt_head_diameter = 11
-    bolt_head_thickness = 4.25
-    bolt_shaft_diameter = 6.5
+import bolt_mount
+import cadquery as cq
+import display
+import fidelity
+import part_cache
+
+@part_cache.persistent
+def round_platform(radius=30, fastener=bolt_mount.default_fastener):
+    bolt_head_diameter = bolt_mount.fasteners[fastener]["head_diameter"]
 
     hex_head_side = 18
 
@@ -39,16 +44,8 @@ def round_platform(radius=30):
         .extrude(1.2)
     )
 
-    hex_head_thickness = bolt_head_thickness+2
-    hex_head = (
-        cq.Workplane("XZ")
-        .rect(hex_head_side, hex_head_side)
-        .circle(bolt_shaft_diameter/2)
-        .extrude(hex_head_thickness)
-        .faces("<Y")
-        .polygon(6, bolt_head_diameter, circumscribed=True)
-        .extrude(-bolt_head_thickness, combine='cut')
-    )
+    hex_head_thickness = bolt_mount.mount_thickness(fastener)
+    hex_head = bolt_mount.hex_head_block(fastener, hex_head_side)
 
     reinforcement_rib = (
         cq.Workplane("YZ")
@@ -68,10 +65,13 @@ def round_platform(radius=30):
     )
 
     # Cosmetic edge treatments
-    platform = platform.faces("<Z[1]").edges("%Line").fillet(2)
-    platform = platform.faces("<Z[1]").chamfer(0.6)
+    if not fidelity.preview:
+        platform = platform.faces("<Z[1]").edges("%Line").fillet(2)
+        platform = platform.faces("<Z[1]").chamfer(0.6)
 
     return platform
 
+# If this file is loaded in CQ-Editor, display an object.
+show_object = display.sink_for(globals())
 if show_object:
     show_object(round_platform(), options={"color":"blue", "alpha":0.5})
\ No newline at end of file
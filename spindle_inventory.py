@@ -0,0 +1,170 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Generate spindle clamps for a whole fleet of mills from a machine inventory,
+with a manifest of what to print:
+
+    python spindle_inventory.py machines.csv --output clamps
+
+The inventory is a .csv or .json list of machines. Each has a machine name and
+spindle_diameter, and optionally ring_height, ring_thickness, fastener for the
+indicator bolt head and tab_fastener for the bolt squeezing the ring, for
+example:
+
+    machine,spindle_diameter,ring_height,tab_fastener
+    bridgeport,47,10,
+    tormach,52.4,12,M4
+
+Clamps are built on a pool of worker processes. Machines sharing a ring
+height and fasteners are sent to the same worker together, so the tab, slot
+and bolt head mount are built once per group and reused for every spindle
+diameter. The manifest lists the files written for each machine with the
+print estimates of print_estimate.py.
+"""
+
+import argparse
+import concurrent.futures
+import csv
+import itertools
+import json
+import math
+import os
+import re
+import sys
+import time
+import export_parts
+import print_estimate
+import registry
+
+part_name = "bridgeport_spindle_clamp"
+
+# Clamp arguments that come straight from inventory columns
+passed_columns = ["ring_height", "ring_thickness", "fastener", "tab_fastener"]
+
+manifest_columns = ["machine", "spindle_diameter"] + passed_columns + ["files"] + [
+    column for column in print_estimate.columns if column != "part"]
+
+# List of machine dicts, empty cells left out
+def read_inventory(path):
+    with open(path, newline="") as stream:
+        if path.endswith(".json"):
+            machines = json.load(stream)
+        else:
+            machines = [
+                {key: registry.parse_value(value) for key, value in row.items() if value not in ("", None)}
+                for row in csv.DictReader(stream)]
+    for machine in machines:
+        machine["machine"] = str(machine.get("machine", ""))
+    return machines
+
+# Clamp arguments for a machine, checked against the part signature
+def clamp_arguments(machine):
+    if not isinstance(machine.get("spindle_diameter"), (int, float)):
+        raise ValueError("spindle_diameter must be a number")
+    arguments = {"radius": machine["spindle_diameter"] / 2}
+    arguments.update((column, machine[column]) for column in passed_columns if column in machine)
+    registry.validate(part_name, arguments)
+    return arguments
+
+def clamp_stem(machine):
+    return "spindle_clamp-" + re.sub(r"[^\w.-]+", "_", machine["machine"])
+
+# Machines whose clamps share cached sub-solids
+def shared_parts(machine):
+    defaults = registry.describe(part_name)["parameters"]
+    return tuple(machine.get(column, defaults[column]) for column in ("ring_height", "fastener", "tab_fastener"))
+
+# Split the machines into batches of at most size, never mixing groups so
+# each batch reuses its sub-solids
+def batches(machines, size):
+    ordered = sorted(machines, key=shared_parts)
+    for key, group in itertools.groupby(ordered, key=shared_parts):
+        group = list(group)
+        for start in range(0, len(group), size):
+            yield group[start:start + size]
+
+# Manifest rows for a batch of machines built in one worker
+def build_batch(machines, output, export_formats, settings):
+    rows = []
+    for machine in machines:
+        start = time.perf_counter()
+        part = registry.build(part_name, **clamp_arguments(machine))
+        paths = export_parts.write(part, output, clamp_stem(machine), export_formats)
+        row = {column: machine.get(column, "") for column in ["machine", "spindle_diameter"] + passed_columns}
+        row["files"] = " ".join(paths)
+        row.update(print_estimate.estimate_shape(part.val(), settings))
+        rows.append((row, time.perf_counter() - start))
+    return rows
+
+# Yield (manifest row, seconds) for each machine as its batch finishes
+def build_inventory(machines, output, export_formats = ("stl",), settings = print_estimate.default_settings,
+                    workers = None):
+    workers = workers or os.cpu_count()
+    size = max(1, math.ceil(len(machines) / workers))
+    os.makedirs(output, exist_ok=True)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(build_batch, batch, output, export_formats, settings)
+                   for batch in batches(machines, size)]
+        for future in concurrent.futures.as_completed(futures):
+            yield from future.result()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split("\n\n")[0])
+    parser.add_argument("inventory", help="machine inventory .csv or .json file")
+    parser.add_argument("-o", "--output", default="clamps", help="output directory")
+    parser.add_argument("-m", "--manifest", help="manifest .csv or .json file, default manifest.csv in the output")
+    parser.add_argument("-f", "--format", dest="formats", action="append", choices=export_parts.formats,
+                        help="file format, may be repeated, default stl")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    machines = read_inventory(args.inventory)
+    for machine in machines:
+        try:
+            clamp_arguments(machine)
+        except ValueError as error:
+            parser.error("machine {}: {}".format(machine["machine"], error))
+    stems = [clamp_stem(machine) for machine in machines]
+    duplicates = sorted(stem for stem in set(stems) if stems.count(stem) > 1)
+    if duplicates:
+        parser.error("machine names clash: " + ", ".join(duplicates))
+
+    start = time.perf_counter()
+    rows = []
+    for row, seconds in build_inventory(machines, args.output, args.formats or ["stl"], workers=args.jobs):
+        rows.append(row)
+        print("{:<28} {:7.2f}s {:7.1f}g {:>8}  {}".format(
+            row["machine"], seconds, row["filament_mass"],
+            print_estimate.format_duration(row["print_time"]), row["files"]))
+    names = [machine["machine"] for machine in machines]
+    rows.sort(key=lambda row: names.index(row["machine"]))
+    print("Built {} clamps, {:.1f}g, {} of printing, in {:.2f}s".format(
+        len(rows), sum(row["filament_mass"] for row in rows),
+        print_estimate.format_duration(sum(row["print_time"] for row in rows)),
+        time.perf_counter() - start), file=sys.stderr)
+    print_estimate.write(args.manifest or os.path.join(args.output, "manifest.csv"), rows, manifest_columns)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+MIT License
+
+Copyright (c) 2025 Roger Cheng
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+"""
+Triangle meshes of finished parts as NumPy arrays, at a few levels of detail:
+
+    coarse  previews and web viewers
+    medium  inspection and checks
+    print   STL and 3MF for slicing
+
+Meshes are cached by (shape fingerprint, linear tolerance, angular tolerance)
+in the part cache directory, so exporting the same part again, at any level
+already produced, reads the mesh back instead of tessellating. Keeping recent
+meshes in memory as well is opt-in through memory_limit, since the exporters
+stream one mesh at a time and must not hold on to every mesh they write.
+
+Tolerances are loose on angle and tight on chord deviation. OCCT's default
+angular tolerance of 0.1 radians dominates on large curved surfaces like the
+end ball and puts several times more triangles there than a printer can
+resolve. The linear tolerance is also capped relative to part size, so small
+parts still get enough facets.
+"""
+
+import collections
+import hashlib
+import io
+import os
+import tempfile
+import zipfile
+from xml.sax.saxutils import quoteattr
+import numpy as np
+import cadquery as cq
+import fidelity
+import part_cache
+
+# Level of detail -> (linear tolerance in mm, angular tolerance in radians)
+levels = {
+    "coarse": (0.25, 0.5),
+    "medium": (0.1, 0.4),
+    "print": (0.05, 0.2),
+    }
+
+# Linear tolerance never exceeds this fraction of the part's diagonal
+relative_limit = 0.002
+
+# Recently used meshes kept in memory, none by default. A process checking
+# the same parts over and over can raise it.
+memory_limit = 0
+meshes = collections.OrderedDict()
+
+Mesh = collections.namedtuple("Mesh", ["vertices", "triangles"])
+
+def shape_of(part):
+    shapes = part.vals() if isinstance(part, cq.Workplane) else [part]
+    return shapes[0] if len(shapes) == 1 else cq.Compound.makeCompound(shapes)
+
+# Hash of the BREP serialization, identical for identical geometry no matter
+# which process or code path built it.
+def fingerprint(shape):
+    brep = io.BytesIO()
+    shape.exportBrep(brep)
+    return hashlib.sha256(brep.getvalue()).hexdigest()
+
+def tolerance(shape, level):
+    linear, angular = levels[level]
+    return min(linear, shape.BoundingBox().DiagonalLength * relative_limit), angular
+
+def tessellate(shape, linear, angular):
+    # Tessellate a copy: OCCT keeps an existing finer triangulation on the
+    # shape itself, which would make every later coarse level as fine.
+    vertices, triangles = shape.copy().tessellate(linear, angular)
+    return Mesh(
+        np.array([v.toTuple() for v in vertices], dtype=np.float64).reshape(-1, 3),
+        np.array(triangles, dtype=np.int32).reshape(-1, 3))
+
+def load(key):
+    path = part_cache.entry_path(key, ".npz")
+    try:
+        with np.load(path) as arrays:
+            found = Mesh(arrays["vertices"], arrays["triangles"])
+    except (OSError, ValueError, KeyError):
+        return None
+    os.utime(path)
+    return found
+
+def store(key, found):
+    path = part_cache.entry_path(key, ".npz")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(handle, "wb") as output:
+            np.savez(output, vertices=found.vertices, triangles=found.triangles)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+    part_cache.evict()
+
+def cached_mesh(shape, digest, level):
+    linear, angular = tolerance(shape, level)
+    key = hashlib.sha256(repr((digest, linear, angular)).encode()).hexdigest()
+    if key in meshes:
+        meshes.move_to_end(key)
+        return meshes[key]
+
+    found = load(key) if part_cache.enabled else None
+    if found is None:
+        found = tessellate(shape, linear, angular)
+        if part_cache.enabled:
+            store(key, found)
+
+    if memory_limit:
+        meshes[key] = found
+        while len(meshes) > memory_limit:
+            meshes.popitem(last=False)
+    return found
+
+# Mesh of a part at one level, by default the one matching fidelity.preview
+def mesh(part, level = None):
+    shape = shape_of(part)
+    return cached_mesh(shape, fingerprint(shape), level or fidelity.level())
+
+# Meshes of a part at several levels, fingerprinting it only once
+def levels_of_detail(part, names = tuple(levels)):
+    shape = shape_of(part)
+    digest = fingerprint(shape)
+    return {name: cached_mesh(shape, digest, name) for name in names}
+
+# Merge vertices at the same position, tessellation repeats them on every
+# face, and drop triangles left with a repeated corner.
+def weld(mesh, precision = 1e-6):
+    keys = np.round(mesh.vertices / precision).astype(np.int64)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    triangles = inverse.reshape(-1)[mesh.triangles]
+    degenerate = (
+        (triangles[:, 0] == triangles[:, 1])
+        | (triangles[:, 1] == triangles[:, 2])
+        | (triangles[:, 2] == triangles[:, 0]))
+    return Mesh(mesh.vertices[first], triangles[~degenerate]), int(degenerate.sum())
+
+def write_stl(found, path):
+    corners = found.vertices[found.triangles].astype(np.float32)
+    normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    normals = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0)
+
+    records = np.zeros(len(corners), dtype=[
+        ("normal", "<f4", 3), ("corners", "<f4", 9), ("attributes", "<u2")])
+    records["normal"] = normals
+    records["corners"] = corners.reshape(-1, 9)
+    with open(path, "wb") as output:
+        output.write(b"\0" * 80)
+        output.write(np.uint32(len(records)).tobytes())
+        output.write(records.tobytes())
+
+content_types = """<?xml version="1.0" encoding="UTF-8"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+ <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+ <Default Extension="model" ContentType="application/vnd.ms-package.3dmanufacturing-3dmodel+xml"/>
+</Types>
+"""
+
+relationships = """<?xml version="1.0" encoding="UTF-8"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+ <Relationship Target="/3D/3dmodel.model" Id="rel-1" Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/3dmodel"/>
+</Relationships>
+"""
+
+# Objects in a 3MF must be closed meshes sharing their vertices, so the
+# mesh is welded before writing. Coordinates keep 9 significant digits, so
+# vertices of large parts are not rounded together.
+def write_object(stream, object_id, name, found):
+    found = weld(found)[0]
+    stream.write(' <object id="{}" name={} type="model">\n  <mesh>\n   <vertices>\n'.format(
+        object_id, quoteattr(name)).encode())
+    np.savetxt(stream, found.vertices, fmt='    <vertex x="%.9g" y="%.9g" z="%.9g"/>')
+    stream.write(b"   </vertices>\n   <triangles>\n")
+    np.savetxt(stream, found.triangles, fmt='    <triangle v1="%d" v2="%d" v3="%d"/>')
+    stream.write(b"   </triangles>\n  </mesh>\n </object>\n")
+
+# Write a 3MF package. objects yields (name, mesh) and may be a generator:
+# each mesh is streamed into the zip entry as soon as it is produced, so only
+# one is held at a time. items places copies as (object number from 1, x, y).
+def write_3mf(path, objects, items):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as package:
+        package.writestr("[Content_Types].xml", content_types)
+        package.writestr("_rels/.rels", relationships)
+        with package.open("3D/3dmodel.model", "w") as stream:
+            stream.write(
+                b'<?xml version="1.0" encoding="UTF-8"?>\n'
+                b'<model unit="millimeter" xml:lang="en-US" '
+                b'xmlns="http://schemas.microsoft.com/3dmanufacturing/core/2015/02">\n'
+                b' <resources>\n')
+            for object_id, (name, found) in enumerate(objects, 1):
+                write_object(stream, object_id, name, found)
+            stream.write(b" </resources>\n <build>\n")
+            for object_id, x, y in items:
+                stream.write(' <item objectid="{}" transform="1 0 0 0 1 0 0 0 1 {:.9g} {:.9g} 0"/>\n'.format(
+                    object_id, x, y).encode())
+            stream.write(b" </build>\n</model>\n")
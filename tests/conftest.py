@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Part modules live at the top of the repository. Tests build from scratch
+# rather than reading or filling the shared part cache.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["ADJUSTABLE_ARM_CACHE"] = "0"
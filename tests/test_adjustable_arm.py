@@ -0,0 +1,82 @@
+import cadquery as cq
+import pytest
+import adjustable_arm
+
+def test_part_calls_match_source():
+    for name, function in adjustable_arm.part_functions.items():
+        assert adjustable_arm.part_calls[name] == adjustable_arm.called_parts(function)
+    assert {"end_ball_assembly", "arm"} <= set(adjustable_arm.part_calls["printable_arm"])
+
+def test_graph_forgets_only_dependents():
+    graph = adjustable_arm.arm_graph()
+    assert graph["wedge_block_z"] == adjustable_arm.arm_values()["wedge_block_z"]
+    assert "wedge_block_z" in graph.dependents("wedge_angle")
+    assert "wedge_block_z" not in graph.dependents("arm_length")
+
+def test_arm_values_overrides():
+    assert adjustable_arm.arm_values({"arm_length": 150})["arm_length"] == 150
+
+def test_build_arm_parts():
+    parts = adjustable_arm.build_arm()
+    assert set(parts) == set(adjustable_arm.arm_parts)
+    for name, part in parts.items():
+        assert part.val().isValid(), name
+
+def test_parts_memoized_on_their_arguments():
+    knob = adjustable_arm.call_part(adjustable_arm.knob, adjustable_arm.arm_values())
+    assert adjustable_arm.call_part(adjustable_arm.knob, adjustable_arm.arm_values()) is knob
+    # Arm length does not reach the knob, it only moves it along the arm
+    assert adjustable_arm.call_part(adjustable_arm.knob, adjustable_arm.arm_values({"arm_length": 150})) is knob
+    moved = adjustable_arm.arm_part("knob", arm_length=150).val().BoundingBox()
+    assert moved.ymin == pytest.approx(adjustable_arm.arm_part("knob").val().BoundingBox().ymin - 50)
+
+def test_unknown_parameters_rejected():
+    with pytest.raises(ValueError, match="Unknown arm parameters: arm_lenght"):
+        adjustable_arm.arm_part("arm", arm_lenght=150)
+
+def test_instances_cut_as_one():
+    block = cq.Workplane("XY").box(40, 10, 10)
+    hole = cq.Workplane("XY").cylinder(20, 2)
+    positions = [(x, 0, 0) for x in (-15, -5, 5, 15)]
+    instances = adjustable_arm._instances(hole, positions)
+    assert len(instances.Solids()) == len(positions)
+
+    one_by_one = block
+    for position in positions:
+        one_by_one = one_by_one.cut(hole.translate(position))
+    batched = block.cut(instances)
+    assert batched.val().isValid()
+    assert batched.val().Volume() == pytest.approx(one_by_one.val().Volume())
+
+# Volume of the symmetric difference of two parts, zero for the same solid
+def difference(first, second):
+    return (first - second).val().Volume() + (second - first).val().Volume()
+
+def test_split_halves_match_box_cut():
+    values = adjustable_arm.arm_values()
+    radius = values["ball_surround_outer_radius"]
+    block = adjustable_arm.call_part(adjustable_arm.wedge_block_mid, values)
+    # Box the wedge block used to be sliced with
+    box = (
+        cq.Workplane("XY")
+        .transformed(rotate=cq.Vector(-values["wedge_angle"], 0, 0))
+        .rect(radius * 4, radius * 4)
+        .extrude(radius * 4))
+    lower, upper = adjustable_arm.call_part(adjustable_arm.wedge_block_halves, values)
+    assert difference(upper, block.intersect(box)) == pytest.approx(0, abs=1e-6)
+    assert difference(lower, block - box) == pytest.approx(0, abs=1e-6)
+
+def test_printable_arm_matches_box_cut():
+    values = adjustable_arm.arm_values({"arm_length": 100})
+    combined = (
+        adjustable_arm.call_part(adjustable_arm.end_ball_assembly, values)
+        + adjustable_arm.call_part(adjustable_arm.arm, values))
+    # Box the arm used to be chopped with under its flat bottom
+    chop = (
+        cq.Workplane("XY")
+        .transformed(offset=cq.Vector(0, 0, values["cutoff_z"]))
+        .rect(values["arm_length"] * 3, values["arm_length"] * 3)
+        .extrude(-values["ball_surround_outer_radius"]))
+    printable = adjustable_arm.call_part(adjustable_arm.printable_arm, values)
+    assert printable.val().isValid()
+    assert difference(printable, combined - chop) == pytest.approx(0, abs=1e-6)
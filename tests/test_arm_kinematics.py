@@ -0,0 +1,61 @@
+import math
+import numpy as np
+import pytest
+import arm_kinematics
+
+@pytest.fixture(scope="module")
+def geometry():
+    return arm_kinematics.arm_geometry()
+
+def joints(**angles):
+    return arm_kinematics.Joints(*(np.array([angles.get(name, 0.0)]) for name in arm_kinematics.Joints._fields))
+
+def test_straight_pose(geometry):
+    pose = arm_kinematics.forward(geometry, joints(turn=math.pi), tool=10)
+    length, offset = geometry["arm_length"], geometry["offset"]
+    assert pose["end"][0] == pytest.approx([offset, 0, 2 * length])
+    assert pose["tip"][0] == pytest.approx([offset, 0, 2 * length + 10])
+
+def test_directions_stay_unit_and_square(geometry):
+    pose = arm_kinematics.forward(geometry, arm_kinematics.random_joints(1000, np.random.default_rng(1)))
+    for name in ["first", "second", "normal", "stud"]:
+        assert np.linalg.norm(pose[name], axis=1) == pytest.approx(np.ones(1000))
+    # The mid joint axis is square to both arms, the arms sit offset along it
+    assert np.einsum("ij,ij->i", pose["normal"], pose["first"]) == pytest.approx(np.zeros(1000), abs=1e-9)
+    assert np.einsum("ij,ij->i", pose["normal"], pose["second"]) == pytest.approx(np.zeros(1000), abs=1e-9)
+    assert np.linalg.norm(pose["second_mid"] - pose["first_mid"], axis=1) == pytest.approx(
+        np.full(1000, geometry["offset"]))
+
+def test_segment_distance():
+    row = lambda *point: np.array([point], dtype=float)
+    # Crossing at right angles 3 apart, then parallel and end to end
+    assert arm_kinematics.segment_distance(
+        row(-1, 0, 0), row(1, 0, 0), row(0, -1, 3), row(0, 1, 3)) == pytest.approx([3])
+    assert arm_kinematics.segment_distance(
+        row(0, 0, 0), row(1, 0, 0), row(3, 0, 0), row(5, 0, 0)) == pytest.approx([2])
+    assert arm_kinematics.point_segment_distance(row(5, 4, 0), row(0, 0, 0), row(2, 0, 0)) == pytest.approx([5])
+
+def test_tool_folded_into_the_floor(geometry):
+    # Folded back, the end ball sits beside the base with the tool pointing down
+    folded = joints(turn=0.0)
+    assert not arm_kinematics.collisions(geometry, arm_kinematics.forward(geometry, folded)).any()
+    assert arm_kinematics.collisions(geometry, arm_kinematics.forward(geometry, folded, 50), 50).all()
+    straight = joints(turn=math.pi)
+    assert not arm_kinematics.collisions(geometry, arm_kinematics.forward(geometry, straight, 50), 50).any()
+
+def test_workspace(geometry):
+    length, offset = geometry["arm_length"], geometry["offset"]
+    straight_up = (offset, 0, 2 * length)
+    far_away = (0, 0, 4 * length)
+    found = arm_kinematics.workspace(geometry, samples=20000, targets=[straight_up, far_away])
+
+    assert 0 < found["colliding"] < 1
+    assert found["reach"][1] <= math.hypot(2 * length, offset) + 1e-6
+    assert found["workspace"] > 0
+    (_, state, distance, pose), (_, far_state, far_distance, _) = found["targets"]
+    assert state == "reached"
+    assert distance < 20
+    pose = arm_kinematics.Joints(*(np.atleast_1d(angle) for angle in pose))
+    assert arm_kinematics.forward(geometry, pose)["end"][0] == pytest.approx(straight_up, abs=20)
+    assert far_state == "outside"
+    assert far_distance > length
@@ -0,0 +1,44 @@
+import os
+import adjustable_arm
+import arm_sweep
+import part_cache
+
+def test_variants():
+    found = list(arm_sweep.variants({"arm_length": [150, 200], "ball_diameter": [20, 24]}, {"tie_width": 5}))
+    assert len(found) == 4
+    assert found[1] == {"tie_width": 5, "arm_length": 150, "ball_diameter": 24}
+
+def test_parse_axis():
+    assert arm_sweep.parse_axis("arm_length=100:200:25") == ("arm_length", [100, 125, 150, 175, 200])
+    assert arm_sweep.parse_axis("ball_diameter=20,24") == ("ball_diameter", [20, 24])
+
+def test_dependencies_built_first():
+    depths = arm_sweep.dependency_depths(["printable_arm", "knob"])
+    assert depths["end_ball_assembly"] < depths["printable_arm"]
+    assert depths["knob"] == 0
+
+def test_shared_builds():
+    all_variants = list(arm_sweep.variants({"arm_length": [150, 200, 250]}))
+    stages = arm_sweep.shared_builds(all_variants, arm_sweep.default_parts)
+    names = [[name for name, params in stage] for stage in stages]
+    # Only the arm itself depends on its length. Wedge blocks are built from
+    # another part, so they come in a later stage.
+    assert names == [["end_ball_assembly", "knob"], ["wedge_block_hex_bolt", "wedge_block_no_hex"]]
+
+    all_variants = list(arm_sweep.variants({"ball_diameter": [20, 20, 24]}))
+    stages = arm_sweep.shared_builds(all_variants, ["knob"])
+    assert stages == [[("knob", {"ball_diameter": 20}), ("knob", {"ball_diameter": 24})]]
+    assert arm_sweep.shared_builds(list(arm_sweep.variants({"ball_diameter": [20, 24]})), ["knob"]) == []
+
+def test_sweep_reads_shared_parts_from_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(part_cache, "enabled", True)
+    monkeypatch.setattr(part_cache, "cache_dir", str(tmp_path / "cache"))
+    # Forked workers would find a knob built by an earlier test in memory
+    adjustable_arm.clear_memo()
+    output = str(tmp_path / "sweep")
+    results = list(arm_sweep.sweep({"arm_length": [150, 200]}, output, ["knob"], workers=1))
+
+    assert sorted(params["arm_length"] for params, paths, seconds in results) == [150, 200]
+    assert sorted(os.listdir(output)) == ["knob-arm_length=150.step", "knob-arm_length=200.step"]
+    # One knob fits both arms, built once
+    assert len(part_cache.entries()) == 1
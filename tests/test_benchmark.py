@@ -0,0 +1,32 @@
+import importlib
+import benchmark
+
+def result(wall, faces = 10, edges = 20):
+    return {"wall": wall, "peak_rss_mb": 100, "faces": faces, "edges": edges}
+
+def test_cases_cover_every_stage():
+    names = dict(benchmark.cases())
+    assert benchmark.case_name("knob", {"arm_length": 200}) in names
+    assert benchmark.case_name("bridgeport_spindle_clamp", {"radius": 47/2}) == "bridgeport_spindle_clamp[radius=23.5]"
+    assert len(names) == (len(benchmark.arm_lengths) * len(benchmark.arm_stages)
+                          + sum(len(grid) for module, grid in benchmark.accessories.values()))
+
+def test_regressions():
+    baseline = {"cases": {"a": result(1.0), "b": result(0.01), "c": result(1.0)}}
+    current = {"cases": {
+        "a": result(1.6),
+        "b": result(0.05),
+        "c": result(1.0, faces=11),
+        "new": result(9.0),
+        }}
+    found = benchmark.regressions(current, baseline, threshold=1.5, slack=0.05)
+    assert len(found) == 2
+    assert found[0].startswith("a: 1.600s was 1.000s")
+    assert found[1] == "c: 11 faces 20 edges was 10 faces 20 edges"
+
+def test_run_case():
+    # Part modules are imported before workers fork
+    importlib.import_module("round_platform")
+    measured = benchmark.run_case("round_platform", "round_platform", {"radius": 30})
+    assert measured["wall"] > 0
+    assert measured["faces"] > 0 and measured["edges"] > measured["faces"]
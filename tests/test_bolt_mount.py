@@ -0,0 +1,28 @@
+import math
+import pytest
+import bolt_mount
+
+@pytest.mark.parametrize("fastener", list(bolt_mount.fasteners))
+def test_pocket_fits_fastener(fastener):
+    spec = bolt_mount.fasteners[fastener]
+    block = bolt_mount.hex_head_block(fastener).val()
+    assert block.isValid()
+
+    bounds = block.BoundingBox()
+    assert (bounds.xlen, bounds.ylen, bounds.zlen) == pytest.approx(
+        (18, bolt_mount.mount_thickness(fastener), 18))
+    # Pocket across the hex flats, shaft hole only through the back
+    pocket = 2 * math.sqrt(3) * (spec["head_diameter"] / 2) ** 2 * spec["head_thickness"]
+    hole = math.pi * (spec["shaft_diameter"] / 2) ** 2 * bolt_mount.back_thickness
+    assert block.Volume() == pytest.approx(18 * 18 * bolt_mount.mount_thickness(fastener) - pocket - hole)
+
+def test_block_built_once():
+    assert bolt_mount.hex_head_block("M6", 20) is bolt_mount.hex_head_block("M6", 20)
+    assert bolt_mount.hex_head_block("M6", 20) is not bolt_mount.hex_head_block("M6", 20, 5)
+
+def test_top_fillet():
+    plain = bolt_mount.hex_head_block().val()
+    rounded = bolt_mount.hex_head_block(top_fillet=5).val()
+    assert rounded.isValid()
+    assert len(rounded.Faces()) == len(plain.Faces()) + 2
+    assert rounded.Volume() < plain.Volume()
@@ -0,0 +1,47 @@
+import threading
+import urllib.error
+import urllib.request
+import pytest
+import build_server
+
+@pytest.fixture(scope="module")
+def server():
+    server = build_server.HttpBuildServer(("127.0.0.1", 0), build_server.Handler)
+    for future in server.start_workers(1):
+        future.result()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def get(server, path):
+    url = "http://127.0.0.1:{}{}".format(server.server_address[1], path)
+    try:
+        with urllib.request.urlopen(url, timeout=120) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, error.read()
+
+def test_build(server):
+    status, body = get(server, "/hex_bolt_clip.stl?profile=2020")
+    assert status == 200 and len(body) > 84
+
+def test_unknown_part(server):
+    assert get(server, "/nothing.stl")[0] == 404
+
+def test_invalid_arguments(server):
+    assert get(server, "/ring_led_clip.stl?radius=-5")[0] == 400
+    assert get(server, "/arm.stl?arm_length=1e6")[0] == 400
+    assert get(server, "/ring_led_clip.stl?colour=red")[0] == 400
+    assert get(server, "/arm.stl?arm_length=20")[0] == 400
+    assert get(server, "/ring_led_clip.stl?radius=1")[0] == 400
+
+def test_workers_replaced(server, monkeypatch):
+    monkeypatch.setattr(build_server, "worker_tasks", 2)
+    pool = server.new_pool()
+    try:
+        pids = [pool.submit(build_server.warm_up).result() for _ in range(5)]
+    finally:
+        pool.shutdown()
+    assert len(set(pids)) > 1
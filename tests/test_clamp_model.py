@@ -0,0 +1,44 @@
+import io
+import numpy as np
+import pytest
+import adjustable_arm
+import clamp_model
+
+def test_design_grid_matches_the_arm():
+    values = clamp_model.design_grid({"wedge_angle": [20, 30], "arm_length": [100, 200, 300]})
+    assert values["wedge_angle"].tolist() == [20, 20, 20, 30, 30, 30]
+    assert values["arm_length"].tolist() == [100, 200, 300] * 2
+    arm = adjustable_arm.arm_values({"wedge_angle": 30, "arm_length": 200})
+    for name in clamp_model.derived_names:
+        assert values[name][4] == pytest.approx(arm[name])
+
+def test_design_grid_rejects_unknown_parameters():
+    with pytest.raises(ValueError):
+        clamp_model.design_grid({"wedge_angel": [20]})
+
+def test_frictionless_wedge():
+    values = clamp_model.design_grid({"wedge_angle": [15, 30, 45]})
+    found = clamp_model.clamp(values, friction=0)
+    assert found["rod_force"] == pytest.approx(found["bolt_force"] * np.tan(np.radians([15, 30, 45])))
+    assert found["ball_torque"] == pytest.approx(np.zeros(3))
+
+def test_self_locking_wedge_pushes_nothing():
+    values = clamp_model.design_grid({"wedge_angle": [10, 30]})
+    # Past atan(0.3), about 16.7 degrees, friction holds the wedge
+    rod_force = clamp_model.clamp(values)["rod_force"]
+    assert rod_force[0] == 0
+    assert rod_force[1] > 0
+
+def test_deflection_grows_with_length_cubed():
+    designs, results = clamp_model.evaluate({"arm_length": [100, 200]})
+    assert results["deflection"][1] == pytest.approx(8 * results["deflection"][0])
+    assert results["slip_load"][1] == pytest.approx(results["slip_load"][0] / 2)
+
+def test_write_csv():
+    designs, results = clamp_model.evaluate({"wedge_angle": [20, 30]})
+    stream = io.StringIO()
+    clamp_model.write_csv(stream, designs, results)
+    rows = stream.getvalue().splitlines()
+    assert rows[0] == ",".join(["wedge_angle"] + list(results))
+    assert len(rows) == 3
+    assert rows[2].startswith("30.0,")
@@ -0,0 +1,34 @@
+import cadquery as cq
+import pytest
+import clearance_check
+
+@pytest.fixture(scope="module")
+def parts():
+    return clearance_check.assembled_parts()
+
+def failing_pairs(parts):
+    return {
+        (first, second)
+        for first, second, kind, distance, location, overlap in clearance_check.check_parts(parts)
+        if location is None or not clearance_check.acceptable(kind, distance, overlap)}
+
+def test_default_arm_passes(parts):
+    assert failing_pairs(parts) == set()
+
+def test_contact_pulled_apart_fails(parts):
+    moved = dict(parts, knob = parts["knob"].moved(cq.Location(cq.Vector(0, 0, 5))))
+    assert ("knob", "wedge_block") in failing_pairs(moved)
+
+def test_acceptable():
+    assert clearance_check.acceptable("contact", 0, 0)
+    assert not clearance_check.acceptable("contact", 5, 0)
+    assert not clearance_check.acceptable("contact", 0, 10)
+    assert clearance_check.acceptable("gap", 0.2, 0)
+    assert not clearance_check.acceptable("gap", 0, 0)
+
+def test_one_row_per_mating_pair(parts):
+    without_rod = {name: part for name, part in parts.items() if name != "rod"}
+    rows = clearance_check.check_parts(without_rod)
+    assert [(first, second, kind) for first, second, kind, distance, location, overlap in rows] == clearance_check.mating_pairs
+    missing = [row for row in rows if "rod" in row[:2]]
+    assert missing and all(row[4] is None for row in missing)
@@ -0,0 +1,42 @@
+import pytest
+import dependency_graph
+
+def graph(calls):
+    def area(width, height):
+        calls.append("area")
+        return width * height
+    def volume(area, depth):
+        calls.append("volume")
+        return area * depth
+    found = dependency_graph.DependencyGraph()
+    found.input("width", 2)
+    found.input("height", 3)
+    found.input("depth", 4)
+    found.node("area", area)
+    found.node("volume", volume)
+    return found
+
+def test_values_computed_once():
+    calls = []
+    values = graph(calls)
+    assert values["volume"] == 24
+    assert values["volume"] == 24
+    assert calls == ["area", "volume"]
+
+def test_set_recomputes_downstream_only():
+    calls = []
+    values = graph(calls)
+    values["volume"]
+    values.set(depth=5)
+    assert values.stale() == {"volume"}
+    assert values["volume"] == 30
+    assert calls == ["area", "volume", "volume"]
+    values.set(depth=5)
+    assert values.stale() == set()
+
+def test_dependents_and_dependencies():
+    values = graph([])
+    assert values.dependents("width") == {"area", "volume"}
+    assert values.dependencies("volume") == {"area", "width", "height", "depth"}
+    with pytest.raises(KeyError):
+        values.set(area=1)
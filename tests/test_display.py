@@ -0,0 +1,37 @@
+import os
+import runpy
+import pytest
+import display
+import registry
+
+shown = []
+
+def show(part, options = None):
+    shown.append((part, options))
+
+@pytest.fixture
+def sink(monkeypatch):
+    monkeypatch.setattr(display, "sink", None)
+    monkeypatch.delenv("ADJUSTABLE_ARM_DISPLAY", raising=False)
+    shown.clear()
+
+def test_imported_displays_nothing(sink):
+    display.set_sink(show)
+    assert display.sink_for({"__name__": "ring_led_clip"}) is None
+
+def test_editor_show_object_used(sink):
+    display.set_sink(print)
+    assert display.sink_for({"__name__": "__main__", "show_object": show}) is show
+
+def test_sink_for_main(sink, monkeypatch):
+    assert display.sink_for({"__name__": "__main__"}) is None
+    monkeypatch.setenv("ADJUSTABLE_ARM_DISPLAY", __name__ + ".show")
+    assert display.sink_for({"__name__": "__main__"}) is show
+    display.set_sink(print)
+    assert display.sink_for({"__name__": "__main__"}) is print
+
+def test_part_file_run_directly(sink):
+    display.set_sink(show)
+    runpy.run_path(os.path.join(registry.repository, "round_platform.py"), run_name="__main__")
+    assert len(shown) == 1
+    assert shown[0][0].val().isValid()
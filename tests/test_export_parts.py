@@ -0,0 +1,38 @@
+import os
+import numpy as np
+import pytest
+import export_parts
+import registry
+
+def test_variant_stem():
+    assert export_parts.variant_stem("clip") == "clip"
+    assert export_parts.variant_stem("clip", {"radius": 20, "fastener": "1/4-20"}) == "clip-fastener=1_4-20-radius=20"
+
+def test_parse_argument():
+    assert registry.parse_argument("hex_bolt_clip", "profile", "2020") == "2020"
+    assert registry.parse_argument("ring_led_clip", "radius", "25") == 25
+    assert registry.parse_argument("ring_led_clip", "radius", "25.5") == 25.5
+
+def test_export_variant(tmp_path):
+    name, paths, seconds = export_parts.export("hex_bolt_clip", str(tmp_path), ["stl"], {"profile": "2020"})
+    assert paths == [os.path.join(str(tmp_path), "hex_bolt_clip-profile=2020.stl")]
+    assert os.path.getsize(paths[0]) > 84
+
+# Corners of every triangle in a binary STL
+def read_stl(path):
+    with open(path, "rb") as stream:
+        stream.seek(80)
+        count = int(np.frombuffer(stream.read(4), dtype="<u4")[0])
+        records = np.frombuffer(stream.read(count * 50), dtype=np.dtype(
+            [("normal", "<f4", 3), ("corners", "<f4", (3, 3)), ("attribute", "<u2")]))
+    return records["corners"]
+
+def test_export_all_formats(tmp_path):
+    jobs = [("knob", None), ("arm", None)]
+    results = {name: paths for name, paths, seconds in export_parts.export_all(jobs, str(tmp_path), workers=2)}
+    assert sorted(results) == ["arm", "knob"]
+    for name, paths in results.items():
+        assert [os.path.splitext(path)[1] for path in paths] == [".stl", ".step", ".3mf"]
+        assert all(os.path.getsize(path) > 0 for path in paths)
+    # The arm is written in its print orientation, sitting on the bed
+    assert read_stl(results["arm"][0])[:, :, 2].min() == pytest.approx(0, abs=1e-3)
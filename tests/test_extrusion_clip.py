@@ -0,0 +1,37 @@
+import os
+import pytest
+import clip_catalog
+import extrusion_clip
+
+@pytest.mark.parametrize("profile", list(extrusion_clip.profiles))
+def test_clip_fits_profile(profile):
+    size = extrusion_clip.profiles[profile]["size"]
+    clip = extrusion_clip.extrusion_clip(profile).val()
+    assert clip.isValid()
+    assert len(clip.Solids()) == 1
+    # The clip wraps the beam on the side opposite its channel
+    bounds = clip.BoundingBox()
+    assert bounds.xmax == pytest.approx(size / 2 + extrusion_clip.extra_gap + extrusion_clip.perimeter_thickness)
+    assert bounds.zlen == pytest.approx(extrusion_clip.clip_length)
+    face = extrusion_clip.clip_profile(profile).val()
+    assert clip.Volume() == pytest.approx(face.Area() * extrusion_clip.clip_length)
+
+@pytest.mark.parametrize("profile", ["2020", "4040"])
+def test_hex_bolt_clip(profile):
+    assert extrusion_clip.hex_bolt_clip(profile=profile).val().isValid()
+
+def test_unknown_profile():
+    with pytest.raises(ValueError, match="Unknown extrusion profile: 2525"):
+        extrusion_clip.extrusion_clip("2525")
+
+def test_catalog_variants():
+    found = clip_catalog.variants(["2020", "3030"], ["M5"])
+    assert found == [{"profile": "2020", "fastener": "M5"}, {"profile": "3030", "fastener": "M5"}]
+    assert len(clip_catalog.variants()) == len(extrusion_clip.profiles) * len(clip_catalog.fasteners)
+    assert clip_catalog.clip_stem({"profile": "2020", "fastener": "1/4-20"}) == "hex_bolt_clip-2020-1_4-20"
+
+def test_catalog_writes_clips(tmp_path):
+    output = str(tmp_path)
+    results = list(clip_catalog.catalog(output, ["2020"], ["M5"], workers=1))
+    assert [params for params, paths, seconds in results] == [{"profile": "2020", "fastener": "M5"}]
+    assert os.listdir(output) == ["hex_bolt_clip-2020-M5.stl"]
@@ -0,0 +1,32 @@
+import pytest
+import adjustable_arm
+import fidelity
+import registry
+
+@pytest.fixture
+def preview(monkeypatch):
+    monkeypatch.setattr(fidelity, "preview", False)
+    return fidelity.set_preview
+
+@pytest.mark.parametrize("name", ["knob", "round_platform", "ring_led_clip", "bridgeport_spindle_clamp"])
+def test_preview_skips_cosmetic_details(preview, name):
+    full = registry.build(name).val()
+    preview(True)
+    quick = registry.build(name).val()
+    assert quick.isValid()
+    assert len(quick.Faces()) < len(full.Faces())
+
+def test_arm_parts_cached_per_fidelity(preview):
+    knob = lambda: adjustable_arm.call_part(adjustable_arm.knob, adjustable_arm.arm_values())
+    assert adjustable_arm.arm_values()["preview"] is False
+    full = knob()
+    preview(True)
+    assert adjustable_arm.arm_values()["preview"] is True
+    assert knob() is not full
+    preview(False)
+    assert knob() is full
+
+def test_mesh_level(preview):
+    assert fidelity.level() == "print"
+    preview(True)
+    assert fidelity.level() == "coarse"
@@ -0,0 +1,37 @@
+import pytest
+import lego_beam
+import m5camera_adapter
+
+def test_hole_positions():
+    assert lego_beam.hole_positions(3) == [(0, 0), (8, 0), (16, 0)]
+    assert lego_beam.hole_positions(3, "L", 2) == [(0, 0), (8, 0), (16, 0), (0, 8)]
+    assert lego_beam.hole_positions(3, "T", 3) == [(0, 0), (8, 0), (16, 0), (8, -8), (8, -16)]
+
+@pytest.mark.parametrize("arguments, message", [
+    ((3, "Z", 2), "Unknown layout: Z"),
+    ((0,), "at least one hole"),
+    ((3, "L", 1), "an arm of two"),
+    ((4, "T", 3), "odd number of holes"),
+    ])
+def test_bad_layouts(arguments, message):
+    with pytest.raises(ValueError, match=message):
+        lego_beam.hole_positions(*arguments)
+
+@pytest.mark.parametrize("holes, layout, arm", [(1, "straight", 0), (15, "straight", 0), (5, "L", 3), (5, "T", 2)])
+def test_every_hole_cut(holes, layout, arm):
+    beam = lego_beam.technic_beam(holes, layout, arm).val()
+    assert beam.isValid()
+    outline = lego_beam.beam_outline(holes, layout, arm).val().Area()
+    count = len(lego_beam.hole_positions(holes, layout, arm))
+    assert beam.Volume() == pytest.approx(
+        outline * lego_beam.beam_thickness - count * lego_beam.pin_hole().Volume())
+
+def test_pin_hole_built_once():
+    assert lego_beam.pin_hole() is lego_beam.pin_hole()
+    assert lego_beam.pin_hole(4) is not lego_beam.pin_hole()
+
+def test_camera_adapter_pin_holes():
+    bar = m5camera_adapter.lego_bar().val()
+    solid = m5camera_adapter.lego_bar_height * m5camera_adapter.adapter_length * lego_beam.beam_thickness
+    assert bar.Volume() == pytest.approx(solid - 2 * lego_beam.pin_hole().Volume())
+    assert m5camera_adapter.camera_adapter().val().isValid()
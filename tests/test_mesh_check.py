@@ -0,0 +1,49 @@
+import cadquery as cq
+import numpy as np
+import mesh_check
+import tessellation
+
+# Welded mesh of a workplane, the way check() sees it
+def mesh(workplane):
+    return tessellation.weld(tessellation.mesh(workplane))[0]
+
+# Two meshes as one, without joining them anywhere
+def combined(first, second):
+    return tessellation.Mesh(
+        np.vstack([first.vertices, second.vertices]),
+        np.vstack([first.triangles, second.triangles + len(first.vertices)]))
+
+def test_closed_box_passes():
+    report = mesh_check.check(mesh(cq.Workplane("XY").box(10, 10, 10)))
+    assert report["watertight"]
+    assert report["self_intersections"] == 0
+    assert abs(report["volume"] - 1000) < 1e-6
+    assert mesh_check.passed(report)
+
+def test_edge_defects():
+    box = mesh(cq.Workplane("XY").box(10, 10, 10))
+    assert mesh_check.edge_defects(box.triangles) == (0, 0, 0)
+    assert mesh_check.edge_defects(box.triangles[1:])[0] == 3
+    flipped = box.triangles.copy()
+    flipped[0] = flipped[0, ::-1]
+    assert mesh_check.edge_defects(flipped)[2] == 3
+
+def test_crossing_boxes_intersect():
+    first = mesh(cq.Workplane("XY").box(10, 10, 10))
+    second = mesh(cq.Workplane("XY").box(10, 10, 10).translate((3, 4, 2)))
+    pairs, depths = mesh_check.self_intersections(combined(first, second))
+    assert len(pairs) > 0
+    assert (depths > 0).all()
+    assert len(mesh_check.self_intersections(first)[0]) == 0
+
+def test_thin_wall_measured():
+    plate = mesh(cq.Workplane("XY").box(20, 20, 0.3))
+    thickness, areas = mesh_check.wall_thickness(plate)
+    flat = mesh_check.unit_normals(plate.vertices[plate.triangles])[:, 2] != 0
+    assert np.allclose(thickness[flat], 0.3)
+    assert np.isclose(mesh_check.check(plate)["thin_area"], 2 * 20 * 20)
+
+def test_inside():
+    box = mesh(cq.Workplane("XY").box(10, 10, 10))
+    points = np.array([[0, 0, 0], [4.9, -4.9, 4.9], [5.1, 0, 0], [0, 0, -20]])
+    assert list(mesh_check.inside(box, points)) == [True, True, False, False]
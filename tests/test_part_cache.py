@@ -0,0 +1,77 @@
+import os
+import cadquery as cq
+import pytest
+import fidelity
+import part_cache
+
+calls = []
+
+@part_cache.persistent
+def block(size, height = 1):
+    calls.append((size, height))
+    return cq.Workplane("XY").box(size, size, height)
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(part_cache, "enabled", True)
+    monkeypatch.setattr(part_cache, "cache_dir", str(tmp_path))
+    calls.clear()
+    return tmp_path
+
+def test_read_back_instead_of_rebuilt(cache):
+    first = block(2)
+    second = block(2)
+    assert calls == [(2, 1)]
+    assert second.val().Volume() == pytest.approx(first.val().Volume())
+    assert len(part_cache.entries()) == 1
+
+def test_key_binds_arguments(cache):
+    block(2)
+    block(size=2, height=1)
+    block(2, 1)
+    assert calls == [(2, 1)]
+    block(3)
+    block(2, height=2)
+    assert calls == [(2, 1), (3, 1), (2, 2)]
+
+def test_key_follows_preview(cache, monkeypatch):
+    block(2)
+    monkeypatch.setattr(fidelity, "preview", not fidelity.preview)
+    block(2)
+    assert len(calls) == 2
+
+# Paths of the entries in the store
+def paths():
+    return {path for _, _, path in part_cache.entries()}
+
+def test_least_recently_used_evicted(cache, monkeypatch):
+    block(1)
+    first = paths()
+    os.utime(*first, (1000, 1000))
+    block(2)
+    second = paths() - first
+    os.utime(*second, (2000, 2000))
+    # Reading the older entry back makes it the most recently used
+    block(1)
+    assert calls == [(1, 1), (2, 1)]
+
+    monkeypatch.setattr(part_cache, "size_limit", sum(size for _, size, _ in part_cache.entries()) - 1)
+    part_cache.evict()
+    assert paths() == first
+
+def test_disabled_builds_every_time(cache, monkeypatch):
+    monkeypatch.setattr(part_cache, "enabled", False)
+    block(2)
+    block(2)
+    assert len(calls) == 2
+    assert part_cache.entries() == []
+
+def test_source_digest_follows_edits(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "shared_part.py").write_text("size = 1\n")
+    (tmp_path / "generated_part.py").write_text("import shared_part\ndef part():\n    return shared_part.size\n")
+    import generated_part
+    before = part_cache.source_digest(generated_part.part)
+    assert part_cache.source_digest(generated_part.part) == before
+    (tmp_path / "shared_part.py").write_text("size = 2\n")
+    assert part_cache.source_digest(generated_part.part) != before
@@ -0,0 +1,39 @@
+import xml.etree.ElementTree as ElementTree
+import zipfile
+import cadquery as cq
+import pytest
+import plate_export
+
+def test_layout_rows():
+    offsets, extent = plate_export.layout([(100, 20), (100, 30), (100, 10)], width=250, gap=5)
+    assert offsets == [(0, 0), (105, 0), (0, 35)]
+    assert extent == (205, 45)
+
+def test_bed_ready():
+    part = plate_export.bed_ready(cq.Workplane("XY").box(10, 40, 5).translate((7, 8, 9)))
+    bounds = part.val().BoundingBox()
+    assert (bounds.xmin, bounds.ymin, bounds.zmin) == pytest.approx((0, 0, 0))
+    assert (bounds.xlen, bounds.ylen) == pytest.approx((40, 10))
+
+def test_write_plate(tmp_path):
+    path = str(tmp_path / "plate.3mf")
+    parts = [("long", cq.Workplane("XY").box(120, 10, 5), 3), ("small", cq.Workplane("XY").box(10, 10, 5), 2)]
+    assert plate_export.write_plate(path, parts, width=250) == pytest.approx((245, 25))
+
+    with zipfile.ZipFile(path) as package:
+        model = ElementTree.fromstring(package.read("3D/3dmodel.model"))
+    namespace = {"m": "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"}
+    assert [element.get("name") for element in model.iterfind("m:resources/m:object", namespace)] == ["long", "small"]
+    items = [element.get("objectid") for element in model.iterfind("m:build/m:item", namespace)]
+    assert items == ["1", "1", "1", "2", "2"]
+
+def test_part_larger_than_bed(tmp_path):
+    path = tmp_path / "plate.3mf"
+    with pytest.raises(ValueError, match="huge is 300 x 10 mm"):
+        plate_export.write_plate(str(path), [("huge", cq.Workplane("XY").box(300, 10, 5), 1)])
+    assert not path.exists()
+
+def test_plate_parts():
+    parts = plate_export.plate_parts(accessories=["round_platform"], sets=2)
+    assert [(name, copies) for name, part, copies in parts] == [
+        ("printable_arm", 4), ("knob", 2), ("wedge_block_hex_bolt", 2), ("wedge_block_no_hex", 2), ("round_platform", 2)]
@@ -0,0 +1,42 @@
+import csv
+import json
+import cadquery as cq
+import pytest
+import print_estimate
+
+def test_estimate_box():
+    box = cq.Workplane("XY").box(20, 20, 10, centered=(True, True, False)).val()
+    found = print_estimate.estimate_shape(box)
+    assert (found["volume"], found["area"], found["height"]) == pytest.approx((4000, 1600, 10))
+    assert (found["center_x"], found["center_y"], found["center_z"]) == pytest.approx((0, 0, 5))
+    # Two 0.45mm perimeters over the surface, 15% of the rest
+    assert found["extruded"] == pytest.approx(1440 + 2560 * 0.15)
+    assert found["layers"] == 50
+    assert found["print_time"] == pytest.approx(1824 / 10 + 50 * 2)
+    assert found["filament_mass"] == pytest.approx(1824 * 1.24 / 1000)
+
+def test_thin_part_is_all_shell():
+    plate = cq.Workplane("XY").box(50, 50, 0.5).val()
+    found = print_estimate.estimate_shape(plate)
+    assert found["extruded"] == pytest.approx(found["volume"])
+
+def test_format_duration():
+    assert print_estimate.format_duration(3725.4) == "01:02:05"
+    assert print_estimate.format_duration(59.6) == "00:01:00"
+    assert print_estimate.format_duration(90000) == "25:00:00"
+
+def test_estimate_registered_part():
+    row = print_estimate.estimate("knob", print_estimate.default_settings)
+    assert row["part"] == "knob"
+    assert set(row) == set(print_estimate.columns)
+    assert 0 < row["extruded"] < row["volume"]
+
+@pytest.mark.parametrize("suffix", [".csv", ".json"])
+def test_write(tmp_path, suffix):
+    path = str(tmp_path / ("estimates" + suffix))
+    rows = [dict({name: 1 for name in print_estimate.columns}, part="knob")]
+    print_estimate.write(path, rows)
+    with open(path) as stream:
+        read = json.load(stream) if suffix == ".json" else list(csv.DictReader(stream))
+    assert [row["part"] for row in read] == ["knob"]
+    assert list(read[0]) == print_estimate.columns
@@ -0,0 +1,47 @@
+import cadquery as cq
+import pytest
+import profiling
+
+@pytest.fixture
+def records():
+    profiling.records.clear()
+    yield profiling.records
+    profiling.records.clear()
+
+block = cq.Workplane("XY").box(10, 10, 10)
+hole = cq.Workplane("XY").box(5, 5, 20)
+
+def cut_block():
+    return block - hole
+
+def test_operations_recorded(records):
+    original = cq.Workplane.cut
+    with profiling.part("block"):
+        cut_block()
+    assert cq.Workplane.cut is original
+
+    # __sub__ calls cut, only the outer operation is recorded
+    assert [record["operation"] for record in records] == ["sub"]
+    record = records[0]
+    assert record["part"] == "block"
+    assert (record["faces_in"], record["faces_out"]) == (12, 10)
+    assert (record["module"], record["stack"][-1]) == ("test_profiling", "test_profiling.cut_block")
+
+def test_shape_methods_recorded(records):
+    box = cq.Workplane("XY").box(10, 10, 10).val()
+    with profiling.part("split"):
+        box.split(cq.Face.makePlane(20, 20))
+    assert [record["operation"] for record in records] == ["split"]
+
+def test_collapsed_and_summary(records):
+    with profiling.part("block"):
+        cut_block()
+        cut_block()
+    (line,) = profiling.collapsed()
+    assert line.startswith("block;test_profiling.test_collapsed_and_summary;test_profiling.cut_block;sub ")
+    assert profiling.summary().startswith("block: ")
+    assert "in 2 operations" in profiling.summary()
+
+def test_nothing_recorded_when_disabled(records):
+    cut_block()
+    assert records == []
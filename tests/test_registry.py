@@ -0,0 +1,91 @@
+import importlib
+import inspect
+import subprocess
+import sys
+import pytest
+import registry
+
+# Every (part, parameter, choice) the registry offers, with the other
+# arguments left at their defaults
+offered = [
+    (name, parameter, choice)
+    for name in registry.generators
+    for parameter, choices in registry.describe(name)["choices"].items()
+    for choice in choices]
+
+def test_fastener_choices_offered():
+    parameters = {(name, parameter) for name, parameter, choice in offered}
+    assert ("camera_adapter", "fastener") in parameters
+    assert ("bridgeport_spindle_clamp", "tab_fastener") in parameters
+
+@pytest.mark.parametrize("name, parameter, choice", offered)
+def test_every_choice_builds(name, parameter, choice):
+    arguments = {parameter: choice}
+    registry.validate(name, arguments)
+    assert registry.build(name, **arguments).val().isValid()
+
+def test_tab_fasteners_are_not_bolt_heads():
+    choices = registry.describe("bridgeport_spindle_clamp")["choices"]
+    assert set(choices["tab_fastener"]).isdisjoint(choices["fastener"])
+
+def test_derived_values_match_the_arm():
+    import adjustable_arm
+    derived = registry.derive(registry.describe("arm")["parameters"])
+    values = adjustable_arm.arm_values()
+    assert {name: derived[name] for name in adjustable_arm.derived_values} == {
+        name: values[name] for name in adjustable_arm.derived_values}
+
+@pytest.mark.parametrize("name, arguments, parameter", [
+    ("arm", {"arm_length": 20}, "arm_length"),
+    ("knob", {"arm_length": 20}, "arm_length"),
+    ("ring_led_clip", {"radius": 1}, "radius"),
+    ("ring_led_clip", {"clip_angular_length": 120}, "clip_angular_length"),
+    ("bridgeport_spindle_clamp", {"radius": 1}, "radius"),
+    ("bridgeport_spindle_clamp", {"ring_height": 4}, "ring_height"),
+    ("round_platform", {"radius": 200}, "radius"),
+    ])
+def test_unbuildable_sizes_rejected(name, arguments, parameter):
+    with pytest.raises(ValueError, match="^{} of {} must be".format(parameter, name)):
+        registry.validate(name, arguments)
+
+@pytest.mark.parametrize("name, arguments", [
+    ("arm", {"arm_length": 32}),
+    ("ring_led_clip", {"radius": 10, "clip_angular_length": 119}),
+    ("bridgeport_spindle_clamp", {"radius": 8.5, "ring_height": 4.5}),
+    ])
+def test_smallest_sizes_build(name, arguments):
+    registry.validate(name, arguments)
+    assert registry.build(name, **arguments).val().isValid()
+
+def test_describe_without_cadquery():
+    # A fresh interpreter, since this one has CadQuery loaded already
+    script = "import sys, registry; registry.catalog(); registry.validate('knob', {'arm_length': 150}); print(sorted(name for name in sys.modules if name.split('.')[0] in ('cadquery', 'OCP', 'numpy')))"
+    output = subprocess.run([sys.executable, "-c", script], cwd=registry.repository,
+                            capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
+
+@pytest.mark.parametrize("name", [name for name in registry.generators if registry.roles[name] != "arm"])
+def test_defaults_match_the_generator(name):
+    module, function, kwargs = registry.generators[name]
+    parameters = inspect.signature(getattr(importlib.import_module(module), function)).parameters
+    expected = {parameter: value.default for parameter, value in parameters.items()}
+    assert registry.describe(name)["parameters"] == dict(expected, **kwargs)
+
+@pytest.mark.parametrize("name, arguments, message", [
+    ("knob", {"arm_lenght": 150}, "Unknown parameters for knob: arm_lenght"),
+    ("round_platform", {"fastener": "M99"}, "Unknown fastener for round_platform: M99"),
+    ("ring_led_clip", {"radius": "large"}, "radius of ring_led_clip must be a number"),
+    ("knob", {"arm_length": 1e6}, "arm_length of knob must be above 0 and at most"),
+    ])
+def test_bad_arguments_rejected(name, arguments, message):
+    with pytest.raises(ValueError, match=message):
+        registry.validate(name, arguments)
+
+def test_unknown_part():
+    with pytest.raises(ValueError, match="Unknown part: no_such_part"):
+        registry.describe("no_such_part")
+
+def test_parse_argument():
+    assert registry.parse_argument("ring_led_clip", "radius", "40") == 40
+    assert registry.parse_argument("ring_led_clip", "radius", "40.5") == 40.5
+    assert registry.parse_argument("hex_bolt_clip", "profile", "2020") == "2020"
@@ -0,0 +1,36 @@
+import math
+import os
+import pytest
+import export_parts
+import ring_led_clip
+
+def test_claws_built_once():
+    first = ring_led_clip.claws(30, 4, 60)
+    assert ring_led_clip.claws(30, 4, 60) is first
+    assert ring_led_clip.ring_body(30, 4, 8, 60) is ring_led_clip.ring_body(30, 4, 8, 60)
+    upper, lower = first
+    assert upper.Volume() == pytest.approx(lower.Volume())
+    assert upper.BoundingBox().zmin == pytest.approx(0, abs=1e-6)
+    assert lower.BoundingBox().zmax == pytest.approx(0, abs=1e-6)
+
+@pytest.mark.parametrize("radius", [20, 45])
+def test_ring_body_holds_three_claw_pairs(radius):
+    body = ring_led_clip.ring_body(radius, 4, 8, 60).val()
+    assert body.isValid()
+    # The ring spans all but the gaps between the claws, the claws only touch it
+    ring = (radius + 8)**2 - radius**2
+    ring_volume = math.pi * ring * 4 * (240 + 60) / 360
+    claw_volume = sum(claw.Volume() for claw in ring_led_clip.claws(radius, 4, 60))
+    assert body.Volume() == pytest.approx(ring_volume + 3 * claw_volume, rel=1e-4)
+
+def test_fastener_reuses_ring_body():
+    ring_led_clip.ring_body.cache_clear()
+    ring_led_clip.ring_led_clip()
+    ring_led_clip.ring_led_clip(fastener="M6")
+    assert ring_led_clip.ring_body.cache_info().misses == 1
+
+def test_radius_catalog(tmp_path):
+    jobs = [("ring_led_clip", {"radius": radius}) for radius in [20, 25]]
+    results = sorted(export_parts.export_all(jobs, str(tmp_path), ["stl"], workers=1))
+    assert [os.path.basename(paths[0]) for name, paths, seconds in results] == [
+        "ring_led_clip-radius=20.stl", "ring_led_clip-radius=25.stl"]
@@ -0,0 +1,49 @@
+import json
+import os
+import pytest
+import bridgeport_spindle_clamp
+import print_estimate
+import spindle_inventory
+
+def test_read_inventory(tmp_path):
+    path = tmp_path / "machines.csv"
+    path.write_text("machine,spindle_diameter,ring_height,tab_fastener\nbridgeport,47,10,\n2,52.4,12,M4\n")
+    machines = spindle_inventory.read_inventory(str(path))
+    assert machines == [
+        {"machine": "bridgeport", "spindle_diameter": 47, "ring_height": 10},
+        {"machine": "2", "spindle_diameter": 52.4, "ring_height": 12, "tab_fastener": "M4"}]
+
+    path = tmp_path / "machines.json"
+    path.write_text(json.dumps([{"machine": 3, "spindle_diameter": 47}]))
+    assert spindle_inventory.read_inventory(str(path)) == [{"machine": "3", "spindle_diameter": 47}]
+
+def test_clamp_arguments():
+    assert spindle_inventory.clamp_arguments({"machine": "a", "spindle_diameter": 47, "ring_height": 10}) == {
+        "radius": 23.5, "ring_height": 10}
+    with pytest.raises(ValueError, match="spindle_diameter must be a number"):
+        spindle_inventory.clamp_arguments({"machine": "a"})
+    with pytest.raises(ValueError, match="Unknown tab_fastener"):
+        spindle_inventory.clamp_arguments({"machine": "a", "spindle_diameter": 47, "tab_fastener": "M99"})
+
+def test_clamp_stem():
+    assert spindle_inventory.clamp_stem({"machine": "Bridgeport J/2 head"}) == "spindle_clamp-Bridgeport_J_2_head"
+
+def test_batches_keep_shared_parts_together():
+    machines = [{"machine": str(i), "spindle_diameter": 40 + i, "ring_height": 10 + i % 2} for i in range(5)]
+    found = list(spindle_inventory.batches(machines, 2))
+    assert [[machine["machine"] for machine in batch] for batch in found] == [["0", "2"], ["4"], ["1", "3"]]
+
+def test_build_inventory(tmp_path):
+    machines = [{"machine": "small", "spindle_diameter": 40}, {"machine": "large", "spindle_diameter": 60}]
+    rows = [row for row, seconds in spindle_inventory.build_inventory(machines, str(tmp_path), workers=1)]
+    assert sorted(row["machine"] for row in rows) == ["large", "small"]
+    assert sorted(os.listdir(str(tmp_path))) == ["spindle_clamp-large.stl", "spindle_clamp-small.stl"]
+    by_machine = {row["machine"]: row for row in rows}
+    assert set(by_machine["small"]) == set(spindle_inventory.manifest_columns)
+    assert by_machine["small"]["volume"] < by_machine["large"]["volume"]
+
+def test_batch_reuses_the_tab(tmp_path):
+    bridgeport_spindle_clamp.tab_and_slot.cache_clear()
+    machines = [{"machine": str(diameter), "spindle_diameter": diameter} for diameter in [40, 47, 52.4]]
+    spindle_inventory.build_batch(machines, str(tmp_path), ["stl"], print_estimate.default_settings)
+    assert bridgeport_spindle_clamp.tab_and_slot.cache_info().misses == 1
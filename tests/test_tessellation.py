@@ -0,0 +1,94 @@
+import collections
+import xml.etree.ElementTree as ElementTree
+import zipfile
+import numpy as np
+import pytest
+import cadquery as cq
+import mesh_check
+import registry
+import tessellation
+
+namespace = {"m": "http://schemas.microsoft.com/3dmanufacturing/core/2015/02"}
+
+# Meshes of each object in a 3MF file by name, as written
+def read_3mf(path):
+    with zipfile.ZipFile(path) as package:
+        model = ElementTree.fromstring(package.read("3D/3dmodel.model"))
+    objects = {}
+    for element in model.iterfind("m:resources/m:object", namespace):
+        vertices = np.array([
+            [float(vertex.get(axis)) for axis in "xyz"]
+            for vertex in element.iterfind("m:mesh/m:vertices/m:vertex", namespace)])
+        triangles = np.array([
+            [int(triangle.get(corner)) for corner in ("v1", "v2", "v3")]
+            for triangle in element.iterfind("m:mesh/m:triangles/m:triangle", namespace)])
+        objects[element.get("name")] = tessellation.Mesh(vertices, triangles)
+    return objects
+
+def test_3mf_objects_are_closed(tmp_path):
+    names = ["knob", "hex_bolt_clip", "ring_led_clip"]
+    path = str(tmp_path / "parts.3mf")
+    tessellation.write_3mf(
+        path,
+        ((name, tessellation.mesh(registry.build_printed(name))) for name in names),
+        [(object_id, 0, 0) for object_id in range(1, len(names) + 1)])
+
+    objects = read_3mf(path)
+    assert sorted(objects) == sorted(names)
+    for name, found in objects.items():
+        # Shared vertices only, none repeated at the same position
+        assert len(np.unique(found.vertices, axis=0)) == len(found.vertices), name
+        assert mesh_check.edge_defects(found.triangles) == (0, 0, 0), name
+
+def test_3mf_keeps_names_and_large_coordinates(tmp_path):
+    # A thin box far from the origin: at 6 significant digits its near and
+    # far faces would be written at the same position
+    name = 'Arm <200mm> & "knob"'
+    box = tessellation.mesh(cq.Workplane("XY").box(0.01, 10, 10).translate((1234.5, 0, 0)))
+    path = str(tmp_path / "box.3mf")
+    tessellation.write_3mf(path, [(name, box)], [(1, 250.125, 0)])
+
+    found = read_3mf(path)[name]
+    assert np.allclose(sorted(set(found.vertices[:, 0])), [1234.495, 1234.505])
+    assert mesh_check.edge_defects(found.triangles) == (0, 0, 0)
+
+def sphere(radius = 20):
+    return cq.Workplane("XY").sphere(radius)
+
+def test_levels_of_detail():
+    found = tessellation.levels_of_detail(sphere())
+    counts = [len(found[name].triangles) for name in ("coarse", "medium", "print")]
+    assert counts == sorted(counts) and counts[0] < counts[-1]
+
+def test_tolerance_follows_part_size():
+    assert tessellation.tolerance(sphere(100).val(), "coarse") == (0.25, 0.5)
+    linear, angular = tessellation.tolerance(sphere(1).val(), "coarse")
+    assert linear == pytest.approx(np.sqrt(12) * tessellation.relative_limit)
+
+def test_meshes_read_back(tmp_path, monkeypatch):
+    import part_cache
+    monkeypatch.setattr(part_cache, "enabled", True)
+    monkeypatch.setattr(part_cache, "cache_dir", str(tmp_path))
+    first = tessellation.mesh(sphere(), "medium")
+
+    # Rebuilt geometry has the same fingerprint and is not tessellated again
+    def tessellate(shape, linear, angular):
+        raise AssertionError("tessellated again")
+    monkeypatch.setattr(tessellation, "tessellate", tessellate)
+    again = tessellation.mesh(sphere(), "medium")
+    assert np.array_equal(again.vertices, first.vertices)
+    assert np.array_equal(again.triangles, first.triangles)
+    with pytest.raises(AssertionError):
+        tessellation.mesh(sphere(), "print")
+
+def test_memory_limit(monkeypatch):
+    monkeypatch.setattr(tessellation, "memory_limit", 2)
+    monkeypatch.setattr(tessellation, "meshes", collections.OrderedDict())
+    for radius in (10, 11, 12):
+        tessellation.mesh(sphere(radius), "coarse")
+    assert len(tessellation.meshes) == 2
+
+def test_weld():
+    box = tessellation.mesh(cq.Workplane("XY").box(1, 1, 1), "coarse")
+    welded, degenerate = tessellation.weld(box)
+    assert (len(welded.vertices), len(welded.triangles), degenerate) == (8, 12, 0)